@@ -0,0 +1,119 @@
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.settings import api_settings
+
+from .models import ClaimsUser, User
+
+# 액세스 토큰에 담는 사용자 상태 클레임 (accounts.serializers.UserClaimsTokenSerializer)
+USER_CLAIMS = ("is_active", "is_staff")
+
+# 프로필 캐시에 보관하는 최대 사용자 수 (넘으면 만료된 항목을 정리)
+MAX_PROFILES = 10000
+
+PROFILE_FIELDS = [field.attname for field in User._meta.concrete_fields]
+
+
+def revoked_key(user_id):
+    return f"auth_revoked:{user_id}"
+
+
+# 전체 프로필(사용자 행)을 AUTH_PROFILE_CACHE_TIMEOUT초 동안 보관하는 프로세스 안 캐시
+class ProfileCache:
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._profiles = {}
+
+    def get(self, user_id):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._profiles.get(user_id)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+
+        profile = User.objects.filter(pk=user_id).values(*PROFILE_FIELDS).first()
+        if profile is not None:
+            with self._lock:
+                if len(self._profiles) >= MAX_PROFILES:
+                    self._profiles = {
+                        key: entry
+                        for key, entry in self._profiles.items()
+                        if entry[0] > now
+                    }
+                expires_at = now + settings.AUTH_PROFILE_CACHE_TIMEOUT
+                self._profiles[user_id] = (expires_at, profile)
+        return profile
+
+    def invalidate(self, user_id):
+        with self._lock:
+            self._profiles.pop(user_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._profiles = {}
+
+
+profiles = ProfileCache()
+
+
+# 탈퇴(비활성화)한 사용자의 발급된 액세스 토큰을 만료될 때까지 거절
+# 프로세스 안 프로필은 바로 지우고, 다른 프로세스에는 공유 캐시로 알림
+def revoke_user_tokens(user_id):
+    profiles.invalidate(user_id)
+    lifetime = api_settings.ACCESS_TOKEN_LIFETIME.total_seconds()
+    cache.set(revoked_key(user_id), True, int(lifetime) + 1)
+
+
+def has_user_claims(validated_token):
+    return all(
+        claim in validated_token for claim in (api_settings.USER_ID_CLAIM, *USER_CLAIMS)
+    )
+
+
+def claims_user(validated_token):
+    claims = {
+        "id": User._meta.pk.to_python(validated_token[api_settings.USER_ID_CLAIM]),
+        **{claim: validated_token[claim] for claim in USER_CLAIMS},
+    }
+    # from_db는 값을 모델 필드 순서로 받음
+    names = [
+        field.attname for field in User._meta.concrete_fields if field.attname in claims
+    ]
+    return ClaimsUser.from_db(DEFAULT_DB_ALIAS, names, [claims[name] for name in names])
+
+
+def check_active(user, revoked):
+    if not user.is_active or revoked:
+        raise AuthenticationFailed("비활성화된 사용자입니다.", code="user_inactive")
+    return user
+
+
+# 사용자 행을 조회하지 않고 서명된 토큰 클레임으로 사용자를 만드는 JWT 인증
+# 클레임이 없는 (이전에 발급된) 토큰은 기존처럼 DB에서 조회
+# 관리자 권한 변경은 다시 로그인해야 토큰에 반영됨
+class ClaimsJWTAuthentication(JWTAuthentication):
+
+    def get_user(self, validated_token):
+        if not has_user_claims(validated_token):
+            return super().get_user(validated_token)
+        user = claims_user(validated_token)
+        return check_active(user, cache.get(revoked_key(user.pk)))
+
+    async def aget_user(self, validated_token):
+        if not has_user_claims(validated_token):
+            try:
+                return await User.objects.aget(
+                    pk=validated_token[api_settings.USER_ID_CLAIM], is_active=True
+                )
+            except (KeyError, User.DoesNotExist):
+                raise AuthenticationFailed(
+                    "사용자를 찾을 수 없습니다.", code="user_not_found"
+                )
+        user = claims_user(validated_token)
+        return check_active(user, await cache.aget(revoked_key(user.pk)))
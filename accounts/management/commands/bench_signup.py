@@ -0,0 +1,128 @@
+import logging
+import statistics
+import time
+import uuid
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from accounts.models import Allergy, ChronicDisease, Medication, User
+
+# 기존 사용자를 한 번에 생성 (비밀번호 해시는 모두 같은 값 사용)
+SEED_SQL = """
+INSERT INTO "accounts_user"
+    ("id", "password", "is_superuser", "first_name", "last_name", "is_staff",
+     "is_active", "date_joined", "email", "nickname", "health_goals")
+SELECT
+    gen_random_uuid(),
+    %(password)s,
+    false, '', '', false, true,
+    %(now)s,
+    %(prefix)s || g || '@example.com',
+    %(prefix)s || g,
+    ''
+FROM generate_series(%(start)s, %(stop)s) AS g
+"""
+
+
+class Command(BaseCommand):
+    help = (
+        "사용자 테이블에 사용자를 대량으로 생성한 뒤 "
+        "회원가입 API의 응답 지연 시간(p50/p99)과 처리량을 측정합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--users", type=int, default=1_000_000, help="미리 생성할 사용자 수"
+        )
+        parser.add_argument(
+            "--samples", type=int, default=200, help="회원가입 측정 횟수"
+        )
+
+    # 비밀번호 해시 비용을 제외하고 DB 처리 시간만 비교하도록 빠른 해셔 사용
+    @override_settings(
+        PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"]
+    )
+    def handle(self, *args, **options):
+        prefix = f"bench-{uuid.uuid4().hex[:8]}-"
+        health_info = [
+            model.objects.create(name=f"{prefix}{model.__name__}")
+            for model in (ChronicDisease, Allergy, Medication)
+        ]
+        try:
+            started = time.perf_counter()
+            self.seed(prefix, options["users"])
+            self.stdout.write(f"사용자 생성: {time.perf_counter() - started:.1f}초")
+
+            latencies = self.measure(prefix, health_info, options["samples"])
+            p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+            self.stdout.write(
+                f"회원가입 p50 {statistics.median(latencies):7.2f}ms, "
+                f"p99 {p99:7.2f}ms, "
+                f"{len(latencies) / (sum(latencies) / 1000):7.1f}건/초"
+            )
+
+            # 대소문자만 다른 기존 닉네임으로 가입 (인덱스 위반으로 거절)
+            # 400 응답마다 남는 요청 로그는 측정 동안 숨김
+            logging.getLogger("django.request").setLevel(logging.ERROR)
+            duplicates = self.measure(
+                prefix, health_info, options["samples"], nickname=f"{prefix.upper()}1"
+            )
+            self.stdout.write(
+                f"중복 닉네임 거절 p50 {statistics.median(duplicates):7.2f}ms"
+            )
+        finally:
+            User.objects.filter(email__startswith=f"{prefix}signup-").delete()
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f'DELETE FROM "{User._meta.db_table}" WHERE "email" LIKE %s',
+                    [f"{prefix}%"],
+                )
+            for info in health_info:
+                info.delete()
+
+    def seed(self, prefix, total, batch_size=100_000):
+        password, now = make_password(uuid.uuid4().hex), timezone.now()
+        with connection.cursor() as cursor:
+            for start in range(1, total + 1, batch_size):
+                cursor.execute(
+                    SEED_SQL,
+                    {
+                        "password": password,
+                        "now": now,
+                        "prefix": prefix,
+                        "start": start,
+                        "stop": min(start + batch_size - 1, total),
+                    },
+                )
+            cursor.execute(f'ANALYZE "{User._meta.db_table}"')
+
+    def measure(self, prefix, health_info, samples, nickname=None):
+        client = APIClient()
+        url = reverse("rest_register")
+        disease, allergy, medication = health_info
+        expected = 400 if nickname else 201
+        latencies = []
+        for i in range(samples):
+            key = uuid.uuid4().hex[:12]
+            data = {
+                "email": f"{prefix}signup-{key}@example.com",
+                "password1": "1q2w3e4r!@#",
+                "password2": "1q2w3e4r!@#",
+                "nickname": nickname or f"signup-{key}",
+                "health_goals": "체중 감량",
+                "chronic_diseases": [str(disease.pk)],
+                "allergies": [str(allergy.pk)],
+                "medications": [str(medication.pk)],
+            }
+            started = time.perf_counter()
+            response = client.post(url, data, format="json")
+            latencies.append((time.perf_counter() - started) * 1000)
+            assert response.status_code == expected, response.content
+            client.cookies.clear()
+        return sorted(latencies)
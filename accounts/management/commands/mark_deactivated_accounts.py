@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from accounts.purge import mark_deactivated_accounts
+
+
+class Command(BaseCommand):
+    help = (
+        "탈퇴 시각 기록 이전에 스스로 탈퇴한 것이 확인된 계정에 탈퇴 시각을 채워 "
+        "purge_deactivated_accounts 삭제 대상에 포함합니다. "
+        "관리자가 비활성화한 계정은 지정하지 마세요."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("emails", nargs="*", help="탈퇴한 사용자의 이메일")
+        parser.add_argument(
+            "--file",
+            help="탈퇴한 사용자의 이메일 목록 파일 (한 줄에 하나)",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="변경하지 않고 대상 계정만 출력",
+        )
+
+    def handle(self, *args, **options):
+        emails = list(options["emails"])
+        if options["file"]:
+            with open(options["file"], encoding="utf-8") as f:
+                emails += [line.strip() for line in f if line.strip()]
+        if not emails:
+            raise CommandError("대상 이메일을 지정해야 합니다.")
+
+        marked = mark_deactivated_accounts(emails, dry_run=options["dry_run"])
+        for email in marked:
+            self.stdout.write(f"  {email}")
+
+        action = "대상 계정" if options["dry_run"] else "탈퇴 시각 기록"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{action}: {len(marked)}명 (요청 {len(set(emails))}명, "
+                "비활성/일반 계정이 아니거나 이미 기록된 계정은 제외)"
+            )
+        )
@@ -0,0 +1,65 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from accounts.purge import DeactivatedAccountPurger
+
+
+class Command(BaseCommand):
+    help = (
+        "탈퇴 후 유예 기간이 지난 사용자의 대화/섭취 기록/토큰을 "
+        "짧은 트랜잭션으로 나누어 삭제합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            help="탈퇴 이후 경과 일수 (기본값: settings.ACCOUNT_PURGE_GRACE_DAYS)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="트랜잭션 하나에서 삭제할 행 수",
+        )
+        parser.add_argument(
+            "--pause",
+            type=float,
+            default=0.0,
+            help="배치 사이에 쉬는 시간(초)",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            help="이번 실행에서 처리할 최대 사용자 수",
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write(self.style.SUCCESS("탈퇴 사용자 삭제 작업을 시작합니다."))
+
+        purger = DeactivatedAccountPurger(
+            grace_days=options["days"],
+            batch_size=options["batch_size"],
+            pause=options["pause"],
+        )
+        started = time.perf_counter()
+        users, totals = purger.run(limit=options["limit"], progress=self.progress)
+        elapsed = time.perf_counter() - started
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"삭제 완료. 사용자: {users}명, {self.format_counts(totals)} "
+                f"({elapsed:.2f}초)"
+            )
+        )
+
+    def progress(self, user_id, counts):
+        self.stdout.write(f"  {user_id}: {self.format_counts(counts)}")
+
+    def format_counts(self, counts):
+        return ", ".join(
+            f"{label}: {deleted}개"
+            for label, deleted in counts.items()
+            if label != "users"
+        )
@@ -0,0 +1,39 @@
+# Generated by Django 5.2 on 2026-10-19 16:45
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # 운영 중인 사용자 테이블을 잠그지 않도록 인덱스를 CONCURRENTLY로 생성
+    # (대소문자만 다른 기존 중복 닉네임이 있으면 인덱스 생성이 실패하므로 먼저 정리해야 함)
+    atomic = False
+
+    dependencies = [
+        ('accounts', '0001_initial'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        # 새 유니크 인덱스를 만든 뒤 기존 유니크 제약을 제거하여 중복 방지가 끊기지 않게 함
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(
+                    'CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS "user_nickname_lower_unique" '
+                    'ON "accounts_user" ((LOWER("nickname")))',
+                    reverse_sql='DROP INDEX CONCURRENTLY IF EXISTS "user_nickname_lower_unique"',
+                ),
+            ],
+            state_operations=[
+                migrations.AddConstraint(
+                    model_name='user',
+                    constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('nickname'), name='user_nickname_lower_unique', violation_error_message='이미 사용 중인 닉네임입니다.'),
+                ),
+            ],
+        ),
+        migrations.AlterField(
+            model_name='user',
+            name='nickname',
+            field=models.CharField(max_length=30, verbose_name='닉네임'),
+        ),
+    ]
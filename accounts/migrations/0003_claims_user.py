@@ -0,0 +1,28 @@
+# Generated by Django 5.2 on 2026-10-19 17:08
+
+import accounts.models
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0002_nickname_lower_unique'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ClaimsUser',
+            fields=[
+            ],
+            options={
+                'proxy': True,
+                'indexes': [],
+                'constraints': [],
+            },
+            bases=('accounts.user',),
+            managers=[
+                ('objects', accounts.models.UserManager()),
+            ],
+        ),
+    ]
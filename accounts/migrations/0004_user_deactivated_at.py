@@ -0,0 +1,26 @@
+# Generated by Django 5.2 on 2026-10-19 17:21
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # 운영 중인 사용자 테이블을 잠그지 않도록 인덱스를 CONCURRENTLY로 생성
+    atomic = False
+
+    dependencies = [
+        ('accounts', '0003_claims_user'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='deactivated_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='탈퇴 시각'),
+        ),
+        AddIndexConcurrently(
+            model_name='user',
+            index=models.Index(condition=models.Q(('deactivated_at__isnull', False)), fields=['deactivated_at'], name='user_deactivated_at_idx'),
+        ),
+    ]
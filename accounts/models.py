@@ -1,8 +1,12 @@
 from django.contrib.auth.base_user import BaseUserManager
 from django.contrib.auth.models import AbstractUser
 from django.db import models
+from django.db.models.functions import Lower
 import uuid
 
+# 대소문자를 구분하지 않는 닉네임 중복 방지 (회원가입 시 중복 확인은 이 제약에 맡김)
+NICKNAME_CONSTRAINT = "user_nickname_lower_unique"
+
 
 class UserManager(BaseUserManager):
     use_in_migrations = True
@@ -66,7 +70,7 @@ class User(AbstractUser):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     username = None
     email = models.EmailField("이메일", unique=True)
-    nickname = models.CharField("닉네임", max_length=30, unique=True)
+    nickname = models.CharField("닉네임", max_length=30)
     birth_date = models.DateField("생년월일", null=True, blank=True)
     gender = models.CharField(
         "성별",
@@ -76,6 +80,9 @@ class User(AbstractUser):
         blank=True,
     )
     health_goals = models.CharField("건강 목표", max_length=255, blank=True)
+    # 회원 탈퇴 시각 (유예 기간 이후 purge_deactivated_accounts로 삭제)
+    # 관리자 화면에서 비활성화한 계정은 비어 있으므로 삭제 대상이 아님
+    deactivated_at = models.DateTimeField("탈퇴 시각", null=True, blank=True)
     chronic_diseases = models.ManyToManyField(
         ChronicDisease, blank=True, verbose_name="지병"
     )
@@ -89,6 +96,52 @@ class User(AbstractUser):
     class Meta:
         verbose_name = "사용자"
         verbose_name_plural = "사용자 목록"
+        constraints = [
+            models.UniqueConstraint(
+                Lower("nickname"),
+                name=NICKNAME_CONSTRAINT,
+                violation_error_message="이미 사용 중인 닉네임입니다.",
+            ),
+        ]
+        indexes = [
+            # 삭제 대상 조회용 (탈퇴한 사용자만 색인)
+            models.Index(
+                fields=["deactivated_at"],
+                name="user_deactivated_at_idx",
+                condition=models.Q(deactivated_at__isnull=False),
+            ),
+        ]
 
     def __str__(self):
         return self.email
+
+    # 다시 활성화된 사용자는 탈퇴 시각을 지워 삭제 대상에서 제외
+    def save(self, *args, **kwargs):
+        if self.is_active and self.deactivated_at is not None:
+            self.deactivated_at = None
+            update_fields = kwargs.get("update_fields")
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "deactivated_at"}
+        super().save(*args, **kwargs)
+
+
+# 액세스 토큰 클레임(id, is_active, is_staff)만으로 만든 사용자 (DB 조회 없이 생성)
+# 나머지 필드는 처음 접근할 때 프로필 캐시에서 한 번에 채움
+# (accounts.authentication.ClaimsJWTAuthentication)
+class ClaimsUser(User):
+
+    class Meta:
+        proxy = True
+
+    def refresh_from_db(self, using=None, fields=None, from_queryset=None):
+        deferred = self.get_deferred_fields()
+        if fields is None or not deferred or not set(fields) <= deferred:
+            return super().refresh_from_db(using, fields, from_queryset)
+
+        from .authentication import profiles
+
+        profile = profiles.get(self.pk)
+        if profile is None:
+            raise User.DoesNotExist("사용자를 찾을 수 없습니다.")
+        for attname in deferred:
+            self.__dict__[attname] = profile[attname]
@@ -0,0 +1,122 @@
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+
+from chats.models import ChatRoom, Message, MessageArchive
+from data_managements.models import (
+    DailyIntakeRollup,
+    IntakeAlert,
+    IntakeLog,
+    UserSupplementIntake,
+)
+
+from .models import User
+
+
+# 유예 기간이 지난 탈퇴 사용자의 데이터를 삭제하는 작업
+# 테이블마다 batch_size개씩 짧은 트랜잭션으로 삭제하여 채팅 테이블 잠금이 길게 유지되지 않음
+# (사용자 행을 한 번에 CASCADE 삭제하면 메시지가 많은 사용자는 하나의 긴 트랜잭션이 됨)
+class DeactivatedAccountPurger:
+
+    def __init__(self, grace_days=None, batch_size=1000, pause=0.0):
+        if grace_days is None:
+            grace_days = settings.ACCOUNT_PURGE_GRACE_DAYS
+        self.cutoff = timezone.now() - timedelta(days=grace_days)
+        self.batch_size = batch_size
+        self.pause = pause
+
+    def _users(self):
+        return User.objects.filter(is_active=False, deactivated_at__lt=self.cutoff)
+
+    # 삭제 대상 사용자 id (탈퇴가 오래된 순서)
+    def candidates(self):
+        return self._users().order_by("deactivated_at").values_list("id", flat=True)
+
+    def is_purgeable(self, user_id):
+        return self._users().filter(id=user_id).exists()
+
+    # 전체 삭제 대상을 처리하고 (사용자 수, 테이블별 삭제 행 수)를 반환
+    # progress(user_id, counts)는 사용자 한 명을 처리할 때마다 호출
+    def run(self, limit=None, progress=None):
+        user_ids = list(self.candidates()[:limit] if limit else self.candidates())
+        users, totals = 0, {}
+        for user_id in user_ids:
+            counts = self.purge_user(user_id)
+            if counts is None:
+                continue
+            users += 1
+            for label, deleted in counts.items():
+                totals[label] = totals.get(label, 0) + deleted
+            if progress is not None:
+                progress(user_id, counts)
+        return users, totals
+
+    # 자식 테이블부터 삭제하고 마지막에 사용자 행을 삭제 (중간에 다시 활성화되면 중단)
+    def purge_user(self, user_id):
+        rooms = ChatRoom.objects.filter(user_id=user_id)
+        steps = [
+            ("messages", Message.objects.filter(chat_room__in=rooms)),
+            ("archives", MessageArchive.objects.filter(chat_room__in=rooms)),
+            ("rooms", rooms),
+            ("intake_logs", IntakeLog.objects.filter(user_id=user_id)),
+            ("rollups", DailyIntakeRollup.objects.filter(user_id=user_id)),
+            ("alerts", IntakeAlert.objects.filter(user_id=user_id)),
+            ("intakes", UserSupplementIntake.objects.filter(user_id=user_id)),
+            # 사용자 삭제 시 SET_NULL로 남으므로 직접 삭제 (블랙리스트는 CASCADE)
+            ("tokens", OutstandingToken.objects.filter(user_id=user_id)),
+        ]
+
+        counts = {}
+        for label, queryset in steps:
+            deleted = self._delete_in_batches(user_id, queryset)
+            if deleted is None:
+                return None
+            counts[label] = deleted
+
+        # 남은 행(이메일 주소, 건강 정보 연결 등)은 적으므로 사용자와 함께 CASCADE 삭제
+        with transaction.atomic():
+            deleted, _ = self._users().filter(id=user_id).delete()
+        if not deleted:
+            return None
+        counts["users"] = 1
+        return counts
+
+    # batch_size개씩 나누어 삭제하고 삭제한 행 수를 반환 (사용자가 다시 활성화되면 None)
+    def _delete_in_batches(self, user_id, queryset):
+        deleted = 0
+        while True:
+            if not self.is_purgeable(user_id):
+                return None
+            ids = list(
+                queryset.order_by().values_list("pk", flat=True)[: self.batch_size]
+            )
+            if not ids:
+                return deleted
+            with transaction.atomic():
+                queryset.model.objects.filter(pk__in=ids).delete()
+            deleted += len(ids)
+            if len(ids) < self.batch_size:
+                return deleted
+            if self.pause:
+                time.sleep(self.pause)
+
+
+# 탈퇴 시각 기록 이전에 스스로 탈퇴한 것이 확인된 계정에만 탈퇴 시각을 채움
+# (관리자가 비활성화한 계정과 구분할 수 없으므로 운영자가 지정한 이메일만 대상으로 하고,
+#  직원/관리자 계정과 이미 탈퇴 시각이 있는 계정은 제외)
+def mark_deactivated_accounts(emails, dry_run=False):
+    users = User.objects.filter(
+        email__in=emails,
+        is_active=False,
+        is_staff=False,
+        is_superuser=False,
+        deactivated_at__isnull=True,
+    )
+    marked = list(users.order_by("email").values_list("email", flat=True))
+    if marked and not dry_run:
+        users.update(deactivated_at=timezone.now())
+    return marked
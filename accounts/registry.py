@@ -0,0 +1,108 @@
+import threading
+import time
+
+from django.conf import settings
+from django.db import transaction
+
+from core.cache_versions import bump_versions, current_version
+
+from .models import Allergy, ChronicDisease, Medication
+
+
+# 한 번에 읽어 둔 테이블 (id→항목, 이름→항목)
+class _Tables:
+
+    def __init__(self, version, items):
+        self.version = version
+        self.checked_at = time.monotonic()
+        self.by_id = {item.pk: item for item in items}
+        self.by_name = {item.name: item for item in items}
+
+
+# 건강 정보 참조 테이블 하나를 프로세스 안에 읽어 두고 조회/검증을 메모리에서 처리
+# 변경 시그널로 바로 다시 읽고(accounts.signals), 다른 프로세스는 공유 캐시의 버전을
+# HEALTH_INFO_REGISTRY_CHECK_INTERVAL초마다 확인하여 다시 읽음
+# 반환하는 모델 인스턴스는 여러 스레드가 공유하므로 읽기 전용으로만 사용
+class HealthInfoRegistry:
+
+    def __init__(self, model):
+        self.model = model
+        self.version_key = f"health_info_version:{model._meta.model_name}"
+        self._lock = threading.Lock()
+        self._tables = None
+
+    # 프로세스 단위 객체이므로 serializer 필드가 복사될 때도 같은 객체를 사용
+    def __deepcopy__(self, memo):
+        return self
+
+    def _load(self):
+        tables = self._tables
+        interval = settings.HEALTH_INFO_REGISTRY_CHECK_INTERVAL
+        if tables is not None and time.monotonic() - tables.checked_at < interval:
+            return tables
+
+        # 트랜잭션 안에서 읽은 값은 롤백될 수 있으므로 보관하지 않음
+        if transaction.get_connection().in_atomic_block:
+            return _Tables(None, self.model.objects.all())
+
+        with self._lock:
+            version = current_version(self.version_key, None)
+            tables = self._tables
+            if tables is None or tables.version != version:
+                tables = _Tables(version, self.model.objects.all())
+                self._tables = tables
+            tables.checked_at = time.monotonic()
+        return tables
+
+    def all(self):
+        return list(self._load().by_id.values())
+
+    def get(self, pk):
+        return self._load().by_id.get(pk)
+
+    def get_by_name(self, name):
+        return self._load().by_name.get(name)
+
+    # 존재하지 않는 id 목록 (다른 프로세스에서 방금 추가된 항목일 수 있으므로
+    # 메모리에 없는 id만 DB에서 한 번 더 확인)
+    def missing(self, ids):
+        tables = self._load()
+        unknown = [pk for pk in ids if pk not in tables.by_id]
+        if not unknown:
+            return []
+        found = set(
+            self.model.objects.filter(pk__in=unknown).values_list("pk", flat=True)
+        )
+        if found:
+            self.invalidate()
+        return [pk for pk in unknown if pk not in found]
+
+    # 이 프로세스의 테이블을 버림 (다음 조회 시 다시 읽음)
+    def invalidate(self):
+        with self._lock:
+            self._tables = None
+
+    # 다른 프로세스도 다시 읽도록 공유 버전을 갱신
+    def bump_version(self):
+        bump_versions([self.version_key], None)
+        self.invalidate()
+
+
+chronic_diseases = HealthInfoRegistry(ChronicDisease)
+allergies = HealthInfoRegistry(Allergy)
+medications = HealthInfoRegistry(Medication)
+
+REGISTRIES = {
+    ChronicDisease: chronic_diseases,
+    Allergy: allergies,
+    Medication: medications,
+}
+
+
+def get_registry(model):
+    return REGISTRIES[model]
+
+
+def reset_registries():
+    for registry in REGISTRIES.values():
+        registry.invalidate()
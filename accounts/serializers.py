@@ -1,9 +1,64 @@
+from contextlib import contextmanager
+
+from allauth.account.adapter import get_adapter
 from allauth.account.forms import SignupForm
+from allauth.account.models import EmailAddress
+from allauth.account.utils import setup_user_email
 from dj_rest_auth.registration.serializers import RegisterSerializer
 from rest_framework import serializers
-from django.db import transaction
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from django.db import IntegrityError, transaction
+from django.db.models.functions import Lower
+
+from . import registry
+from .models import NICKNAME_CONSTRAINT, User
+
+NICKNAME_TAKEN_MESSAGE = "이미 사용 중인 닉네임입니다."
+
+
+# 대소문자 무시 닉네임 유니크 인덱스 위반을 닉네임 중복 오류(400)로 변환
+# (미리 조회해도 동시에 같은 닉네임으로 저장하면 인덱스 위반이 발생할 수 있음)
+@contextmanager
+def nickname_conflict_as_validation_error():
+    try:
+        with transaction.atomic():
+            yield
+    except IntegrityError as error:
+        if NICKNAME_CONSTRAINT in str(error):
+            raise serializers.ValidationError({"nickname": [NICKNAME_TAKEN_MESSAGE]})
+        raise
+
+
+# 회원가입 시 함께 저장하는 건강 정보 M2M 필드
+HEALTH_INFO_FIELDS = ("chronic_diseases", "allergies", "medications")
+
 
-from .models import User, ChronicDisease, Allergy, Medication
+# 건강 정보 id 목록 필드 (id 존재 여부는 accounts.registry에서 메모리로 확인, id 목록을 반환)
+class PrimaryKeyListField(serializers.ListField):
+    child = serializers.UUIDField()
+
+    def __init__(self, registry, **kwargs):
+        self.registry = registry
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data):
+        ids = list(dict.fromkeys(super().to_internal_value(data)))
+        missing = self.registry.missing(ids)
+        if missing:
+            raise serializers.ValidationError(
+                f"존재하지 않는 항목입니다: {', '.join(str(pk) for pk in missing)}"
+            )
+        return ids
+
+    # M2M 필드는 미리 조회한 {필드명}_ids 값을 사용하고, 없으면 id만 조회
+    def get_attribute(self, instance):
+        ids = getattr(instance, f"{self.field_name}_ids", None)
+        if ids is not None:
+            return ids
+        value = super().get_attribute(instance)
+        if hasattr(value, "values_list"):
+            return list(value.order_by("pk").values_list("pk", flat=True))
+        return value
 
 
 class SignUpSerializer(RegisterSerializer):
@@ -12,20 +67,11 @@ class SignUpSerializer(RegisterSerializer):
     birth_date = serializers.DateField(required=False)
     gender = serializers.CharField(max_length=10, required=False)
     health_goals = serializers.CharField(max_length=255, required=False)
-    chronic_diseases = serializers.PrimaryKeyRelatedField(
-        many=True, queryset=ChronicDisease.objects.all(), required=False
+    chronic_diseases = PrimaryKeyListField(
+        registry=registry.chronic_diseases, required=False
     )
-    allergies = serializers.PrimaryKeyRelatedField(
-        many=True, queryset=Allergy.objects.all(), required=False
-    )
-    medications = serializers.PrimaryKeyRelatedField(
-        many=True, queryset=Medication.objects.all(), required=False
-    )
-
-    def validate_nickname(self, value):
-        if User.objects.filter(nickname__iexact=value).exists():
-            raise serializers.ValidationError("이미 사용 중인 닉네임입니다.")
-        return value
+    allergies = PrimaryKeyListField(registry=registry.allergies, required=False)
+    medications = PrimaryKeyListField(registry=registry.medications, required=False)
 
     def get_cleaned_data(self):
         data = {
@@ -35,36 +81,52 @@ class SignUpSerializer(RegisterSerializer):
         }
         return data
 
+    # SignupForm.save와 같은 순서로 저장하되, 추가 정보를 채운 뒤 INSERT 한 번으로 저장
+    # 닉네임 중복은 미리 조회하지 않고 대소문자 무시 유니크 인덱스 위반으로 확인
     @transaction.atomic
     def save(self, request):
         form = SignupForm(self.get_cleaned_data())
         if not form.is_valid():
             raise serializers.ValidationError(form.errors)
+        if form.account_already_exists:
+            raise serializers.ValidationError({"email": ["이미 가입된 이메일입니다."]})
 
-        user = form.save(request)
-
+        adapter = get_adapter(request)
+        user = adapter.new_user(request)
         user.nickname = self.validated_data.get("nickname", "")
         user.birth_date = self.validated_data.get("birth_date")
         user.gender = self.validated_data.get("gender")
-        user.health_goals = self.validated_data.get("health_goals")
-        user.save()
-
-        chronic_diseases_data = self.validated_data.get("chronic_diseases", [])
-        if chronic_diseases_data:
-            user.chronic_diseases.set(chronic_diseases_data)
-
-        allergies_data = self.validated_data.get("allergies", [])
-        if allergies_data:
-            user.allergies.set(allergies_data)
-
-        medications_data = self.validated_data.get("medications", [])
-        if medications_data:
-            user.medications.set(medications_data)
+        user.health_goals = self.validated_data.get("health_goals", "")
+        adapter.save_user(request, user, form, commit=False)
+        with nickname_conflict_as_validation_error():
+            user.save()
 
+        form.custom_signup(request, user)
+        setup_user_email(request, user, [EmailAddress(email=user.email)])
+        self.save_health_info(user)
         return user
 
+    # 새 사용자에게는 기존 연결이 없으므로 조회 없이 중간 테이블에 바로 INSERT
+    def save_health_info(self, user):
+        for field_name in HEALTH_INFO_FIELDS:
+            ids = self.validated_data.get(field_name)
+            if not ids:
+                continue
+            field = User._meta.get_field(field_name)
+            through = field.remote_field.through
+            target = f"{field.m2m_reverse_field_name()}_id"
+            through.objects.bulk_create(
+                through(user_id=user.pk, **{target: pk}) for pk in ids
+            )
+
 
 class UserDetailSerializer(serializers.ModelSerializer):
+    chronic_diseases = PrimaryKeyListField(
+        registry=registry.chronic_diseases, required=False
+    )
+    allergies = PrimaryKeyListField(registry=registry.allergies, required=False)
+    medications = PrimaryKeyListField(registry=registry.medications, required=False)
+
     class Meta:
         model = User
         fields = (
@@ -78,3 +140,30 @@ class UserDetailSerializer(serializers.ModelSerializer):
             "medications",
         )
         read_only_fields = ("email",)
+
+    # 회원정보 수정 시 대소문자만 다른 닉네임도 중복으로 처리 (Lower 인덱스 사용)
+    def validate_nickname(self, value):
+        users = User.objects.alias(nickname_lower=Lower("nickname")).filter(
+            nickname_lower=value.lower()
+        )
+        if self.instance is not None:
+            users = users.exclude(pk=self.instance.pk)
+        if users.exists():
+            raise serializers.ValidationError(NICKNAME_TAKEN_MESSAGE)
+        return value
+
+    def update(self, instance, validated_data):
+        with nickname_conflict_as_validation_error():
+            return super().update(instance, validated_data)
+
+
+# 로그인 시 발급하는 토큰에 사용자 상태 클레임을 추가
+# (갱신된 액세스 토큰도 리프레시 토큰의 클레임을 그대로 사용)
+class UserClaimsTokenSerializer(TokenObtainPairSerializer):
+
+    @classmethod
+    def get_token(cls, user):
+        token = super().get_token(user)
+        token["is_active"] = user.is_active
+        token["is_staff"] = user.is_staff
+        return token
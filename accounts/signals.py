@@ -0,0 +1,77 @@
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from .authentication import profiles
+from .models import Allergy, ChronicDisease, Medication, User
+from .registry import get_registry
+from .serializers import HEALTH_INFO_FIELDS
+from .user_details import bump_details_versions
+
+HEALTH_INFO_THROUGH = [
+    User._meta.get_field(field_name).remote_field.through
+    for field_name in HEALTH_INFO_FIELDS
+]
+
+
+def bump_on_commit(user_ids):
+    user_ids = list(user_ids)
+    if user_ids:
+        transaction.on_commit(lambda: bump_details_versions(user_ids))
+
+
+# 회원정보가 수정되면 커밋 이후 회원정보 캐시 버전을 갱신하고 프로세스 안 프로필을 제거
+@receiver(post_save, sender=User)
+def bump_details_on_user_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    profiles.invalidate(instance.pk)
+    bump_on_commit([instance.pk])
+
+
+# 건강 정보 연결이 바뀌면 해당 사용자들의 회원정보 캐시 버전을 갱신
+# (건강 정보 쪽에서 바꾸면 pk_set이 사용자 id, clear는 삭제 전에 연결된 사용자를 조회)
+def bump_details_on_health_info_change(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    if action not in ("post_add", "post_remove", "pre_clear"):
+        return
+    if not reverse:
+        bump_on_commit([instance.pk])
+    elif action == "pre_clear":
+        bump_on_commit(instance.user_set.values_list("pk", flat=True))
+    else:
+        bump_on_commit(pk_set)
+
+
+for through in HEALTH_INFO_THROUGH:
+    m2m_changed.connect(
+        bump_details_on_health_info_change,
+        sender=through,
+        dispatch_uid=f"bump_details_{through._meta.model_name}",
+    )
+
+
+# 건강 정보 항목이 삭제되면 연결된 사용자들의 회원정보 캐시 버전을 갱신
+# (중간 테이블 행은 CASCADE로 삭제되어 m2m_changed가 발생하지 않음)
+@receiver(pre_delete, sender=ChronicDisease)
+@receiver(pre_delete, sender=Allergy)
+@receiver(pre_delete, sender=Medication)
+def bump_details_on_health_info_delete(sender, instance, **kwargs):
+    bump_on_commit(instance.user_set.values_list("pk", flat=True))
+
+
+# 건강 정보 항목이 추가/수정/삭제되면 이 프로세스의 목록을 바로 버리고,
+# 커밋 이후 공유 버전을 갱신하여 다른 프로세스도 다시 읽게 함
+@receiver(post_save, sender=ChronicDisease)
+@receiver(post_save, sender=Allergy)
+@receiver(post_save, sender=Medication)
+@receiver(post_delete, sender=ChronicDisease)
+@receiver(post_delete, sender=Allergy)
+@receiver(post_delete, sender=Medication)
+def reload_health_info_registry(sender, raw=False, **kwargs):
+    if raw:
+        return
+    registry = get_registry(sender)
+    registry.invalidate()
+    transaction.on_commit(registry.bump_version)
@@ -0,0 +1,94 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from accounts.authentication import ClaimsJWTAuthentication, profiles
+from accounts.models import ClaimsUser, User
+from chats.models import ChatRoom
+
+
+# 토큰 클레임 기반 인증 테스트
+class ClaimsJWTAuthenticationTests(APITestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="claims@example.com", password="password123", nickname="claims"
+        )
+        ChatRoom.objects.create(user=self.user, title="클레임 인증 대화방")
+        profiles.clear()
+        self.addCleanup(profiles.clear)
+
+    def login(self):
+        response = self.client.post(
+            reverse("rest_login"),
+            {"email": self.user.email, "password": "password123"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data["access"]
+
+    def user_queries(self, queries):
+        return [
+            query["sql"]
+            for query in queries.captured_queries
+            if 'FROM "accounts_user"' in query["sql"]
+        ]
+
+    # 로그인 토큰의 클레임으로 인증하여 사용자 행을 조회하지 않는지 테스트
+    def test_chat_request_without_user_query(self):
+        print("\n토큰 클레임 인증 사용자 조회 생략 테스트\n")
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.login()}")
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("chatroom-list"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["results"]), 1)
+        self.assertEqual(self.user_queries(queries), [])
+
+    # 클레임에 없는 필드는 처음 접근할 때 프로필 캐시에서 한 번에 채우는지 테스트
+    def test_profile_loaded_once_from_cache(self):
+        print("\n토큰 클레임 사용자 프로필 캐시 테스트\n")
+        token = RefreshToken.for_user(self.user).access_token
+        token["is_active"], token["is_staff"] = True, False
+
+        first = ClaimsJWTAuthentication().get_user(token)
+        self.assertIsInstance(first, ClaimsUser)
+        self.assertEqual(first.pk, self.user.pk)
+        with self.assertNumQueries(1):
+            self.assertEqual(first.nickname, "claims")
+            self.assertEqual(first.email, "claims@example.com")
+
+        second = ClaimsJWTAuthentication().get_user(token)
+        with self.assertNumQueries(0):
+            self.assertEqual(second.nickname, "claims")
+
+    # 탈퇴 후에는 만료 전인 액세스 토큰도 거절하는지 테스트
+    def test_deactivated_user_token_rejected(self):
+        print("\n탈퇴 사용자 토큰 거절 테스트\n")
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.login()}")
+        self.assertEqual(
+            self.client.get(reverse("chatroom-list")).status_code,
+            status.HTTP_200_OK,
+        )
+
+        response = self.client.delete(reverse("account_delete"))
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+        response = self.client.get(reverse("chatroom-list"))
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    # 클레임이 없는 이전 토큰은 DB에서 사용자를 조회하여 인증하는지 테스트
+    def test_token_without_claims_falls_back_to_lookup(self):
+        print("\n클레임 없는 토큰 인증 테스트\n")
+        token = RefreshToken.for_user(self.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("chatroom-list"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(self.user_queries(queries)), 1)
@@ -0,0 +1,159 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from accounts.models import User
+from accounts.purge import DeactivatedAccountPurger
+from chats.models import ChatRoom, Message
+from data_managements.models import (
+    DietarySupplements,
+    IntakeLog,
+    Manufacturer,
+    UserSupplementIntake,
+)
+
+
+# 탈퇴 사용자 데이터 삭제 테스트
+class DeactivatedAccountPurgeTests(APITestCase):
+
+    def setUp(self):
+        manufacturer = Manufacturer.objects.create(name="테스트 제조사")
+        self.supplement = DietarySupplements.objects.create(
+            manufacturer=manufacturer, report_number="P-1", name="비타민"
+        )
+
+    def create_user(self, name, deactivated_days=None):
+        user = User.objects.create_user(
+            email=f"{name}@example.com", password="password123", nickname=name
+        )
+        if deactivated_days is not None:
+            user.is_active = False
+            user.deactivated_at = timezone.now() - timedelta(days=deactivated_days)
+            user.save(update_fields=["is_active", "deactivated_at"])
+
+        chat_room = ChatRoom.objects.create(user=user, title=f"{name} 대화방")
+        Message.objects.bulk_create(
+            [
+                Message(chat_room=chat_room, sender="user", content=f"메시지 {i}")
+                for i in range(5)
+            ]
+        )
+        UserSupplementIntake.objects.create(
+            user=user, supplement=self.supplement, intake_amount=1
+        )
+        IntakeLog.objects.create(user=user, supplement=self.supplement, amount=1)
+        RefreshToken.for_user(user)
+        return user
+
+    def assert_user_rows(self, user_id, exists):
+        querysets = [
+            User.objects.filter(pk=user_id),
+            ChatRoom.objects.filter(user_id=user_id),
+            Message.objects.filter(chat_room__user_id=user_id),
+            UserSupplementIntake.objects.filter(user_id=user_id),
+            IntakeLog.objects.filter(user_id=user_id),
+            OutstandingToken.objects.filter(user_id=user_id),
+        ]
+        for queryset in querysets:
+            self.assertEqual(queryset.exists(), exists, queryset.model.__name__)
+
+    # 유예 기간이 지난 탈퇴 사용자만 모든 데이터가 삭제되는지 테스트
+    def test_purge_after_grace_period(self):
+        print("\n유예 기간 지난 탈퇴 사용자 삭제 테스트\n")
+        expired = self.create_user("expired", deactivated_days=40)
+        recent = self.create_user("recent", deactivated_days=3)
+        active = self.create_user("active")
+
+        users, totals = DeactivatedAccountPurger(grace_days=30).run()
+
+        self.assertEqual(users, 1)
+        self.assertEqual(totals["messages"], 5)
+        self.assertEqual(totals["tokens"], 1)
+        self.assert_user_rows(expired.pk, exists=False)
+        self.assert_user_rows(recent.pk, exists=True)
+        self.assert_user_rows(active.pk, exists=True)
+
+    # 여러 배치로 나누어 삭제하고 사용자마다 진행 상황을 알리는지 테스트
+    def test_purge_in_batches_with_progress(self):
+        print("\n탈퇴 사용자 배치 삭제 진행 상황 테스트\n")
+        user = self.create_user("batched", deactivated_days=40)
+        reported = []
+
+        users, totals = DeactivatedAccountPurger(grace_days=30, batch_size=2).run(
+            progress=lambda user_id, counts: reported.append((user_id, counts))
+        )
+
+        self.assertEqual(users, 1)
+        self.assertEqual(reported, [(user.pk, totals)])
+        self.assertEqual(totals["messages"], 5)
+        self.assert_user_rows(user.pk, exists=False)
+
+    # 삭제 도중 다시 활성화된 사용자는 남은 데이터와 사용자 행을 유지하는지 테스트
+    def test_reactivated_user_is_kept(self):
+        print("\n다시 활성화된 탈퇴 사용자 유지 테스트\n")
+        user = self.create_user("reactivated", deactivated_days=40)
+        purger = DeactivatedAccountPurger(grace_days=30, batch_size=2)
+        User.objects.filter(pk=user.pk).update(is_active=True)
+
+        self.assertIsNone(purger.purge_user(user.pk))
+        self.assert_user_rows(user.pk, exists=True)
+
+    # 회원 탈퇴 시 탈퇴 시각이 기록되고 관리 명령이 결과를 출력하는지 테스트
+    def test_delete_view_records_deactivation(self):
+        print("\n회원 탈퇴 시각 기록 테스트\n")
+        user = self.create_user("leaving")
+        self.client.force_authenticate(user=user)
+
+        response = self.client.delete(reverse("account_delete"))
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        user.refresh_from_db()
+        self.assertFalse(user.is_active)
+        self.assertIsNotNone(user.deactivated_at)
+
+        out = StringIO()
+        call_command("purge_deactivated_accounts", "--days=0", stdout=out)
+        self.assertIn("사용자: 1명", out.getvalue())
+        self.assert_user_rows(user.pk, exists=False)
+
+    # 운영자가 지정한 이전 탈퇴 계정에만 탈퇴 시각을 채워 삭제 대상에 포함하는지 테스트
+    def test_mark_previously_deactivated_accounts(self):
+        print("\n이전 탈퇴 사용자 탈퇴 시각 기록 테스트\n")
+        previous = self.create_user("previous")
+        banned = self.create_user("banned")
+        staff = self.create_user("staff")
+        User.objects.filter(pk__in=[previous.pk, banned.pk]).update(is_active=False)
+        User.objects.filter(pk=staff.pk).update(is_active=False, is_staff=True)
+        emails = [previous.email, staff.email]
+
+        # dry-run은 대상만 출력하고 변경하지 않음
+        out = StringIO()
+        call_command("mark_deactivated_accounts", *emails, "--dry-run", stdout=out)
+        self.assertIn(previous.email, out.getvalue())
+        self.assertNotIn(staff.email, out.getvalue())
+        self.assertFalse(User.objects.filter(deactivated_at__isnull=False).exists())
+
+        call_command("mark_deactivated_accounts", *emails, stdout=StringIO())
+
+        users, _ = DeactivatedAccountPurger(grace_days=0).run()
+        self.assertEqual(users, 1)
+        self.assert_user_rows(previous.pk, exists=False)
+        self.assert_user_rows(banned.pk, exists=True)
+        self.assert_user_rows(staff.pk, exists=True)
+
+    # 다시 활성화하면 탈퇴 시각이 지워지는지 테스트
+    def test_reactivation_clears_deactivated_at(self):
+        print("\n재활성화 시 탈퇴 시각 초기화 테스트\n")
+        user = self.create_user("returning", deactivated_days=40)
+        user.is_active = True
+        user.save(update_fields=["is_active"])
+
+        user.refresh_from_db()
+        self.assertIsNone(user.deactivated_at)
@@ -0,0 +1,65 @@
+from django.core.cache import cache
+from django.test import TransactionTestCase, override_settings
+
+from accounts.models import Allergy
+from accounts.registry import allergies, reset_registries
+from accounts.serializers import SignUpSerializer
+
+
+# 건강 정보 참조 테이블 목록 테스트
+# (트랜잭션 안에서 읽은 목록은 보관하지 않으므로 커밋된 데이터로 확인)
+class HealthInfoRegistryTests(TransactionTestCase):
+
+    def setUp(self):
+        cache.clear()
+        reset_registries()
+        self.addCleanup(reset_registries)
+        self.peanut = Allergy.objects.create(name="땅콩")
+        self.milk = Allergy.objects.create(name="우유")
+
+    # 한 번 읽은 뒤에는 조회와 회원가입 id 검증을 쿼리 없이 처리하는지 테스트
+    def test_lookups_served_from_memory(self):
+        print("\n건강 정보 목록 메모리 조회 테스트\n")
+        allergies.all()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(allergies.get(self.peanut.pk).name, "땅콩")
+            self.assertEqual(allergies.get_by_name("우유").pk, self.milk.pk)
+            self.assertEqual(allergies.missing([self.peanut.pk, self.milk.pk]), [])
+            field = SignUpSerializer().fields["allergies"]
+            self.assertEqual(
+                field.run_validation([str(self.peanut.pk)]), [self.peanut.pk]
+            )
+
+    # 추가/이름 변경/삭제 시그널로 다시 읽는지 테스트
+    def test_reloads_on_change(self):
+        print("\n건강 정보 변경 시 목록 갱신 테스트\n")
+        allergies.all()
+
+        egg = Allergy.objects.create(name="계란")
+        self.assertEqual(allergies.get(egg.pk).name, "계란")
+
+        self.milk.name = "유제품"
+        self.milk.save()
+        self.assertIsNone(allergies.get_by_name("우유"))
+        self.assertEqual(allergies.get_by_name("유제품").pk, self.milk.pk)
+
+        self.peanut.delete()
+        self.assertIsNone(allergies.get(self.peanut.pk))
+
+    # 다른 프로세스의 변경은 공유 버전과 DB 재확인으로 반영되는지 테스트
+    def test_detects_changes_from_other_processes(self):
+        print("\n다른 프로세스의 건강 정보 변경 반영 테스트\n")
+        allergies.all()
+
+        # 시그널 없이 추가된 항목도 메모리에 없으면 DB에서 확인
+        [soy] = Allergy.objects.bulk_create([Allergy(name="대두")])
+        self.assertEqual(allergies.missing([soy.pk]), [])
+        self.assertEqual(allergies.get(soy.pk).name, "대두")
+
+        # 다른 프로세스가 공유 버전을 갱신하면 확인 주기 이후 다시 읽음
+        Allergy.objects.filter(pk=self.milk.pk).update(name="유당")
+        self.assertEqual(allergies.get(self.milk.pk).name, "우유")
+        cache.set(allergies.version_key, "changed", None)
+        with override_settings(HEALTH_INFO_REGISTRY_CHECK_INTERVAL=0):
+            self.assertEqual(allergies.get(self.milk.pk).name, "유당")
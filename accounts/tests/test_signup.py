@@ -0,0 +1,122 @@
+from unittest import mock
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from accounts.models import Allergy, ChronicDisease, Medication, User
+from accounts.serializers import UserDetailSerializer
+
+
+# 닉네임 대소문자 무시 중복 확인과 건강 정보 저장 테스트
+class SignUpNicknameTests(APITestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="taken@example.com", password="password123", nickname="TakenUser"
+        )
+        self.url = reverse("rest_register")
+
+    def signup_data(self, **extra):
+        return {
+            "email": "new@example.com",
+            "password1": "1q2w3e4r!@#",
+            "password2": "1q2w3e4r!@#",
+            "nickname": "newuser",
+            **extra,
+        }
+
+    def test_signup_rejects_nickname_differing_in_case(self):
+        print("\n대소문자만 다른 닉네임 회원가입 거절 테스트\n")
+        response = self.client.post(
+            self.url, self.signup_data(nickname="takenuser"), format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("nickname", response.data)
+        self.assertFalse(User.objects.filter(email="new@example.com").exists())
+
+    def test_signup_saves_health_info_with_one_insert_per_relation(self):
+        print("\n회원가입 건강 정보 일괄 저장 테스트\n")
+        diseases = [ChronicDisease.objects.create(name=f"지병{i}") for i in range(3)]
+        allergy = Allergy.objects.create(name="땅콩")
+        medication = Medication.objects.create(name="아스피린")
+        data = self.signup_data(
+            chronic_diseases=[str(disease.id) for disease in diseases],
+            allergies=[str(allergy.id)],
+            medications=[str(medication.id)],
+        )
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(self.url, data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        user = User.objects.get(email="new@example.com")
+        self.assertEqual(set(user.chronic_diseases.all()), set(diseases))
+        self.assertEqual(list(user.allergies.all()), [allergy])
+        self.assertEqual(list(user.medications.all()), [medication])
+
+        sqls = [query["sql"] for query in queries.captured_queries]
+        self.assertEqual(
+            sum(sql.startswith('INSERT INTO "accounts_user"') for sql in sqls), 1
+        )
+        self.assertFalse(
+            any(sql.startswith('UPDATE "accounts_user" SET "password"') for sql in sqls)
+        )
+        self.assertEqual(
+            sum(
+                sql.startswith('INSERT INTO "accounts_user_chronic_diseases"')
+                for sql in sqls
+            ),
+            1,
+        )
+
+    def test_signup_rejects_unknown_health_info(self):
+        print("\n존재하지 않는 건강 정보 회원가입 거절 테스트\n")
+        response = self.client.post(
+            self.url,
+            self.signup_data(allergies=["00000000-0000-0000-0000-000000000000"]),
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("allergies", response.data)
+        self.assertFalse(User.objects.filter(email="new@example.com").exists())
+
+    def test_detail_update_rejects_nickname_differing_in_case(self):
+        print("\n대소문자만 다른 닉네임 회원정보 수정 거절 테스트\n")
+        other = User.objects.create_user(
+            email="other@example.com", password="password123", nickname="other"
+        )
+        self.client.force_authenticate(user=other)
+        url = reverse("rest_user_details")
+
+        response = self.client.patch(url, {"nickname": "TAKENUSER"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        # 자기 닉네임의 대소문자만 바꾸는 것은 허용
+        response = self.client.patch(url, {"nickname": "OTHER"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    # 중복 확인 이후 다른 요청이 같은 닉네임을 저장한 경우에도 400으로 응답하는지 테스트
+    def test_detail_update_nickname_race(self):
+        print("\n동시 닉네임 변경 충돌 테스트\n")
+        other = User.objects.create_user(
+            email="other@example.com", password="password123", nickname="other"
+        )
+        self.client.force_authenticate(user=other)
+
+        # 중복 확인을 통과한 뒤 저장 시점에 인덱스 위반이 발생하는 상황
+        with mock.patch.object(
+            UserDetailSerializer, "validate_nickname", lambda self, value: value
+        ):
+            response = self.client.patch(
+                reverse("rest_user_details"), {"nickname": "takenuser"}, format="json"
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["nickname"], ["이미 사용 중인 닉네임입니다."])
+        other.refresh_from_db()
+        self.assertEqual(other.nickname, "other")
@@ -0,0 +1,89 @@
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from accounts.authentication import profiles
+from accounts.models import Allergy, ChronicDisease, Medication, User
+from accounts.serializers import UserClaimsTokenSerializer
+
+
+# 회원정보 조회 캐시와 쿼리 수 테스트
+class UserDetailsCacheTests(APITestCase):
+
+    def setUp(self):
+        cache.clear()
+        profiles.clear()
+        self.user = User.objects.create_user(
+            email="details@example.com", password="password123", nickname="details"
+        )
+        self.diseases = [
+            ChronicDisease.objects.create(name=f"지병{i}") for i in range(2)
+        ]
+        self.allergy = Allergy.objects.create(name="땅콩")
+        self.medication = Medication.objects.create(name="아스피린")
+        self.user.chronic_diseases.set(self.diseases)
+        self.user.allergies.add(self.allergy)
+        self.user.medications.add(self.medication)
+
+        token = UserClaimsTokenSerializer.get_token(self.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+        self.url = reverse("rest_user_details")
+
+    def get_details(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    # 첫 조회는 쿼리 한 번(M2M 포함), 이후 조회는 쿼리 없이 응답하는지 테스트
+    def test_details_query_budget(self):
+        print("\n회원정보 조회 쿼리 수 테스트\n")
+        with self.assertNumQueries(1):
+            data = self.get_details()
+        self.assertEqual(data["nickname"], "details")
+        self.assertEqual(
+            data["chronic_diseases"],
+            sorted(str(disease.id) for disease in self.diseases),
+        )
+        self.assertEqual(data["allergies"], [str(self.allergy.id)])
+        self.assertEqual(data["medications"], [str(self.medication.id)])
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.get_details(), data)
+
+    # 건강 정보 연결이 바뀌면 (양쪽 방향 모두) 다음 조회에 반영되는지 테스트
+    def test_m2m_change_invalidates_details(self):
+        print("\n건강 정보 변경 시 회원정보 캐시 무효화 테스트\n")
+        self.get_details()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.allergies.remove(self.allergy)
+        self.assertEqual(self.get_details()["allergies"], [])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.diseases[0].user_set.clear()
+        self.assertEqual(
+            self.get_details()["chronic_diseases"], [str(self.diseases[1].id)]
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.medication.delete()
+        self.assertEqual(self.get_details()["medications"], [])
+
+    # 회원정보 수정 후 조회하면 수정된 값을 반환하는지 테스트
+    def test_update_invalidates_details(self):
+        print("\n회원정보 수정 시 캐시 무효화 테스트\n")
+        self.get_details()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch(
+                self.url,
+                {"nickname": "renamed", "allergies": []},
+                format="json",
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["allergies"], [])
+
+        data = self.get_details()
+        self.assertEqual(data["nickname"], "renamed")
+        self.assertEqual(data["allergies"], [])
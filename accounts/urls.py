@@ -1,7 +1,9 @@
-from django.urls import path, include
-from .views import UserDeleteView
+from django.urls import path, include, re_path
+from .views import UserDeleteView, UserDetailView
 
 urlpatterns = [
+    # dj-rest-auth의 같은 경로보다 먼저 등록하여 대체
+    re_path(r"user/?$", UserDetailView.as_view(), name="rest_user_details"),
     path("", include("dj_rest_auth.urls")),
     path("signup/", include("dj_rest_auth.registration.urls")),
     path("user/delete/", UserDeleteView.as_view(), name="account_delete"),
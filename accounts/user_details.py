@@ -0,0 +1,55 @@
+from django.conf import settings
+from django.contrib.postgres.expressions import ArraySubquery
+from django.core.cache import cache
+from django.db.models import OuterRef
+
+from core.cache_versions import bump_versions, current_version
+
+from .models import User
+from .serializers import HEALTH_INFO_FIELDS, UserDetailSerializer
+
+
+def details_version_key(user_id):
+    return f"user_details_version:{user_id}"
+
+
+# 회원정보가 바뀌면 호출 (이전 버전의 캐시된 응답은 만료될 때까지 사용되지 않음)
+def bump_details_versions(user_ids):
+    bump_versions(
+        [details_version_key(user_id) for user_id in user_ids],
+        settings.USER_DETAILS_CACHE_TIMEOUT,
+    )
+
+
+# 건강 정보 M2M id 목록을 하위 쿼리 배열로 함께 조회하는 사용자 queryset
+# ({필드명}_ids 속성은 UserDetailSerializer의 PrimaryKeyListField가 사용)
+def user_details_queryset():
+    annotations = {}
+    for field_name in HEALTH_INFO_FIELDS:
+        field = User._meta.get_field(field_name)
+        through = field.remote_field.through
+        target = f"{field.m2m_reverse_field_name()}_id"
+        annotations[f"{field_name}_ids"] = ArraySubquery(
+            through.objects.filter(user_id=OuterRef("pk"))
+            .order_by(target)
+            .values(target)
+        )
+    return User.objects.annotate(**annotations)
+
+
+# 사용자 버전 아래에 캐시한 회원정보 응답 (없으면 쿼리 한 번으로 생성, 사용자가 없으면 None)
+def get_user_details(user_id):
+    version = current_version(
+        details_version_key(user_id), settings.USER_DETAILS_CACHE_TIMEOUT
+    )
+    key = f"user_details:{user_id}:{version}"
+    data = cache.get(key)
+    if data is not None:
+        return data
+
+    user = user_details_queryset().filter(pk=user_id).first()
+    if user is None:
+        return None
+    data = UserDetailSerializer(user).data
+    cache.set(key, data, settings.USER_DETAILS_CACHE_TIMEOUT)
+    return data
@@ -1,16 +1,40 @@
+from django.utils import timezone
+from dj_rest_auth.views import UserDetailsView
+from rest_framework.exceptions import NotFound
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework import status
 
+from .authentication import ClaimsJWTAuthentication, revoke_user_tokens
+from .models import User
+from .user_details import get_user_details
+
 # Create your views here.
 
 
+# 회원정보 조회/수정 (dj-rest-auth UserDetailsView 대체)
+# 조회는 사용자 버전 아래에 캐시한 응답을 사용하고, 수정은 DB의 최신 행을 기준으로 처리
+class UserDetailView(UserDetailsView):
+    authentication_classes = [ClaimsJWTAuthentication]
+
+    def get_object(self):
+        return User.objects.get(pk=self.request.user.pk)
+
+    def retrieve(self, request, *args, **kwargs):
+        data = get_user_details(request.user.pk)
+        if data is None:
+            raise NotFound("사용자를 찾을 수 없습니다.")
+        return Response(data)
+
+
 class UserDeleteView(APIView):
     permission_classes = [IsAuthenticated]
 
     def delete(self, request, *args, **kwargs):
         user = request.user
         user.is_active = False
-        user.save()
+        user.deactivated_at = timezone.now()
+        user.save(update_fields=["is_active", "deactivated_at"])
+        revoke_user_tokens(user.pk)
         return Response(status=status.HTTP_204_NO_CONTENT)
@@ -13,4 +13,15 @@ from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
 
-application = get_asgi_application()
+django_application = get_asgi_application()
+
+# Django 초기화 이후에 import (모델 로딩 필요)
+from chats.websocket import websocket_application  # noqa: E402
+
+
+# HTTP 요청은 Django로, WebSocket 연결은 채팅 실시간 채널로 전달
+async def application(scope, receive, send):
+    if scope['type'] == 'websocket':
+        await websocket_application(scope, receive, send)
+    else:
+        await django_application(scope, receive, send)
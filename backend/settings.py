@@ -34,6 +34,14 @@ SUPPLEMENT_SERVICE_API_KEY = os.getenv("SUPPLEMENT_SERVICE_API_KEY")
 INGREDIENT_SERVICE_API_KEY = os.getenv("INGREDIENT_SERVICE_API_KEY")
 ALLOWED_HOSTS = os.getenv("ALLOWED_HOSTS").split(",")
 
+# 영양제 추천 모델을 카탈로그에서 다시 생성하는 주기(초)
+SUPPLEMENT_RECOMMENDER_MAX_AGE = int(os.getenv("SUPPLEMENT_RECOMMENDER_MAX_AGE", 3600))
+
+# AI 응답 근거 검색용 원료/제품 지식 색인 디렉터리 (동기화 명령어와 웹 워커가 공유해야 함)
+KNOWLEDGE_INDEX_DIR = Path(
+    os.getenv("KNOWLEDGE_INDEX_DIR", BASE_DIR / "var" / "knowledge_index")
+)
+
 
 # Application definition
 
@@ -113,6 +121,79 @@ DATABASES = {
 }
 
 
+# Cache
+# 여러 프로세스(웹 워커, 동기화 명령어)가 무효화를 공유하려면 운영 환경에서는
+# Redis/Memcached 등 공유 캐시 백엔드를 지정해야 함
+CACHES = {
+    "default": {
+        "BACKEND": os.getenv(
+            "CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"
+        ),
+        "LOCATION": os.getenv("CACHE_LOCATION", ""),
+    }
+}
+
+# 사용자별 섭취 요약 캐시 만료 시간(초, 시그널 무효화 누락에 대비한 안전장치)
+INTAKE_SUMMARY_CACHE_TIMEOUT = int(os.getenv("INTAKE_SUMMARY_CACHE_TIMEOUT", 86400))
+
+# 토큰 클레임 인증(accounts.authentication) 사용자의 전체 프로필 캐시 만료 시간(초)
+AUTH_PROFILE_CACHE_TIMEOUT = int(os.getenv("AUTH_PROFILE_CACHE_TIMEOUT", 30))
+
+# 건강 정보 참조 테이블 목록(accounts.registry)의 다른 프로세스 변경 확인 주기(초)
+HEALTH_INFO_REGISTRY_CHECK_INTERVAL = int(
+    os.getenv("HEALTH_INFO_REGISTRY_CHECK_INTERVAL", 30)
+)
+
+# 회원정보 조회 응답 캐시 만료 시간(초, 버전 갱신 누락에 대비한 안전장치)
+USER_DETAILS_CACHE_TIMEOUT = int(os.getenv("USER_DETAILS_CACHE_TIMEOUT", 300))
+
+# 대화방/메시지 목록 첫 페이지 캐시 만료 시간(초, 버전 갱신 누락에 대비한 안전장치)
+CHAT_LIST_CACHE_TIMEOUT = int(os.getenv("CHAT_LIST_CACHE_TIMEOUT", 300))
+
+# 채팅 AI 응답 생성 백엔드
+# MAX_CONCURRENCY: 워커당 동시 생성 수, QUEUE_TIMEOUT: 생성 슬롯 대기 시간(초)
+CHAT_AI_BACKEND = {
+    "BACKEND": os.getenv("CHAT_AI_BACKEND", "chats.backends.stub.StubChatBackend"),
+    "OPTIONS": {
+        "latency": float(os.getenv("CHAT_AI_STUB_LATENCY", 0)),
+    },
+    "MAX_CONCURRENCY": int(os.getenv("CHAT_AI_MAX_CONCURRENCY", 8)),
+    "QUEUE_TIMEOUT": float(os.getenv("CHAT_AI_QUEUE_TIMEOUT", 10)),
+}
+
+# AI 메시지 생성 요청 제한 (초과 시 429 응답과 Retry-After 헤더)
+# RATE/BURST: 사용자별 토큰 버킷 ("요청 수/기간(s, m, h, d)", 연속 허용 요청 수)
+# MAX_CONCURRENT: 전체 사용자의 동시 생성 수 (공유 캐시 기준)
+# RATE/MAX_CONCURRENT를 None으로 두면 해당 제한을 사용하지 않음
+CHAT_THROTTLE = {
+    "RATE": os.getenv("CHAT_THROTTLE_RATE", "20/min"),
+    "BURST": int(os.getenv("CHAT_THROTTLE_BURST", 10)),
+    "MAX_CONCURRENT": int(os.getenv("CHAT_THROTTLE_MAX_CONCURRENT", 64)),
+    "RETRY_AFTER": int(os.getenv("CHAT_THROTTLE_RETRY_AFTER", 1)),
+}
+
+# 채팅 실시간 채널(WebSocket) 이벤트 전달 백엔드
+# MAX_BUFFER: 연결별 전송 대기 이벤트 수 (초과하면 느린 연결로 보고 종료)
+CHAT_PUBSUB = {
+    "BACKEND": os.getenv("CHAT_PUBSUB_BACKEND", "chats.pubsub.LocalPubSubBackend"),
+    "OPTIONS": {},
+    "MAX_BUFFER": int(os.getenv("CHAT_PUBSUB_MAX_BUFFER", 100)),
+}
+
+# AI 응답 생성 시 전달할 대화 컨텍스트 토큰 예산 (이전 대화 요약 예산 포함)
+CHAT_CONTEXT_TOKEN_BUDGET = int(os.getenv("CHAT_CONTEXT_TOKEN_BUDGET", 2000))
+CHAT_SUMMARY_TOKEN_BUDGET = int(os.getenv("CHAT_SUMMARY_TOKEN_BUDGET", 500))
+# 질문과 관련된 원료/제품 지식 구절 수와 토큰 예산 (KNOWLEDGE_INDEX_DIR 색인에서 검색)
+CHAT_KNOWLEDGE_PASSAGES = int(os.getenv("CHAT_KNOWLEDGE_PASSAGES", 3))
+CHAT_KNOWLEDGE_TOKEN_BUDGET = int(os.getenv("CHAT_KNOWLEDGE_TOKEN_BUDGET", 300))
+
+# 마지막 대화 이후 이 기간(일)이 지난 대화방의 오래된 메시지를 보관 테이블로 이동
+CHAT_ARCHIVE_INACTIVE_DAYS = int(os.getenv("CHAT_ARCHIVE_INACTIVE_DAYS", 90))
+
+# 회원 탈퇴 후 이 기간(일)이 지나면 purge_deactivated_accounts로 사용자 데이터를 삭제
+ACCOUNT_PURGE_GRACE_DAYS = int(os.getenv("ACCOUNT_PURGE_GRACE_DAYS", 30))
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -174,6 +255,7 @@ REST_AUTH = {
     "JWT_AUTH_HTTPONLY": False,  # Refresh Token을 쿠키가 아닌 응답 바디로 받기 위함
     "REGISTER_SERIALIZER": "accounts.serializers.SignUpSerializer",
     "USER_DETAILS_SERIALIZER": "accounts.serializers.UserDetailSerializer",
+    "JWT_TOKEN_CLAIMS_SERIALIZER": "accounts.serializers.UserClaimsTokenSerializer",
 }
 
 # django-allauth 설정
@@ -9,6 +9,7 @@ urlpatterns = [
     path("admin/", admin.site.urls),
     path("api/v1/accounts/", include("accounts.urls")),
     path("api/v1/chats/", include("chats.urls")),
+    path("api/v1/supplements/", include("data_managements.urls")),
     # drf-spectacular
     path("api/v1/schema/", SpectacularAPIView.as_view(), name="schema"),
     path(
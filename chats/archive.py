@@ -0,0 +1,166 @@
+import json
+import uuid
+import zlib
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Exists, OuterRef, Q
+from django.utils import timezone
+
+from .list_cache import bump_list_versions
+from .models import ChatRoom, Message, MessageArchive
+
+# 보관 묶음에 저장하는 메시지 필드 (JSON 배열의 순서)
+ARCHIVE_FIELDS = (
+    "id",
+    "sender",
+    "message_type",
+    "content",
+    "created_at",
+    "token_count",
+)
+
+
+# 메시지 행 목록을 JSON 배열로 직렬화하여 zlib 압축
+def compress_messages(rows):
+    payload = [
+        [str(pk), sender, message_type, content, created_at.isoformat(), token_count]
+        for pk, sender, message_type, content, created_at, token_count in rows
+    ]
+    return zlib.compress(
+        json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode(), 6
+    )
+
+
+# 보관 묶음을 저장되지 않은 Message 인스턴스 목록(오래된 순서)으로 복원
+def decompress_messages(archive):
+    messages = []
+    for pk, sender, message_type, content, created_at, token_count in json.loads(
+        zlib.decompress(archive.data)
+    ):
+        message = Message(
+            id=uuid.UUID(pk),
+            chat_room_id=archive.chat_room_id,
+            sender=sender,
+            message_type=message_type,
+            content=content,
+            created_at=datetime.fromisoformat(created_at),
+        )
+        message.token_count = token_count
+        messages.append(message)
+    return messages
+
+
+# 보관된 메시지 중 before((created_at, id))보다 오래된 메시지를 최신순으로 최대 limit개 조회
+# 보관 묶음은 대화방별로 시간 구간이 겹치지 않으므로 필요한 묶음만 차례로 압축 해제
+def load_archived_messages(chat_room_id, user, before=None, limit=10):
+    archives = MessageArchive.objects.filter(
+        chat_room_id=chat_room_id, chat_room__user=user
+    ).order_by("-newest_created_at")
+    if before is not None:
+        archives = archives.filter(oldest_created_at__lte=before[0])
+
+    messages = []
+    for archive in archives.iterator(chunk_size=2):
+        for message in reversed(decompress_messages(archive)):
+            if before is None or (message.created_at, message.id) < before:
+                messages.append(message)
+                if len(messages) >= limit:
+                    return messages
+    return messages
+
+
+# 오래 사용하지 않은 대화방의 메시지를 보관 테이블로 옮기는 작업
+# 묶음마다 짧은 트랜잭션으로 처리하여 대화방/메시지 잠금이 길게 유지되지 않음
+class MessageArchiver:
+
+    def __init__(self, inactive_days=None, keep_recent=20, batch_size=500):
+        if inactive_days is None:
+            inactive_days = settings.CHAT_ARCHIVE_INACTIVE_DAYS
+        self.cutoff = timezone.now() - timedelta(days=inactive_days)
+        self.keep_recent = keep_recent
+        self.batch_size = batch_size
+
+    # 최근 메시지 keep_recent개보다 많은 메시지가 있는 비활성 대화방
+    def candidate_rooms(self):
+        older = Message.objects.filter(chat_room=OuterRef("pk"))[
+            self.keep_recent : self.keep_recent + 1
+        ]
+        return (
+            ChatRoom.objects.filter(updated_at__lt=self.cutoff)
+            .filter(Exists(older))
+            .order_by("updated_at")
+            .values_list("id", flat=True)
+        )
+
+    # 전체 비활성 대화방을 처리하고 (대화방 수, 메시지 수, 보관 묶음 수)를 반환
+    def run(self):
+        rooms = messages = archives = 0
+        for chat_room_id in list(self.candidate_rooms()):
+            archived, created = self.archive_room(chat_room_id)
+            if archived:
+                rooms += 1
+                messages += archived
+                archives += created
+        return rooms, messages, archives
+
+    # 한 대화방의 오래된 메시지를 batch_size개씩 보관 묶음으로 이동
+    def archive_room(self, chat_room_id):
+        # AI 컨텍스트용 최근 메시지는 남겨 둠 (대화를 다시 시작해도 보관 테이블을 읽지 않음)
+        boundary = None
+        if self.keep_recent:
+            kept = list(
+                Message.objects.filter(chat_room_id=chat_room_id)
+                .order_by("-created_at", "-id")
+                .values_list("created_at", "id")[
+                    self.keep_recent - 1 : self.keep_recent
+                ]
+            )
+            if not kept:
+                return 0, 0
+            boundary = kept[0]
+
+        archived = created = 0
+        while True:
+            with transaction.atomic():
+                # 처리 중 새 메시지가 추가되어 활성화된 대화방은 건너뜀
+                # (메시지 전송의 대화방 UPDATE와 이 묶음 처리가 서로를 기다리게 됨)
+                locked = ChatRoom.objects.select_for_update().filter(
+                    pk=chat_room_id, updated_at__lt=self.cutoff
+                )
+                if not list(locked.values_list("id", flat=True)):
+                    break
+
+                queryset = Message.objects.filter(chat_room_id=chat_room_id)
+                if boundary is not None:
+                    queryset = queryset.filter(
+                        Q(created_at__lt=boundary[0])
+                        | Q(created_at=boundary[0], id__lt=boundary[1])
+                    )
+                rows = list(
+                    queryset.order_by("created_at", "id").values_list(*ARCHIVE_FIELDS)[
+                        : self.batch_size
+                    ]
+                )
+                if not rows:
+                    break
+
+                MessageArchive.objects.create(
+                    chat_room_id=chat_room_id,
+                    oldest_created_at=rows[0][4],
+                    newest_created_at=rows[-1][4],
+                    message_count=len(rows),
+                    data=compress_messages(rows),
+                )
+                Message.objects.filter(id__in=[row[0] for row in rows]).delete()
+
+            archived += len(rows)
+            created += 1
+            if len(rows) < self.batch_size:
+                break
+
+        # 목록 다음 페이지 링크가 보관 메시지 cursor로 바뀜
+        if archived:
+            bump_list_versions(chat_room_ids=[chat_room_id])
+        return archived, created
@@ -0,0 +1,234 @@
+import base64
+import json
+import uuid
+from datetime import datetime
+
+from asgiref.sync import sync_to_async
+from django.db.models import Q
+from django.http import JsonResponse
+from django.views import View
+from rest_framework.exceptions import NotAuthenticated, NotFound
+from rest_framework.pagination import CursorPagination
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, TokenError
+
+from accounts.authentication import ClaimsJWTAuthentication
+from .archive import load_archived_messages
+from .backends.dispatcher import DispatcherBusy, get_dispatcher
+from .context import CONTEXT_ROOM_FIELDS, ChatContextBuilder
+from .exceptions import AIBackendBusy, ChatThrottled
+from .models import ChatRoom, Message
+from .pubsub import publish_messages
+from .room_stats import save_messages
+from .serializers import ChatRoomSerializer, MessageSerializer
+from .throttles import get_chat_throttle
+
+PAGE_SIZE = 10
+
+
+def error_response(detail, status):
+    return JsonResponse({"detail": detail}, status=status)
+
+
+def throttled_response(error):
+    response = error_response(error.detail, error.status_code)
+    response["Retry-After"] = str(error.wait)
+    return response
+
+
+# 토큰 검증과 사용자 생성은 토큰 클레임으로 처리 (클레임이 없는 토큰만 비동기 ORM 조회)
+async def aauthenticate(request):
+    authentication = ClaimsJWTAuthentication()
+    header = authentication.get_header(request)
+    if header is None:
+        return None
+    raw_token = authentication.get_raw_token(header)
+    if raw_token is None:
+        return None
+    return await aget_user_for_token(raw_token)
+
+
+# 액세스 토큰 문자열(bytes/str)로 활성 사용자를 조회 (유효하지 않으면 None)
+async def aget_user_for_token(raw_token):
+    authentication = ClaimsJWTAuthentication()
+    try:
+        token = authentication.get_validated_token(raw_token)
+        return await authentication.aget_user(token)
+    except (AuthenticationFailed, TokenError):
+        return None
+
+
+def encode_cursor(position, pk):
+    raw = f"{position.isoformat()}|{pk}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_cursor(cursor):
+    position, pk = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+    return datetime.fromisoformat(position), uuid.UUID(pk)
+
+
+# (정렬 필드, id) 내림차순 키셋 페이지네이션 (DRF CursorPagination과 같은 응답 형식)
+async def keyset_page(request, queryset, field):
+    cursor = request.GET.get("cursor")
+    if cursor:
+        try:
+            position, pk = decode_cursor(cursor)
+        except ValueError:
+            return None
+        queryset = queryset.filter(
+            Q(**{f"{field}__lt": position}) | Q(**{field: position, "pk__lt": pk})
+        )
+
+    items = [
+        item async for item in queryset.order_by(f"-{field}", "-pk")[: PAGE_SIZE + 1]
+    ]
+    next_url = None
+    if len(items) > PAGE_SIZE:
+        items = items[:PAGE_SIZE]
+        next_url = page_url(
+            request, "cursor", encode_cursor(getattr(items[-1], field), items[-1].pk)
+        )
+    return {"next": next_url, "previous": None, "items": items}
+
+
+# 현재 요청 URL에서 커서 파라미터만 바꾼 다음 페이지 URL
+def page_url(request, param, cursor):
+    query = request.GET.copy()
+    query.pop("cursor", None)
+    query[param] = cursor
+    return request.build_absolute_uri(f"{request.path}?{query.urlencode()}")
+
+
+# 인증과 JSON 요청 본문 처리를 담당하는 비동기 뷰 기본 클래스
+class AsyncAPIView(View):
+
+    # JWT 헤더 인증만 사용하므로 DRF APIView와 같이 CSRF 검사 제외
+    @classmethod
+    def as_view(cls, **initkwargs):
+        view = super().as_view(**initkwargs)
+        view.csrf_exempt = True
+        return view
+
+    async def dispatch(self, request, *args, **kwargs):
+        request.user = await aauthenticate(request)
+        if request.user is None:
+            return error_response(NotAuthenticated.default_detail, 401)
+
+        if request.method == "POST":
+            try:
+                request.data = json.loads(request.body or b"{}")
+            except ValueError:
+                return error_response("잘못된 JSON 형식입니다.", 400)
+        return await super().dispatch(request, *args, **kwargs)
+
+
+# 채팅방 목록 조회/생성 (비동기)
+class AsyncChatRoomListView(AsyncAPIView):
+
+    async def get(self, request):
+        queryset = ChatRoom.objects.filter(user=request.user)
+        search = request.GET.get("search")
+        if search:
+            queryset = queryset.filter(title__icontains=search)
+
+        page = await keyset_page(request, queryset, "updated_at")
+        if page is None:
+            return error_response(CursorPagination.invalid_cursor_message, 404)
+        results = ChatRoomSerializer(page.pop("items"), many=True).data
+        return JsonResponse({**page, "results": results})
+
+    async def post(self, request):
+        serializer = ChatRoomSerializer(data=request.data)
+        if not serializer.is_valid():
+            return JsonResponse(serializer.errors, status=400)
+        chat_room = await ChatRoom.objects.acreate(
+            user=request.user, **serializer.validated_data
+        )
+        return JsonResponse(ChatRoomSerializer(chat_room).data, status=201)
+
+
+# 메시지 목록 조회/전송 (비동기, AI 응답 생성 중에도 스레드를 점유하지 않음)
+class AsyncMessageListView(AsyncAPIView):
+
+    # 최근 메시지를 모두 넘기면 보관된 이전 메시지로 이어서 조회 (?archive_cursor=...)
+    # (DRF 메시지 목록의 MessageCursorPagination과 같은 순서/커서)
+    async def get(self, request, chat_room_pk):
+        archive_cursor = request.GET.get("archive_cursor")
+        if archive_cursor is None:
+            queryset = Message.objects.filter(
+                chat_room=chat_room_pk, chat_room__user=request.user
+            )
+            page = await keyset_page(request, queryset, "created_at")
+            if page is None:
+                return error_response(CursorPagination.invalid_cursor_message, 404)
+            if page["next"] is not None:
+                results = MessageSerializer(page.pop("items"), many=True).data
+                return JsonResponse({**page, "results": results})
+            items = page["items"]
+            before = (items[-1].created_at, items[-1].pk) if items else None
+        else:
+            # 보관 메시지 페이지는 이전 메시지 방향으로만 이동
+            try:
+                before = decode_cursor(archive_cursor)
+            except ValueError:
+                return error_response(CursorPagination.invalid_cursor_message, 404)
+            items = []
+
+        remaining = PAGE_SIZE - len(items)
+        archived = await sync_to_async(load_archived_messages)(
+            chat_room_pk, request.user, before, remaining + 1
+        )
+        items += archived[:remaining]
+        next_url = None
+        if len(archived) > remaining:
+            next_url = page_url(
+                request,
+                "archive_cursor",
+                encode_cursor(items[-1].created_at, items[-1].pk),
+            )
+        results = MessageSerializer(items, many=True).data
+        return JsonResponse({"next": next_url, "previous": None, "results": results})
+
+    async def post(self, request, chat_room_pk):
+        # 요청 제한은 DB 조회 전에 확인 (비동기 캐시 API로 이벤트 루프를 막지 않음)
+        throttle = get_chat_throttle()
+        wait = await throttle.aconsume(request.user.pk)
+        if wait:
+            return throttled_response(ChatThrottled(wait=wait))
+
+        try:
+            chat_room = await ChatRoom.objects.only(*CONTEXT_ROOM_FIELDS).aget(
+                pk=chat_room_pk, user=request.user
+            )
+        except ChatRoom.DoesNotExist:
+            return error_response(NotFound.default_detail, 404)
+
+        serializer = MessageSerializer(data=request.data)
+        if not serializer.is_valid():
+            return JsonResponse(serializer.errors, status=400)
+
+        content = serializer.validated_data["content"]
+        context, summary_updates = await sync_to_async(ChatContextBuilder().build)(
+            chat_room, content
+        )
+        try:
+            async with throttle.ageneration_slot():
+                reply = await get_dispatcher().generate(content, context)
+        except ChatThrottled as error:
+            return throttled_response(error)
+        except DispatcherBusy:
+            error = AIBackendBusy()
+            return error_response(error.detail, error.status_code)
+
+        # 사용자/AI 메시지를 하나의 INSERT로 저장하고 같은 트랜잭션에서 대화방 갱신
+        user_message = Message(
+            chat_room=chat_room, sender=Message.SenderType.USER, content=content
+        )
+        ai_message = Message(
+            chat_room=chat_room, sender=Message.SenderType.AI, content=reply
+        )
+        await sync_to_async(save_messages)(
+            chat_room, [user_message, ai_message], **summary_updates
+        )
+        publish_messages([user_message, ai_message])
+        return JsonResponse(MessageSerializer(user_message).data, status=201)
@@ -0,0 +1,11 @@
+# AI 응답 생성 백엔드 인터페이스
+class BaseChatBackend:
+
+    # 응답을 토큰 단위로 생성하는 비동기 이터레이터 (하위 클래스에서 구현)
+    # context는 이전 대화 요약, 최근 메시지와 관련 지식 구절 (chats.context.ChatContext)
+    def stream(self, prompt, context=None):
+        raise NotImplementedError("stream()을 구현해야 합니다.")
+
+    # 전체 응답을 한 번에 생성
+    async def generate(self, prompt, context=None):
+        return "".join([token async for token in self.stream(prompt, context)])
@@ -0,0 +1,136 @@
+import asyncio
+import threading
+import weakref
+from contextlib import asynccontextmanager
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+
+# 대기 시간 안에 생성 슬롯을 얻지 못한 경우
+class DispatcherBusy(Exception):
+    pass
+
+
+# 이벤트 루프별 동시 실행 제한과 진행 중인 생성 작업
+class _LoopState:
+
+    def __init__(self, max_concurrency):
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.in_flight = {}
+
+
+# 백엔드 호출의 동시 실행 수를 제한하고, 진행 중인 동일 요청은 하나로 합치는 디스패처
+# (asyncio 객체는 이벤트 루프에 묶이므로 루프별로 상태를 둠.
+#  ASGI 워커는 루프가 하나이므로 프로세스 단위 제한이 되고,
+#  동기 뷰는 generate_sync로 프로세스 공용 백그라운드 루프를 사용)
+class ChatDispatcher:
+
+    def __init__(self, backend, max_concurrency=8, queue_timeout=10.0):
+        self.backend = backend
+        self.max_concurrency = max_concurrency
+        self.queue_timeout = queue_timeout
+        self.coalesced = 0
+        self.rejected = 0
+        self._states = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def _state(self):
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            state = self._states.get(loop)
+            if state is None:
+                state = self._states[loop] = _LoopState(self.max_concurrency)
+            return state
+
+    # 생성 슬롯을 얻을 때까지 최대 queue_timeout초 대기
+    @asynccontextmanager
+    async def _slot(self, state):
+        try:
+            await asyncio.wait_for(state.semaphore.acquire(), self.queue_timeout)
+        except asyncio.TimeoutError:
+            self.rejected += 1
+            raise DispatcherBusy() from None
+        try:
+            yield
+        finally:
+            state.semaphore.release()
+
+    async def _generate(self, state, prompt, context):
+        async with self._slot(state):
+            return await self.backend.generate(prompt, context)
+
+    # 같은 프롬프트/컨텍스트의 생성이 진행 중이면 새로 호출하지 않고 그 결과를 함께 사용
+    async def generate(self, prompt, context=None):
+        state = self._state()
+        key = (prompt, context)
+        task = state.in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._generate(state, prompt, context))
+            state.in_flight[key] = task
+
+            def _done(finished):
+                if state.in_flight.get(key) is finished:
+                    del state.in_flight[key]
+
+            task.add_done_callback(_done)
+        else:
+            self.coalesced += 1
+
+        # 한 요청이 취소되어도 함께 기다리는 다른 요청의 생성은 계속 진행
+        return await asyncio.shield(task)
+
+    # 동기(WSGI) 뷰에서 호출 (요청마다 새 루프에서 실행하면 동시 실행 제한과
+    # 요청 병합이 적용되지 않으므로 공용 백그라운드 루프에 작업을 넘기고 결과를 기다림)
+    def generate_sync(self, prompt, context=None):
+        future = asyncio.run_coroutine_threadsafe(
+            self.generate(prompt, context), _background_loop()
+        )
+        return future.result()
+
+    # 토큰 스트리밍은 요청마다 따로 생성하되 동시 실행 제한은 동일하게 적용
+    async def stream(self, prompt, context=None):
+        async with self._slot(self._state()):
+            async for token in self.backend.stream(prompt, context):
+                yield token
+
+
+_loop = None
+_loop_lock = threading.Lock()
+
+
+# 동기 요청이 함께 사용하는 이벤트 루프 (데몬 스레드에서 계속 실행)
+def _background_loop():
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_loop.run_forever, name="chat-dispatcher", daemon=True
+            ).start()
+        return _loop
+
+
+_dispatcher = None
+_dispatcher_lock = threading.Lock()
+
+
+# settings.CHAT_AI_BACKEND 설정으로 생성한 프로세스 공용 디스패처
+def get_dispatcher():
+    global _dispatcher
+    with _dispatcher_lock:
+        if _dispatcher is None:
+            config = settings.CHAT_AI_BACKEND
+            backend = import_string(config["BACKEND"])(**config.get("OPTIONS", {}))
+            _dispatcher = ChatDispatcher(
+                backend,
+                max_concurrency=config.get("MAX_CONCURRENCY", 8),
+                queue_timeout=config.get("QUEUE_TIMEOUT", 10.0),
+            )
+        return _dispatcher
+
+
+def reset_dispatcher():
+    global _dispatcher
+    with _dispatcher_lock:
+        _dispatcher = None
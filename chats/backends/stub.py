@@ -0,0 +1,28 @@
+import asyncio
+import re
+
+from .base import BaseChatBackend
+
+_TOKEN = re.compile(r"\S+\s*")
+
+
+# 외부 모델 없이 동작하는 로컬 백엔드 (같은 입력에 항상 같은 응답, 지연 시간 설정 가능)
+class StubChatBackend(BaseChatBackend):
+
+    def __init__(self, reply="AI 응답: 기능 생성 예정", latency=0.0, token_delay=0.0):
+        self.reply = reply
+        self.latency = latency
+        self.token_delay = token_delay
+
+    # reply에 {prompt}가 있으면 입력 메시지로 치환
+    def reply_for(self, prompt):
+        return self.reply.replace("{prompt}", prompt)
+
+    async def stream(self, prompt, context=None):
+        # 첫 토큰까지의 지연
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        for token in _TOKEN.findall(self.reply_for(prompt)):
+            if self.token_delay:
+                await asyncio.sleep(self.token_delay)
+            yield token
@@ -0,0 +1,156 @@
+from typing import NamedTuple
+
+from django.conf import settings
+from django.db.models import Q
+
+from data_managements.knowledge import search_knowledge
+
+from .models import Message, estimate_tokens
+
+# 요약에 옮길 때 메시지별로 남기는 최대 글자 수
+SUMMARY_LINE_LENGTH = 200
+
+# 컨텍스트 구성에 필요한 ChatRoom 필드
+CONTEXT_ROOM_FIELDS = ("id", "user", "summary", "summary_until", "summary_until_id")
+
+
+# 메시지 토큰 수 (마이그레이션에서 아직 채우지 못한 이전 메시지는 직접 계산)
+def row_tokens(row):
+    return row[4] if row[4] is not None else estimate_tokens(row[3])
+
+
+# AI 백엔드에 전달할 대화 컨텍스트 (동일 요청 병합 키로 쓰이므로 hashable)
+class ChatContext(NamedTuple):
+    summary: str
+    messages: tuple
+    token_count: int
+    # 질문과 관련된 원료/제품 지식 구절 ((이름, 본문), ...) (응답 근거로 사용)
+    knowledge: tuple = ()
+
+
+# 요약 창에서 밀려난 메시지를 기존 요약 뒤에 이어 붙이고, 예산을 넘으면 오래된 줄부터 제거
+def fold_summary(summary, messages, max_tokens):
+    lines = summary.splitlines() if summary else []
+    for sender, content in messages:
+        label = Message.SenderType(sender).label
+        lines.append(f"{label}: {' '.join(content.split())[:SUMMARY_LINE_LENGTH]}")
+
+    total = sum(estimate_tokens(line) + 1 for line in lines)
+    start = 0
+    while start < len(lines) and total > max_tokens:
+        total -= estimate_tokens(lines[start]) + 1
+        start += 1
+    return "\n".join(lines[start:])
+
+
+# 토큰 예산에 맞는 최신 메시지만 조회하여 컨텍스트를 구성
+# (조회량은 대화방 크기가 아니라 예산에 비례)
+class ChatContextBuilder:
+
+    def __init__(
+        self,
+        token_budget=None,
+        summary_budget=None,
+        knowledge_budget=None,
+        knowledge_passages=None,
+        chunk_size=32,
+    ):
+        self.token_budget = token_budget or settings.CHAT_CONTEXT_TOKEN_BUDGET
+        self.summary_budget = summary_budget or settings.CHAT_SUMMARY_TOKEN_BUDGET
+        self.knowledge_budget = knowledge_budget or settings.CHAT_KNOWLEDGE_TOKEN_BUDGET
+        if knowledge_passages is None:
+            knowledge_passages = settings.CHAT_KNOWLEDGE_PASSAGES
+        self.knowledge_passages = knowledge_passages
+        self.chunk_size = chunk_size
+
+    # 질문과 관련된 지식 구절을 점수 순서로 knowledge_budget 이내만 사용
+    # (색인이 아직 생성되지 않았으면 빈 목록)
+    def _knowledge(self, prompt):
+        if not self.knowledge_passages:
+            return (), 0
+        passages, used = [], 0
+        for passage in search_knowledge(prompt, k=self.knowledge_passages):
+            tokens = estimate_tokens(passage.title) + estimate_tokens(passage.text)
+            if used + tokens > self.knowledge_budget:
+                break
+            passages.append((passage.title, passage.text))
+            used += tokens
+        return tuple(passages), used
+
+    def _unsummarized(self, chat_room):
+        queryset = Message.objects.filter(chat_room_id=chat_room.pk)
+        if chat_room.summary_until is not None:
+            queryset = queryset.filter(
+                Q(created_at__gt=chat_room.summary_until)
+                | Q(
+                    created_at=chat_room.summary_until,
+                    id__gt=chat_room.summary_until_id,
+                )
+            )
+        return queryset.order_by("-created_at", "-id").values_list(
+            "id", "created_at", "sender", "content", "token_count"
+        )
+
+    # 최신순으로 chunk_size개씩 읽으며 예산을 채우고, 넘친 메시지는 요약 대상으로 반환
+    def _collect(self, chat_room, budget):
+        queryset = self._unsummarized(chat_room)
+        included, overflow, used = [], [], 0
+        last = None
+        while True:
+            chunk = queryset
+            if last is not None:
+                chunk = chunk.filter(
+                    Q(created_at__lt=last[1]) | Q(created_at=last[1], id__lt=last[0])
+                )
+            rows = list(chunk[: self.chunk_size])
+            for index, row in enumerate(rows):
+                tokens = row_tokens(row)
+                if used + tokens > budget:
+                    # 예산을 넘은 이후 메시지는 이미 읽은 chunk 안에서만 요약에 반영
+                    overflow = rows[index:]
+                    return included, overflow, used
+                included.append(row)
+                used += tokens
+            if len(rows) < self.chunk_size:
+                return included, overflow, used
+            last = rows[-1]
+
+    # 컨텍스트와 ChatRoom에 저장할 요약 변경 사항(없으면 빈 dict)을 반환
+    # chat_room에는 CONTEXT_ROOM_FIELDS가 조회되어 있어야 함
+    def build(self, chat_room, prompt):
+        # 요약은 summary_budget 이내로 유지되므로 그만큼과 지식 구절을 미리 제외
+        summary = chat_room.summary
+        knowledge, knowledge_tokens = self._knowledge(prompt)
+        budget = max(
+            0,
+            self.token_budget
+            - self.summary_budget
+            - knowledge_tokens
+            - estimate_tokens(prompt),
+        )
+        included, overflow, used = self._collect(chat_room, budget)
+
+        updates = {}
+        if overflow:
+            # 가장 최근에 밀려난 메시지까지를 요약 경계로 기록
+            # (처음 요약하는 긴 대화방은 읽은 chunk 이전의 메시지를 건너뜀)
+            summary = fold_summary(
+                summary,
+                [(row[2], row[3]) for row in reversed(overflow)],
+                self.summary_budget,
+            )
+            updates = {
+                "summary": summary,
+                "summary_until": overflow[0][1],
+                "summary_until_id": overflow[0][0],
+            }
+            for field, value in updates.items():
+                setattr(chat_room, field, value)
+
+        context = ChatContext(
+            summary=summary,
+            messages=tuple((row[2], row[3]) for row in reversed(included)),
+            token_count=estimate_tokens(summary) + used + knowledge_tokens,
+            knowledge=knowledge,
+        )
+        return context, updates
@@ -0,0 +1,18 @@
+from rest_framework import status
+from rest_framework.exceptions import APIException, Throttled
+
+
+# AI 응답 생성 요청이 밀려 대기 시간 안에 처리하지 못한 경우
+class AIBackendBusy(APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = "AI 응답 요청이 많습니다. 잠시 후 다시 시도해주세요."
+    default_code = "ai_backend_busy"
+
+
+# AI 메시지 생성 요청 제한(사용자별 요청 수/전체 동시 생성 수)을 넘은 경우
+# (Retry-After 헤더는 DRF 예외 처리에서 wait 값으로 설정)
+class ChatThrottled(Throttled):
+    default_detail = "AI 메시지 요청이 너무 많습니다."
+    extra_detail_singular = "{wait}초 후에 다시 시도해주세요."
+    extra_detail_plural = "{wait}초 후에 다시 시도해주세요."
+    default_code = "chat_throttled"
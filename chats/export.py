@@ -0,0 +1,86 @@
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import timezone
+from rest_framework.renderers import BaseRenderer
+
+from .archive import decompress_messages
+from .models import Message, MessageArchive
+
+# 내보내는 메시지 필드 (MessageSerializer와 같은 키, chat_room은 별도로 추가)
+EXPORT_FIELDS = ("id", "sender", "message_type", "content", "token_count", "created_at")
+
+# 한 번에 전송할 최소 크기 (행마다 전송하지 않고 모아서 전송)
+EXPORT_BUFFER_SIZE = 64 * 1024
+
+
+def ndjson_line(data):
+    return json.dumps(data, cls=DjangoJSONEncoder, ensure_ascii=False) + "\n"
+
+
+# EXPORT_FIELDS 순서의 값을 MessageSerializer와 같은 키 순서의 JSON 한 줄로 변환
+# (행마다 DRF 필드/인코더를 거치지 않고 목록 API와 같은 형식을 직접 생성)
+def message_line(chat_room_id, values, tz):
+    pk, sender, message_type, content, token_count, created_at = values
+    created_at = created_at.astimezone(tz).isoformat()
+    if created_at.endswith("+00:00"):
+        created_at = created_at[:-6] + "Z"
+    record = {
+        "id": str(pk),
+        "chat_room": chat_room_id,
+        "sender": sender,
+        "message_type": message_type,
+        "content": content,
+        "token_count": token_count,
+        "created_at": created_at,
+    }
+    return json.dumps(record, ensure_ascii=False) + "\n"
+
+
+# NDJSON 내보내기 요청에서 발생한 오류 응답을 JSON 한 줄로 렌더링
+class NDJSONRenderer(BaseRenderer):
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return ndjson_line(data).encode(self.charset)
+
+
+def _message_lines(chat_room_id, chunk_size):
+    chat_room_id, tz = str(chat_room_id), timezone.get_current_timezone()
+
+    # 보관된 메시지가 항상 더 오래되었으므로 먼저 전송 (묶음 하나씩 압축 해제)
+    archives = (
+        MessageArchive.objects.filter(chat_room_id=chat_room_id)
+        .order_by("oldest_created_at")
+        .iterator(chunk_size=10)
+    )
+    for archive in archives:
+        for message in decompress_messages(archive):
+            values = [getattr(message, field) for field in EXPORT_FIELDS]
+            yield message_line(chat_room_id, values, tz)
+
+    # 서버 측 커서로 chunk_size개씩 읽어 메모리 사용량을 대화방 크기와 무관하게 유지
+    rows = (
+        Message.objects.filter(chat_room_id=chat_room_id)
+        .order_by("created_at", "id")
+        .values_list(*EXPORT_FIELDS)
+        .iterator(chunk_size=chunk_size)
+    )
+    for values in rows:
+        yield message_line(chat_room_id, values, tz)
+
+
+# 대화방의 전체 메시지를 오래된 순서의 NDJSON 조각으로 생성
+# 첫 메시지는 바로 전송하고, 이후에는 EXPORT_BUFFER_SIZE 단위로 모아서 전송
+def export_messages(chat_room_id, chunk_size=2000):
+    buffer, size, first = [], 0, True
+    for line in _message_lines(chat_room_id, chunk_size):
+        buffer.append(line)
+        size += len(line)
+        if first or size >= EXPORT_BUFFER_SIZE:
+            yield "".join(buffer)
+            buffer, size, first = [], 0, False
+    if buffer:
+        yield "".join(buffer)
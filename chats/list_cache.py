@@ -0,0 +1,109 @@
+import hashlib
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.response import Response
+
+from core.cache_versions import bump_versions, current_version
+
+
+def user_version_key(user_id):
+    return f"chat_list_version:user:{user_id}"
+
+
+def room_version_key(chat_room_id):
+    return f"chat_list_version:room:{chat_room_id}"
+
+
+# 캐시된 목록 페이지가 바뀌는 시점에 호출 (사용자 버전: 대화방 목록, 대화방 버전: 메시지 목록)
+def bump_list_versions(user_ids=(), chat_room_ids=()):
+    keys = [user_version_key(user_id) for user_id in user_ids]
+    keys += [room_version_key(chat_room_id) for chat_room_id in chat_room_ids]
+    bump_versions(keys, settings.CHAT_LIST_CACHE_TIMEOUT)
+
+
+# 프로세스 단위 목록별 캐시 적중/미스/우회 통계
+class ChatListCacheStats:
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.counts = {}
+            self.build_seconds_total = {}
+
+    def _record(self, name, field, seconds=0.0):
+        with self._lock:
+            counts = self.counts.setdefault(
+                name, {"hits": 0, "misses": 0, "bypasses": 0}
+            )
+            counts[field] += 1
+            if seconds:
+                self.build_seconds_total[name] = (
+                    self.build_seconds_total.get(name, 0.0) + seconds
+                )
+
+    def record_hit(self, name):
+        self._record(name, "hits")
+
+    def record_miss(self, name, seconds):
+        self._record(name, "misses", seconds)
+
+    def record_bypass(self, name):
+        self._record(name, "bypasses")
+
+    def snapshot(self):
+        with self._lock:
+            snapshot = {}
+            for name, counts in self.counts.items():
+                cacheable = counts["hits"] + counts["misses"]
+                snapshot[name] = {
+                    **counts,
+                    "hit_rate": counts["hits"] / cacheable if cacheable else 0.0,
+                    "build_avg_ms": (
+                        self.build_seconds_total.get(name, 0.0)
+                        / counts["misses"]
+                        * 1000
+                        if counts["misses"]
+                        else 0.0
+                    ),
+                }
+            return snapshot
+
+
+stats = ChatListCacheStats()
+
+
+# 목록의 첫 페이지 응답을 버전 키 아래에 캐시하는 viewset mixin
+# cursor/검색어 등 쿼리 파라미터가 있는 요청은 캐시를 거치지 않음
+class CachedFirstPageMixin:
+    list_cache_name = None
+
+    # 캐시된 페이지를 무효화하는 버전 키
+    def get_list_version_key(self):
+        raise NotImplementedError
+
+    def list(self, request, *args, **kwargs):
+        if request.query_params:
+            stats.record_bypass(self.list_cache_name)
+            return super().list(request, *args, **kwargs)
+
+        version_key = self.get_list_version_key()
+        version = current_version(version_key, settings.CHAT_LIST_CACHE_TIMEOUT)
+        url = hashlib.md5(request.build_absolute_uri().encode()).hexdigest()
+        key = f"chat_list:{self.list_cache_name}:{version_key}:{version}:{url}"
+        data = cache.get(key)
+        if data is not None:
+            stats.record_hit(self.list_cache_name)
+            return Response(data)
+
+        started = time.perf_counter()
+        response = super().list(request, *args, **kwargs)
+        stats.record_miss(self.list_cache_name, time.perf_counter() - started)
+        if response.status_code == 200:
+            cache.set(key, response.data, settings.CHAT_LIST_CACHE_TIMEOUT)
+        return response
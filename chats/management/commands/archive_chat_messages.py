@@ -0,0 +1,50 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from chats.archive import MessageArchiver
+
+
+class Command(BaseCommand):
+    help = (
+        "오래 사용하지 않은 대화방의 메시지를 대화방별 압축 묶음으로 "
+        "보관 테이블에 옮깁니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            help="마지막 대화 이후 경과 일수 (기본값: settings.CHAT_ARCHIVE_INACTIVE_DAYS)",
+        )
+        parser.add_argument(
+            "--keep-recent",
+            type=int,
+            default=20,
+            help="대화방별로 남겨 둘 최근 메시지 수",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="보관 묶음 하나(트랜잭션 하나)에 담을 메시지 수",
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write(self.style.SUCCESS("메시지 보관 작업을 시작합니다."))
+
+        archiver = MessageArchiver(
+            inactive_days=options["days"],
+            keep_recent=options["keep_recent"],
+            batch_size=options["batch_size"],
+        )
+        started = time.perf_counter()
+        rooms, messages, archives = archiver.run()
+        elapsed = time.perf_counter() - started
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"보관 완료. 대화방: {rooms}개, 메시지: {messages}개, "
+                f"보관 묶음: {archives}개 ({elapsed:.2f}초)"
+            )
+        )
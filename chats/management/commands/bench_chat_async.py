@@ -0,0 +1,116 @@
+import asyncio
+import statistics
+import time
+import uuid
+
+import httpx
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework_simplejwt.tokens import AccessToken
+
+from accounts.models import User
+from backend.asgi import application
+from chats.models import ChatRoom, Message
+from chats.throttles import reset_chat_throttle
+
+
+class Command(BaseCommand):
+    help = (
+        "ASGI 앱에서 동기(DRF) 채팅 API와 비동기 채팅 API의 동시 접속 처리량을 비교합니다. "
+        "AI 응답 지연은 CHAT_AI_STUB_LATENCY 환경 변수로 설정합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--connections", type=int, default=50, help="동시 접속 수")
+        parser.add_argument(
+            "--requests", type=int, default=500, help="엔드포인트별 요청 수"
+        )
+        parser.add_argument(
+            "--messages", type=int, default=100, help="미리 생성할 메시지 수"
+        )
+
+    def handle(self, *args, **options):
+        # 측정용 임시 사용자/채팅방 생성 (측정 후 삭제)
+        user = User.objects.create_user(
+            email=f"bench-{uuid.uuid4().hex}@example.com",
+            password=uuid.uuid4().hex,
+            nickname=f"bench-{uuid.uuid4().hex[:12]}",
+        )
+        try:
+            chat_room = ChatRoom.objects.create(user=user, title="benchmark")
+            Message.objects.bulk_create(
+                Message(chat_room=chat_room, content=f"메시지 {i}")
+                for i in range(options["messages"])
+            )
+            token = str(AccessToken.for_user(user))
+            targets = [
+                ("sync", "chat_message-list", {"chat_room_pk": chat_room.pk}),
+                ("async", "async_chat_message-list", {"chat_room_pk": chat_room.pk}),
+            ]
+            # 한 사용자로 대량 요청하므로 AI 메시지 요청 제한은 끄고 측정
+            # (ALLOWED_HOSTS가 비어 있거나 와일드카드여도 요청하도록 testserver 호스트 사용)
+            with override_settings(
+                CHAT_THROTTLE={"RATE": None, "MAX_CONCURRENT": None},
+                ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"],
+            ):
+                reset_chat_throttle()
+                for method in ("GET", "POST"):
+                    for label, name, kwargs in targets:
+                        result = asyncio.run(
+                            self.run_load(
+                                method,
+                                reverse(name, kwargs=kwargs),
+                                token,
+                                options["connections"],
+                                options["requests"],
+                            )
+                        )
+                        self.report(f"{method} {label}", result)
+        finally:
+            reset_chat_throttle()
+            user.delete()
+
+    # connections개의 동시 클라이언트가 총 requests개의 요청을 보내고 결과를 집계
+    async def run_load(self, method, path, token, connections, requests):
+        transport = httpx.ASGITransport(app=application)
+        headers = {"Authorization": f"Bearer {token}"}
+        remaining = iter(range(requests))
+        latencies = []
+        errors = 0
+
+        async with httpx.AsyncClient(
+            transport=transport,
+            base_url="http://testserver",
+            headers=headers,
+        ) as client:
+
+            async def worker():
+                nonlocal errors
+                for i in remaining:
+                    started = time.perf_counter()
+                    if method == "POST":
+                        response = await client.post(
+                            path, json={"content": f"벤치마크 메시지 {i}"}
+                        )
+                    else:
+                        response = await client.get(path)
+                    latencies.append((time.perf_counter() - started) * 1000)
+                    if response.status_code >= 400:
+                        errors += 1
+
+            started = time.perf_counter()
+            await asyncio.gather(*[worker() for _ in range(connections)])
+            elapsed = time.perf_counter() - started
+
+        return {"elapsed": elapsed, "latencies": latencies, "errors": errors}
+
+    def report(self, label, result):
+        latencies = sorted(result["latencies"])
+        p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+        self.stdout.write(
+            f"{label:<10} {len(latencies) / result['elapsed']:8.1f} req/s, "
+            f"p50 {statistics.median(latencies):7.1f}ms, p99 {p99:7.1f}ms, "
+            f"오류 {result['errors']}건"
+        )
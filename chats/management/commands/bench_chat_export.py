@@ -0,0 +1,103 @@
+import time
+import tracemalloc
+import uuid
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from accounts.models import User
+from chats.management.commands.bench_chat_pagination import SEED_SQL
+from chats.models import ChatRoom, Message
+from chats.views import MessageViewSet
+
+
+class Command(BaseCommand):
+    help = (
+        "대화방 하나에 메시지를 대량으로 생성한 뒤 NDJSON 내보내기의 "
+        "첫 응답 시간, 전체 시간, 최대 메모리 사용량을 측정합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--messages", type=int, default=300_000, help="생성할 메시지 수"
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=200_000, help="INSERT 배치 크기"
+        )
+        parser.add_argument(
+            "--keep", action="store_true", help="측정 후 생성한 데이터를 유지"
+        )
+
+    def handle(self, *args, **options):
+        user = User.objects.create_user(
+            email=f"bench-{uuid.uuid4().hex}@example.com",
+            password=uuid.uuid4().hex,
+            nickname=f"bench-{uuid.uuid4().hex[:12]}",
+        )
+        chat_room = ChatRoom.objects.create(user=user, title="export benchmark")
+        try:
+            self.seed(chat_room, options["messages"], options["batch_size"])
+            self.measure(user, chat_room)
+        finally:
+            if options["keep"]:
+                self.stdout.write(f"데이터 유지: 대화방 {chat_room.pk}")
+            else:
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        f'DELETE FROM "{Message._meta.db_table}" '
+                        f'WHERE "chat_room_id" = %s',
+                        [chat_room.pk],
+                    )
+                user.delete()
+
+    def seed(self, chat_room, total, batch_size):
+        started = time.perf_counter()
+        with connection.cursor() as cursor:
+            for start in range(1, total + 1, batch_size):
+                cursor.execute(
+                    SEED_SQL,
+                    {
+                        "now": chat_room.created_at,
+                        "chat_room_id": chat_room.pk,
+                        "start": start,
+                        "stop": min(start + batch_size - 1, total),
+                    },
+                )
+            cursor.execute(f'ANALYZE "{Message._meta.db_table}"')
+        self.stdout.write(
+            f"메시지 {total}건 생성: {time.perf_counter() - started:.1f}초"
+        )
+
+    # 응답 본문을 끝까지 읽으면서 첫 조각까지의 시간 측정
+    # (tracemalloc은 실행 시간을 늘리므로 최대 메모리 사용량은 한 번 더 읽어서 측정)
+    def measure(self, user, chat_room):
+        first_chunk, elapsed, size, lines = self.export(user, chat_room)
+        tracemalloc.start()
+        self.export(user, chat_room)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        self.stdout.write(
+            f"메시지 {lines}건, {size / 1024 / 1024:.1f}MB: "
+            f"첫 응답 {first_chunk * 1000:.1f}ms, 전체 {elapsed:.2f}초, "
+            f"최대 메모리 {peak / 1024 / 1024:.1f}MB"
+        )
+
+    def export(self, user, chat_room):
+        request = APIRequestFactory().get(
+            f"/api/v1/chats/rooms/{chat_room.pk}/messages/export/"
+        )
+        force_authenticate(request, user=user)
+        view = MessageViewSet.as_view({"get": "export"})
+
+        started = time.perf_counter()
+        response = view(request, chat_room_pk=str(chat_room.pk))
+        first_chunk = None
+        size = lines = 0
+        for chunk in response.streaming_content:
+            if first_chunk is None:
+                first_chunk = time.perf_counter() - started
+            size += len(chunk)
+            lines += chunk.count(b"\n")
+        return first_chunk, time.perf_counter() - started, size, lines
@@ -0,0 +1,138 @@
+import statistics
+import time
+import uuid
+from urllib.parse import parse_qs, urlparse
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from rest_framework.pagination import Cursor
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from accounts.models import User
+from chats.models import ChatRoom, Message
+from chats.views import MessageCursorPagination, MessageViewSet
+
+# 대화방 하나에 메시지를 대량으로 생성 (두 건씩 같은 시각으로 만들어 id 정렬 기준도 사용)
+SEED_SQL = """
+INSERT INTO "chats_message"
+    ("id", "created_at", "updated_at", "chat_room_id", "sender", "message_type", "content")
+SELECT
+    gen_random_uuid(),
+    %(now)s - (g / 2) * INTERVAL '1 second',
+    %(now)s - (g / 2) * INTERVAL '1 second',
+    %(chat_room_id)s,
+    CASE WHEN g %% 2 = 0 THEN 'user' ELSE 'ai' END,
+    'text',
+    'benchmark message ' || g
+FROM generate_series(%(start)s, %(stop)s) AS g
+"""
+
+
+class Command(BaseCommand):
+    help = (
+        "대화방 하나에 메시지를 대량으로 생성한 뒤 "
+        "cursor pagination 페이지 깊이별 응답 지연 시간(p50/p99)을 측정합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--messages", type=int, default=2_000_000, help="생성할 메시지 수"
+        )
+        parser.add_argument(
+            "--depths",
+            default="1,10,100,1000,10000,100000",
+            help="측정할 페이지 깊이 (쉼표로 구분)",
+        )
+        parser.add_argument("--samples", type=int, default=50, help="깊이별 측정 횟수")
+        parser.add_argument(
+            "--batch-size", type=int, default=200_000, help="INSERT 배치 크기"
+        )
+        parser.add_argument(
+            "--keep", action="store_true", help="측정 후 생성한 데이터를 유지"
+        )
+
+    def handle(self, *args, **options):
+        user = User.objects.create_user(
+            email=f"bench-{uuid.uuid4().hex}@example.com",
+            password=uuid.uuid4().hex,
+            nickname=f"bench-{uuid.uuid4().hex[:12]}",
+        )
+        chat_room = ChatRoom.objects.create(user=user, title="pagination benchmark")
+        try:
+            self.seed(chat_room, options["messages"], options["batch_size"])
+            depths = [int(depth) for depth in options["depths"].split(",")]
+            for depth in depths:
+                latencies = self.measure(user, chat_room, depth, options["samples"])
+                if latencies is None:
+                    self.stdout.write(f"깊이 {depth:>7}: 메시지 수보다 깊은 페이지")
+                    continue
+                p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+                self.stdout.write(
+                    f"깊이 {depth:>7}: p50 {statistics.median(latencies):7.2f}ms, "
+                    f"p99 {p99:7.2f}ms"
+                )
+        finally:
+            if options["keep"]:
+                self.stdout.write(f"데이터 유지: 대화방 {chat_room.pk}")
+            else:
+                # 대량 삭제는 ORM의 연쇄 삭제 대신 SQL 한 번으로 처리
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        f'DELETE FROM "{Message._meta.db_table}" '
+                        f'WHERE "chat_room_id" = %s',
+                        [chat_room.pk],
+                    )
+                user.delete()
+
+    def seed(self, chat_room, total, batch_size):
+        started = time.perf_counter()
+        now = chat_room.created_at
+        with connection.cursor() as cursor:
+            for start in range(1, total + 1, batch_size):
+                cursor.execute(
+                    SEED_SQL,
+                    {
+                        "now": now,
+                        "chat_room_id": chat_room.pk,
+                        "start": start,
+                        "stop": min(start + batch_size - 1, total),
+                    },
+                )
+            cursor.execute(f'ANALYZE "{Message._meta.db_table}"')
+        self.stdout.write(
+            f"메시지 {total}건 생성: {time.perf_counter() - started:.1f}초"
+        )
+
+    # depth번째 페이지를 가리키는 cursor로 목록 API를 호출하여 지연 시간 측정
+    def measure(self, user, chat_room, depth, samples):
+        paginator = MessageCursorPagination()
+        factory = APIRequestFactory()
+        view = MessageViewSet.as_view({"get": "list"})
+        path = f"/api/v1/chats/rooms/{chat_room.pk}/messages/"
+        data = {}
+
+        # 이전 페이지의 마지막 메시지 시각을 cursor 위치로 사용
+        offset = (depth - 1) * paginator.page_size
+        if offset:
+            boundary = list(
+                Message.objects.filter(chat_room=chat_room)
+                .order_by(*paginator.ordering)
+                .values_list("created_at", flat=True)[offset - 1 : offset]
+            )
+            if not boundary:
+                return None
+            paginator.base_url = path
+            url = paginator.encode_cursor(
+                Cursor(offset=0, reverse=False, position=str(boundary[0]))
+            )
+            data["cursor"] = parse_qs(urlparse(url).query)["cursor"][0]
+
+        latencies = []
+        for _ in range(samples):
+            request = factory.get(path, data)
+            force_authenticate(request, user=user)
+            started = time.perf_counter()
+            response = view(request, chat_room_pk=str(chat_room.pk))
+            latencies.append((time.perf_counter() - started) * 1000)
+            assert response.status_code == 200, response.data
+        return sorted(latencies)
@@ -0,0 +1,166 @@
+import statistics
+import time
+import uuid
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from accounts.models import User
+from chats.models import ChatRoom, Message
+from chats.views import MessageSearchView
+
+# 조사가 붙거나 다른 단어와 붙어 쓴 형태를 포함한 검색용 어휘
+WORDS = [
+    "비타민을",
+    "비타민D는",
+    "종합비타민은",
+    "오메가3",
+    "유산균이",
+    "마그네슘을",
+    "아연은",
+    "루테인",
+    "철분제를",
+    "칼슘과",
+    "홍삼은",
+    "프로바이오틱스",
+    "콜라겐",
+    "하루에",
+    "얼마나",
+    "먹어도",
+    "되나요",
+    "같이",
+    "복용하면",
+    "부작용이",
+    "있나요",
+    "공복에",
+    "식후에",
+    "피로",
+    "면역력",
+    "수면",
+]
+
+# 단어 5~12개로 이루어진 메시지를 대화방들에 고르게 생성
+SEED_SQL = """
+INSERT INTO "chats_message"
+    ("id", "created_at", "updated_at", "chat_room_id", "sender", "message_type", "content")
+SELECT
+    gen_random_uuid(),
+    %(now)s - g * INTERVAL '1 second',
+    %(now)s - g * INTERVAL '1 second',
+    (%(room_ids)s::uuid[])[1 + g %% array_length(%(room_ids)s::uuid[], 1)],
+    CASE WHEN g %% 2 = 0 THEN 'user' ELSE 'ai' END,
+    'text',
+    (
+        SELECT string_agg(
+            (%(words)s::text[])[1 + floor(random() * array_length(%(words)s::text[], 1))::int],
+            ' '
+        )
+        FROM generate_series(1, 5 + g %% 8)
+    )
+FROM generate_series(%(start)s, %(stop)s) AS g
+"""
+
+QUERIES = [
+    "비타민",
+    "오메가3 부작용",
+    "루테인 공복",
+    "프로바이오틱스 수면 면역력",
+    # 어느 메시지에도 없는 검색어
+    "크레아틴",
+]
+
+
+class Command(BaseCommand):
+    help = (
+        "한 사용자에게 메시지를 대량으로 생성한 뒤 "
+        "메시지 검색 API의 검색어별 응답 지연 시간(p50/p99)을 측정합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--messages", type=int, default=100_000, help="사용자 메시지 수"
+        )
+        parser.add_argument(
+            "--other-messages",
+            type=int,
+            default=100_000,
+            help="다른 사용자 메시지 수",
+        )
+        parser.add_argument("--rooms", type=int, default=50, help="사용자별 대화방 수")
+        parser.add_argument(
+            "--samples", type=int, default=50, help="검색어별 측정 횟수"
+        )
+
+    def handle(self, *args, **options):
+        users = [self.create_user() for _ in range(2)]
+        try:
+            started = time.perf_counter()
+            for user, total in zip(
+                users, [options["messages"], options["other_messages"]]
+            ):
+                self.seed(user, options["rooms"], total)
+            with connection.cursor() as cursor:
+                cursor.execute(f'ANALYZE "{Message._meta.db_table}"')
+            self.stdout.write(f"메시지 생성: {time.perf_counter() - started:.1f}초")
+
+            for query in QUERIES:
+                latencies, count = self.measure(users[0], query, options["samples"])
+                p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+                self.stdout.write(
+                    f"{query:<24} p50 {statistics.median(latencies):7.2f}ms, "
+                    f"p99 {p99:7.2f}ms (첫 페이지 {count}건)"
+                )
+        finally:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f'DELETE FROM "{Message._meta.db_table}" WHERE "chat_room_id" IN '
+                    f'(SELECT "id" FROM "{ChatRoom._meta.db_table}" '
+                    f'WHERE "user_id" = ANY(%s))',
+                    [[user.pk for user in users]],
+                )
+            for user in users:
+                user.delete()
+
+    def create_user(self):
+        return User.objects.create_user(
+            email=f"bench-{uuid.uuid4().hex}@example.com",
+            password=uuid.uuid4().hex,
+            nickname=f"bench-{uuid.uuid4().hex[:12]}",
+        )
+
+    def seed(self, user, rooms, total, batch_size=50_000):
+        room_ids = [
+            room.pk
+            for room in ChatRoom.objects.bulk_create(
+                ChatRoom(user=user, title=f"검색 벤치마크 {i}") for i in range(rooms)
+            )
+        ]
+        now = timezone.now()
+        with connection.cursor() as cursor:
+            for start in range(1, total + 1, batch_size):
+                cursor.execute(
+                    SEED_SQL,
+                    {
+                        "now": now,
+                        "room_ids": room_ids,
+                        "words": WORDS,
+                        "start": start,
+                        "stop": min(start + batch_size - 1, total),
+                    },
+                )
+
+    def measure(self, user, query, samples):
+        factory = APIRequestFactory()
+        view = MessageSearchView.as_view()
+        latencies = []
+        for _ in range(samples):
+            request = factory.get("/api/v1/chats/messages/search/", {"q": query})
+            force_authenticate(request, user=user)
+            started = time.perf_counter()
+            response = view(request)
+            response.render()
+            latencies.append((time.perf_counter() - started) * 1000)
+            assert response.status_code == 200, response.data
+        return sorted(latencies), len(response.data["results"])
@@ -0,0 +1,76 @@
+import time
+import uuid
+from types import SimpleNamespace
+
+from django.core.management.base import BaseCommand
+
+from chats.throttles import (
+    ChatMessageRateThrottle,
+    ChatThrottle,
+    get_chat_throttle,
+    reset_chat_throttle,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "AI 메시지 요청 제한(사용자별 토큰 버킷, 전체 동시 생성 수)의 "
+        "요청당 처리 시간을 설정된 캐시 백엔드로 측정합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--iterations", type=int, default=100_000, help="항목별 반복 횟수"
+        )
+        parser.add_argument(
+            "--users",
+            type=int,
+            default=10_000,
+            help="허용 경로 측정에 사용할 사용자 수",
+        )
+
+    def handle(self, *args, **options):
+        iterations = options["iterations"]
+        users = [uuid.uuid4() for _ in range(options["users"])]
+        throttle = ChatThrottle(rate="1000/s", burst=1000, max_concurrent=10**9)
+
+        # 허용: 캐시 조회 + 저장 (사용자를 바꿔 가며 토큰이 남아 있는 상태로 측정)
+        self.report(
+            "토큰 버킷 허용",
+            iterations,
+            lambda i: throttle.consume(users[i % len(users)]),
+        )
+
+        # 거절: 프로세스 안에 기억한 거절 시각만 확인 (캐시를 거치지 않음)
+        denied = ChatThrottle(rate="1/d", burst=1)
+        denied.consume("abusive")
+        denied.consume("abusive")
+        self.report("토큰 버킷 거절", iterations, lambda i: denied.consume("abusive"))
+
+        def slot(i):
+            with throttle.generation_slot():
+                pass
+
+        self.report("동시 생성 슬롯 점유/반환", iterations, slot)
+
+        # DRF throttle 클래스 경유 (settings.CHAT_THROTTLE 설정 사용)
+        reset_chat_throttle()
+        get_chat_throttle()
+        requests = [
+            SimpleNamespace(method="POST", user=SimpleNamespace(pk=user))
+            for user in users
+        ]
+        drf_throttle = ChatMessageRateThrottle()
+        self.report(
+            "DRF throttle (설정값)",
+            iterations,
+            lambda i: drf_throttle.allow_request(requests[i % len(requests)], None),
+        )
+        reset_chat_throttle()
+
+    def report(self, label, iterations, operation):
+        started = time.perf_counter()
+        for i in range(iterations):
+            operation(i)
+        elapsed = time.perf_counter() - started
+        self.stdout.write(f"{label:<20} {elapsed / iterations * 1_000_000:7.2f}µs/요청")
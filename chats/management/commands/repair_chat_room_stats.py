@@ -0,0 +1,31 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from chats.room_stats import repair_room_stats
+
+
+class Command(BaseCommand):
+    help = (
+        "대화방의 마지막 메시지 미리보기/시각과 메시지 수를 "
+        "메시지 테이블(보관된 메시지 포함) 기준으로 다시 계산합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="UPDATE 한 번(트랜잭션 하나)에 처리할 대화방 수",
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write(self.style.SUCCESS("대화방 통계 재계산을 시작합니다."))
+
+        started = time.perf_counter()
+        repaired = repair_room_stats(batch_size=options["batch_size"])
+        elapsed = time.perf_counter() - started
+
+        self.stdout.write(
+            self.style.SUCCESS(f"재계산 완료. 대화방: {repaired}개 ({elapsed:.2f}초)")
+        )
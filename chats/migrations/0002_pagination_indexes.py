@@ -0,0 +1,26 @@
+# Generated by Django 5.2 on 2026-10-19 15:42
+
+from django.conf import settings
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # 운영 중인 메시지 테이블을 잠그지 않도록 인덱스를 CONCURRENTLY로 생성
+    atomic = False
+
+    dependencies = [
+        ('chats', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='chatroom',
+            index=models.Index(fields=['user', '-updated_at', '-id'], name='chatroom_user_updated_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='message',
+            index=models.Index(fields=['chat_room', '-created_at', '-id'], name='message_room_created_idx'),
+        ),
+    ]
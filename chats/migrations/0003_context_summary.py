@@ -0,0 +1,64 @@
+# Generated by Django 5.2 on 2026-10-19 15:45
+
+from django.db import migrations, models
+
+BACKFILL_SQL = """
+WITH batch AS (
+    SELECT "id" FROM "chats_message"
+    WHERE %s::uuid IS NULL OR "id" > %s::uuid
+    ORDER BY "id"
+    LIMIT %s
+)
+UPDATE "chats_message" AS message
+SET "token_count" = (OCTET_LENGTH(message."content") + 3) / 4
+FROM batch
+WHERE message."id" = batch."id"
+RETURNING message."id"
+"""
+
+
+# 기존 메시지의 토큰 수를 id 순서로 나누어 채움 (chats.models.estimate_tokens와 같은 계산식,
+# 배치마다 자동 커밋되어 행 잠금이 짧게 유지됨)
+def backfill_token_count(apps, schema_editor, batch_size=5000):
+    last_id = None
+    with schema_editor.connection.cursor() as cursor:
+        while True:
+            cursor.execute(BACKFILL_SQL, [last_id, last_id, batch_size])
+            ids = [row[0] for row in cursor.fetchall()]
+            if not ids:
+                return
+            last_id = max(ids)
+
+
+class Migration(migrations.Migration):
+    # 메시지 테이블을 다시 쓰지 않도록 토큰 수는 NULL 허용 컬럼으로 추가하고
+    # (CHECK 제약 검사를 피하려고 PositiveIntegerField 대신 IntegerField) 기존 행은 배치로 채움
+    atomic = False
+
+    dependencies = [
+        ('chats', '0002_pagination_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='chatroom',
+            name='summary',
+            field=models.TextField(blank=True, verbose_name='이전 대화 요약'),
+        ),
+        migrations.AddField(
+            model_name='chatroom',
+            name='summary_until',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='요약된 마지막 메시지 시각'),
+        ),
+        migrations.AddField(
+            model_name='chatroom',
+            name='summary_until_id',
+            field=models.UUIDField(blank=True, null=True, verbose_name='요약된 마지막 메시지 ID'),
+        ),
+        migrations.AddField(
+            model_name='message',
+            name='token_count',
+            field=models.IntegerField(editable=False, null=True, verbose_name='토큰 수'),
+        ),
+        migrations.RunPython(backfill_token_count, migrations.RunPython.noop),
+    ]
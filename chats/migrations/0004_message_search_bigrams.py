@@ -0,0 +1,87 @@
+# Generated by Django 5.2 on 2026-10-19 15:52
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+# 메시지 내용을 공백/ASCII 문장부호로 나눈 단어별 글자 2-gram 목록 (1글자 단어는 그대로)
+# (chats.search.SEPARATORS와 같은 구분자를 사용)
+CREATE_BIGRAMS_SQL = r"""
+CREATE FUNCTION message_search_bigrams(content text) RETURNS text[]
+LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+    SELECT coalesce(array_agg(DISTINCT substr(word, i, 2)), '{}')
+    FROM regexp_split_to_table(lower(content), '[\s!-/:-@\[-`{-~]+') AS word,
+        generate_series(1, greatest(length(word) - 1, 1)) AS i
+    WHERE word <> ''
+$$;
+
+CREATE FUNCTION message_search_bigrams_trigger() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    NEW."search_bigrams" := message_search_bigrams(NEW."content");
+    RETURN NEW;
+END
+$$;
+
+CREATE TRIGGER "message_search_bigrams"
+    BEFORE INSERT OR UPDATE OF "content" ON "chats_message"
+    FOR EACH ROW EXECUTE FUNCTION message_search_bigrams_trigger();
+"""
+
+DROP_BIGRAMS_SQL = """
+DROP TRIGGER IF EXISTS "message_search_bigrams" ON "chats_message";
+DROP FUNCTION IF EXISTS message_search_bigrams_trigger();
+DROP FUNCTION IF EXISTS message_search_bigrams(text);
+"""
+
+BACKFILL_SQL = """
+WITH batch AS (
+    SELECT "id" FROM "chats_message"
+    WHERE %s::uuid IS NULL OR "id" > %s::uuid
+    ORDER BY "id"
+    LIMIT %s
+)
+UPDATE "chats_message" AS message
+SET "search_bigrams" = message_search_bigrams(message."content")
+FROM batch
+WHERE message."id" = batch."id"
+RETURNING message."id"
+"""
+
+
+# 기존 메시지는 id 순서로 나누어 채움 (배치마다 자동 커밋되어 행 잠금이 짧게 유지됨)
+def backfill_search_bigrams(apps, schema_editor, batch_size=5000):
+    last_id = None
+    with schema_editor.connection.cursor() as cursor:
+        while True:
+            cursor.execute(BACKFILL_SQL, [last_id, last_id, batch_size])
+            ids = [row[0] for row in cursor.fetchall()]
+            if not ids:
+                return
+            last_id = max(ids)
+
+
+class Migration(migrations.Migration):
+    # NULL 허용 컬럼 추가는 테이블을 다시 쓰지 않고, 기존 행은 배치로 채운 뒤
+    # 인덱스를 CONCURRENTLY로 생성하여 메시지 테이블을 오래 잠그지 않음
+    # (컬럼/트리거 추가 시에만 짧은 테이블 잠금이 필요)
+    atomic = False
+
+    dependencies = [
+        ('chats', '0003_context_summary'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='message',
+            name='search_bigrams',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.CharField(max_length=2), editable=False, null=True, size=None, verbose_name='검색 2-gram'),
+        ),
+        migrations.RunSQL(CREATE_BIGRAMS_SQL, DROP_BIGRAMS_SQL),
+        migrations.RunPython(backfill_search_bigrams, migrations.RunPython.noop),
+        AddIndexConcurrently(
+            model_name='message',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_bigrams'], name='message_search_bigrams_idx'),
+        ),
+    ]
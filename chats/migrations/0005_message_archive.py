@@ -0,0 +1,33 @@
+# Generated by Django 5.2 on 2026-10-19 16:04
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chats', '0004_message_search_bigrams'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MessageArchive',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('oldest_created_at', models.DateTimeField(verbose_name='가장 오래된 메시지 시각')),
+                ('newest_created_at', models.DateTimeField(verbose_name='가장 최근 메시지 시각')),
+                ('message_count', models.PositiveIntegerField(verbose_name='메시지 수')),
+                ('data', models.BinaryField(verbose_name='압축된 메시지 목록')),
+                ('chat_room', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='message_archives', to='chats.chatroom', verbose_name='대화방')),
+            ],
+            options={
+                'verbose_name': '보관 메시지 묶음',
+                'verbose_name_plural': '보관 메시지 묶음 목록',
+                'indexes': [models.Index(fields=['chat_room', '-newest_created_at'], name='message_archive_room_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,96 @@
+# Generated by Django 5.2 on 2026-10-19 16:31
+
+import json
+import zlib
+
+from django.db import migrations, models
+
+# 대화방별 메시지 수(보관된 메시지 포함)와 가장 최근 메시지의 시각/미리보기
+# (chats.room_stats.repair_room_stats와 같은 계산)
+BACKFILL_SQL = """
+WITH batch AS (
+    SELECT "id" FROM "chats_chatroom"
+    WHERE %s::uuid IS NULL OR "id" > %s::uuid
+    ORDER BY "id"
+    LIMIT %s
+)
+UPDATE "chats_chatroom" AS room
+SET
+    "message_count" = (
+        SELECT count(*) FROM "chats_message" WHERE "chat_room_id" = room."id"
+    ) + coalesce((
+        SELECT sum("message_count") FROM "chats_messagearchive"
+        WHERE "chat_room_id" = room."id"
+    ), 0),
+    "last_message_at" = (
+        SELECT "created_at" FROM "chats_message" WHERE "chat_room_id" = room."id"
+        ORDER BY "created_at" DESC, "id" DESC LIMIT 1
+    ),
+    "last_message_preview" = coalesce((
+        SELECT left("content", 100) FROM "chats_message"
+        WHERE "chat_room_id" = room."id"
+        ORDER BY "created_at" DESC, "id" DESC LIMIT 1
+    ), '')
+FROM batch
+WHERE room."id" = batch."id"
+RETURNING room."id"
+"""
+
+
+# 기존 대화방의 통계를 id 순서로 나누어 채움 (배치마다 자동 커밋되어 행 잠금이 짧게 유지됨)
+# 마이그레이션 도중 이전 코드가 저장한 메시지는 repair_chat_room_stats로 다시 계산
+def backfill_room_stats(apps, schema_editor, batch_size=1000):
+    ChatRoom = apps.get_model('chats', 'ChatRoom')
+    MessageArchive = apps.get_model('chats', 'MessageArchive')
+    last_id = None
+    with schema_editor.connection.cursor() as cursor:
+        while True:
+            cursor.execute(BACKFILL_SQL, [last_id, last_id, batch_size])
+            ids = [row[0] for row in cursor.fetchall()]
+            if not ids:
+                return
+            last_id = max(ids)
+
+            # 모든 메시지가 보관된 대화방은 가장 최근 보관 묶음의 마지막 메시지를 사용
+            archives = (
+                MessageArchive.objects.filter(
+                    chat_room__in=ids, chat_room__last_message_at__isnull=True
+                )
+                .order_by('chat_room_id', '-newest_created_at')
+                .distinct('chat_room_id')
+            )
+            for archive in archives:
+                # 보관 형식: [id, sender, message_type, content, created_at, token_count]
+                last = json.loads(zlib.decompress(archive.data))[-1]
+                ChatRoom.objects.filter(pk=archive.chat_room_id).update(
+                    last_message_at=last[4], last_message_preview=last[3][:100]
+                )
+
+
+class Migration(migrations.Migration):
+    # 대화방 통계는 배치마다 커밋하여 대화방 테이블을 오래 잠그지 않음
+    # (message_count는 CHECK 제약 검사를 피하려고 PositiveIntegerField 대신 IntegerField)
+    atomic = False
+
+    dependencies = [
+        ('chats', '0005_message_archive'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='chatroom',
+            name='last_message_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='마지막 메시지 시각'),
+        ),
+        migrations.AddField(
+            model_name='chatroom',
+            name='last_message_preview',
+            field=models.CharField(blank=True, max_length=100, verbose_name='마지막 메시지 미리보기'),
+        ),
+        migrations.AddField(
+            model_name='chatroom',
+            name='message_count',
+            field=models.IntegerField(default=0, verbose_name='메시지 수'),
+        ),
+        migrations.RunPython(backfill_room_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,79 @@
+# Generated by Django 5.2 on 2026-10-19 17:59
+
+import django.db.models.deletion
+from django.conf import settings
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+# 메시지를 저장하거나 다른 대화방으로 옮길 때 대화방 소유자를 복사
+CREATE_USER_TRIGGER_SQL = """
+CREATE FUNCTION message_user_trigger() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    SELECT "user_id" INTO NEW."user_id"
+    FROM "chats_chatroom" WHERE "id" = NEW."chat_room_id";
+    RETURN NEW;
+END
+$$;
+
+CREATE TRIGGER "message_user"
+    BEFORE INSERT OR UPDATE OF "chat_room_id" ON "chats_message"
+    FOR EACH ROW EXECUTE FUNCTION message_user_trigger();
+"""
+
+DROP_USER_TRIGGER_SQL = """
+DROP TRIGGER IF EXISTS "message_user" ON "chats_message";
+DROP FUNCTION IF EXISTS message_user_trigger();
+"""
+
+BACKFILL_SQL = """
+WITH batch AS (
+    SELECT "id" FROM "chats_message"
+    WHERE %s::uuid IS NULL OR "id" > %s::uuid
+    ORDER BY "id"
+    LIMIT %s
+)
+UPDATE "chats_message" AS message
+SET "user_id" = room."user_id"
+FROM batch, "chats_chatroom" AS room
+WHERE message."id" = batch."id" AND room."id" = message."chat_room_id"
+RETURNING message."id"
+"""
+
+
+# 기존 메시지는 id 순서로 나누어 채움 (배치마다 자동 커밋되어 행 잠금이 짧게 유지됨)
+def backfill_message_user(apps, schema_editor, batch_size=5000):
+    last_id = None
+    with schema_editor.connection.cursor() as cursor:
+        while True:
+            cursor.execute(BACKFILL_SQL, [last_id, last_id, batch_size])
+            ids = [row[0] for row in cursor.fetchall()]
+            if not ids:
+                return
+            last_id = max(ids)
+
+
+class Migration(migrations.Migration):
+    # NULL 허용 컬럼 추가는 테이블을 다시 쓰지 않고, 기존 행은 배치로 채운 뒤
+    # 인덱스를 CONCURRENTLY로 생성하여 메시지 테이블을 오래 잠그지 않음
+    # (FK 제약 검사를 피하려고 db_constraint=False, 컬럼/트리거 추가 시에만 짧은 테이블 잠금)
+    atomic = False
+
+    dependencies = [
+        ('chats', '0006_room_last_message'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='message',
+            name='user',
+            field=models.ForeignKey(db_constraint=False, db_index=False, editable=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='사용자'),
+        ),
+        migrations.RunSQL(CREATE_USER_TRIGGER_SQL, DROP_USER_TRIGGER_SQL),
+        migrations.RunPython(backfill_message_user, migrations.RunPython.noop),
+        AddIndexConcurrently(
+            model_name='message',
+            index=models.Index(fields=['user', '-created_at', '-id'], name='message_user_created_idx'),
+        ),
+    ]
@@ -1,7 +1,17 @@
 from core.models import DataBaseModel
 from accounts.models import User
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 
+# 대화방 목록에 표시하는 마지막 메시지 미리보기 길이
+LAST_MESSAGE_PREVIEW_LENGTH = 100
+
+
+# 근사 토큰 수 (UTF-8 4바이트당 1토큰)
+def estimate_tokens(text):
+    return (len(text.encode("utf-8")) + 3) // 4
+
 
 # 채팅방 모델
 class ChatRoom(DataBaseModel):
@@ -9,11 +19,37 @@ class ChatRoom(DataBaseModel):
         User, on_delete=models.CASCADE, related_name="chat_rooms", verbose_name="사용자"
     )
     title = models.CharField(max_length=255, blank=True, verbose_name="대화방 제목")
+    # AI 컨텍스트 창에서 밀려난 이전 대화의 누적 요약 (메시지가 밀려날 때마다 이어서 갱신)
+    summary = models.TextField(blank=True, verbose_name="이전 대화 요약")
+    summary_until = models.DateTimeField(
+        null=True, blank=True, verbose_name="요약된 마지막 메시지 시각"
+    )
+    summary_until_id = models.UUIDField(
+        null=True, blank=True, verbose_name="요약된 마지막 메시지 ID"
+    )
+    # 목록 조회용 비정규화 필드 (메시지 저장과 같은 트랜잭션에서 갱신, 보관된 메시지 포함)
+    last_message_preview = models.CharField(
+        max_length=LAST_MESSAGE_PREVIEW_LENGTH,
+        blank=True,
+        verbose_name="마지막 메시지 미리보기",
+    )
+    last_message_at = models.DateTimeField(
+        null=True, blank=True, verbose_name="마지막 메시지 시각"
+    )
+    # 대용량 테이블에 CHECK 제약을 두지 않도록 IntegerField (코드에서 0 미만이 되지 않게 함)
+    message_count = models.IntegerField(default=0, verbose_name="메시지 수")
 
     class Meta:
         verbose_name = "대화방"
         verbose_name_plural = "대화방 목록"
         ordering = ["-updated_at"]
+        # 사용자별 최근 대화방 cursor pagination용 (id는 같은 시각 정렬 기준)
+        indexes = [
+            models.Index(
+                fields=["user", "-updated_at", "-id"],
+                name="chatroom_user_updated_idx",
+            ),
+        ]
 
     def __str__(self):
         # user.nickname이 없을 경우를 대비하여 user.email 사용
@@ -47,11 +83,44 @@ class Message(DataBaseModel):
         verbose_name="메시지 유형",
     )
     content = models.TextField(verbose_name="메시지 내용")
+    # 저장 시 계산하는 근사 토큰 수 (estimate_tokens, 이전 메시지는 마이그레이션에서 채움)
+    token_count = models.IntegerField(null=True, editable=False, verbose_name="토큰 수")
+    # 검색용 글자 2-gram 목록 (DB 트리거가 content에서 계산, chats.search 참고)
+    search_bigrams = ArrayField(
+        models.CharField(max_length=2),
+        null=True,
+        editable=False,
+        verbose_name="검색 2-gram",
+    )
+    # 검색용 대화방 소유자 (DB 트리거가 대화방에서 복사, chats.search 참고)
+    # 메시지 삭제는 대화방 CASCADE가 처리하므로 FK 제약과 단일 컬럼 인덱스는 두지 않음
+    user = models.ForeignKey(
+        User,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        null=True,
+        editable=False,
+        related_name="+",
+        verbose_name="사용자",
+    )
 
     class Meta:
         verbose_name = "메시지"
         verbose_name_plural = "메시지 목록"
         ordering = ["created_at"]
+        # 대화방별 최근 메시지 cursor pagination용 (id는 같은 시각 정렬 기준)
+        indexes = [
+            models.Index(
+                fields=["chat_room", "-created_at", "-id"],
+                name="message_room_created_idx",
+            ),
+            GinIndex(fields=["search_bigrams"], name="message_search_bigrams_idx"),
+            models.Index(
+                fields=["user", "-created_at", "-id"],
+                name="message_user_created_idx",
+            ),
+        ]
 
     def __str__(self):
         if self.sender == self.SenderType.USER:
@@ -59,3 +128,39 @@ class Message(DataBaseModel):
             user_identifier = getattr(self.chat_room.user, "nickname")
             return f"[{user_identifier}] {self.content[:30]}"
         return f"[{self.get_sender_display()}] {self.content[:30]}"
+
+    # bulk_create로 저장하는 경우(chats.room_stats.save_messages)는 저장 전에 직접 계산
+    def save(self, *args, **kwargs):
+        self.token_count = estimate_tokens(self.content)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "content" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "token_count"}
+        super().save(*args, **kwargs)
+
+
+# 비활성 대화방에서 옮겨 온 오래된 메시지 묶음 (메시지 목록을 zlib 압축 JSON으로 저장)
+# 같은 대화방의 묶음끼리는 메시지 시각 구간이 겹치지 않음
+class MessageArchive(DataBaseModel):
+    chat_room = models.ForeignKey(
+        ChatRoom,
+        on_delete=models.CASCADE,
+        related_name="message_archives",
+        verbose_name="대화방",
+    )
+    oldest_created_at = models.DateTimeField(verbose_name="가장 오래된 메시지 시각")
+    newest_created_at = models.DateTimeField(verbose_name="가장 최근 메시지 시각")
+    message_count = models.PositiveIntegerField(verbose_name="메시지 수")
+    data = models.BinaryField(verbose_name="압축된 메시지 목록")
+
+    class Meta:
+        verbose_name = "보관 메시지 묶음"
+        verbose_name_plural = "보관 메시지 묶음 목록"
+        indexes = [
+            models.Index(
+                fields=["chat_room", "-newest_created_at"],
+                name="message_archive_room_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.chat_room_id} ({self.message_count}개 메시지)"
@@ -0,0 +1,153 @@
+import asyncio
+import json
+import threading
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils.module_loading import import_string
+
+from .serializers import MessageSerializer
+
+
+# 대화방 채널 이름
+def room_channel(chat_room_id):
+    return f"chat_room.{chat_room_id}"
+
+
+# 연결 하나의 전송 대기열 (이벤트 루프에 묶이며, 다른 스레드에서도 전달 가능)
+# 대기열이 가득 차면 남은 이벤트를 버리고 None을 넣어 연결 종료를 알림
+class Subscription:
+
+    def __init__(self, channel, max_buffer):
+        self.channel = channel
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(maxsize=max_buffer)
+        self.overflowed = False
+
+    def deliver(self, payload):
+        try:
+            self.loop.call_soon_threadsafe(self._put, payload)
+        except RuntimeError:
+            # 연결이 끝나 이벤트 루프가 닫힌 경우
+            pass
+
+    def _put(self, payload):
+        if self.overflowed:
+            return
+        try:
+            self.queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            self.overflowed = True
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(None)
+
+    async def get(self):
+        return await self.queue.get()
+
+
+# 프로세스 간 이벤트 전달을 담당하는 백엔드 기본 클래스
+# start()로 받은 deliver(channel, payload)를 수신한 이벤트마다 호출해야 함
+class BasePubSubBackend:
+
+    def start(self, deliver):
+        self.deliver = deliver
+
+    # 해당 채널의 첫 구독자가 생기거나 마지막 구독자가 떠날 때 호출
+    def subscribe(self, channel):
+        pass
+
+    def unsubscribe(self, channel):
+        pass
+
+    # 요청 처리 스레드/이벤트 루프에서 호출되므로 블로킹하지 않아야 함
+    def publish(self, channel, payload):
+        raise NotImplementedError
+
+
+# 단일 프로세스용 백엔드 (발행 즉시 같은 프로세스의 구독자에게 전달)
+# 여러 워커 프로세스로 운영할 때는 Redis 등 공유 브로커를 쓰는 백엔드로 교체
+class LocalPubSubBackend(BasePubSubBackend):
+
+    def publish(self, channel, payload):
+        self.deliver(channel, payload)
+
+
+# 채널별 로컬 구독자에게 이벤트를 나눠 주는 fan-out 계층
+# (이벤트는 발행 시 한 번만 JSON 문자열로 직렬화)
+class ChatFanout:
+
+    def __init__(self, backend, max_buffer=100):
+        self.backend = backend
+        self.max_buffer = max_buffer
+        self._subscriptions = defaultdict(set)
+        self._lock = threading.Lock()
+        backend.start(self._deliver)
+
+    # 이벤트 루프 안에서 호출
+    def subscribe(self, channel):
+        subscription = Subscription(channel, self.max_buffer)
+        with self._lock:
+            first = not self._subscriptions[channel]
+            self._subscriptions[channel].add(subscription)
+        if first:
+            self.backend.subscribe(channel)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.channel)
+            if subscriptions is None:
+                return
+            subscriptions.discard(subscription)
+            last = not subscriptions
+            if last:
+                del self._subscriptions[subscription.channel]
+        if last:
+            self.backend.unsubscribe(subscription.channel)
+
+    def subscriber_count(self, channel):
+        with self._lock:
+            return len(self._subscriptions.get(channel, ()))
+
+    def publish(self, channel, event):
+        payload = json.dumps(event, cls=DjangoJSONEncoder, ensure_ascii=False)
+        self.backend.publish(channel, payload)
+
+    def _deliver(self, channel, payload):
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(channel, ()))
+        for subscription in subscriptions:
+            subscription.deliver(payload)
+
+
+_fanout = None
+_fanout_lock = threading.Lock()
+
+
+# settings.CHAT_PUBSUB 설정으로 생성한 프로세스 공용 fan-out 계층
+def get_fanout():
+    global _fanout
+    with _fanout_lock:
+        if _fanout is None:
+            config = settings.CHAT_PUBSUB
+            backend = import_string(config["BACKEND"])(**config.get("OPTIONS", {}))
+            _fanout = ChatFanout(backend, max_buffer=config.get("MAX_BUFFER", 100))
+        return _fanout
+
+
+def reset_fanout():
+    global _fanout
+    with _fanout_lock:
+        _fanout = None
+
+
+# 새로 저장된 메시지를 대화방 구독자에게 전송 (트랜잭션 안에서는 커밋 이후 호출)
+def publish_messages(messages):
+    fanout = get_fanout()
+    for message in messages:
+        fanout.publish(
+            room_channel(message.chat_room_id),
+            {"type": "message", "message": MessageSerializer(message).data},
+        )
@@ -0,0 +1,163 @@
+from django.db import transaction
+from django.db.models import (
+    Case,
+    Count,
+    F,
+    IntegerField,
+    OuterRef,
+    Q,
+    Subquery,
+    Sum,
+    Value,
+    When,
+)
+from django.db.models.functions import Coalesce, Greatest, Left
+from django.utils import timezone
+
+from .archive import decompress_messages
+from .list_cache import bump_list_versions
+from .models import (
+    LAST_MESSAGE_PREVIEW_LENGTH,
+    ChatRoom,
+    Message,
+    MessageArchive,
+    estimate_tokens,
+)
+
+
+def preview_text(content):
+    return content[:LAST_MESSAGE_PREVIEW_LENGTH]
+
+
+# 새로 저장한 메시지(오래된 순서)를 반영하는 대화방 UPDATE 값
+# 메시지 수는 DB에서 더하고, 동시에 저장된 더 최근 메시지가 있으면 마지막 메시지를 유지
+def message_stats_updates(messages):
+    last = messages[-1]
+    newer = Q(last_message_at__gt=last.created_at)
+    return {
+        "message_count": F("message_count") + len(messages),
+        "last_message_at": Case(
+            When(newer, then=F("last_message_at")), default=Value(last.created_at)
+        ),
+        "last_message_preview": Case(
+            When(newer, then=F("last_message_preview")),
+            default=Value(preview_text(last.content)),
+        ),
+    }
+
+
+# 메시지를 하나의 INSERT로 저장하고 같은 트랜잭션에서 대화방을 한 번만 UPDATE
+# (커밋 이후 대화방/메시지 목록 캐시 버전을 갱신)
+def save_messages(chat_room, messages, **room_updates):
+    for message in messages:
+        message.token_count = estimate_tokens(message.content)
+    with transaction.atomic():
+        Message.objects.bulk_create(messages)
+        ChatRoom.objects.filter(pk=chat_room.pk).update(
+            updated_at=timezone.now(),
+            **message_stats_updates(messages),
+            **room_updates,
+        )
+        transaction.on_commit(
+            lambda: bump_list_versions(
+                user_ids=[chat_room.user_id], chat_room_ids=[chat_room.pk]
+            )
+        )
+    return messages
+
+
+# 메시지 테이블의 가장 최근 메시지로 마지막 메시지 시각/미리보기를 계산하는 UPDATE 값
+# (메시지가 모두 보관된 대화방은 비워 두고 _repair_archived_rooms에서 채움)
+def latest_message_updates():
+    latest = Message.objects.filter(chat_room=OuterRef("pk")).order_by(
+        "-created_at", "-id"
+    )
+    return {
+        "last_message_at": Subquery(latest.values("created_at")[:1]),
+        "last_message_preview": Coalesce(
+            Subquery(
+                latest.values(preview=Left("content", LAST_MESSAGE_PREVIEW_LENGTH))[:1]
+            ),
+            Value(""),
+        ),
+    }
+
+
+# 메시지를 수정/삭제한 뒤 같은 트랜잭션에서 대화방의 마지막 메시지(삭제면 메시지 수도)를 갱신
+def refresh_room_after_change(chat_room_id, deleted=0):
+    updates = latest_message_updates()
+    if deleted:
+        updates["message_count"] = Greatest(F("message_count") - deleted, 0)
+    with transaction.atomic():
+        # 대화방을 먼저 잠가 UPDATE가 동시에 저장된 메시지까지 보도록 함 (repair_room_stats와 같음)
+        user_id = (
+            ChatRoom.objects.select_for_update()
+            .values_list("user_id", flat=True)
+            .get(pk=chat_room_id)
+        )
+        ChatRoom.objects.filter(pk=chat_room_id).update(**updates)
+        _repair_archived_rooms([chat_room_id])
+        transaction.on_commit(
+            lambda: bump_list_versions(user_ids=[user_id], chat_room_ids=[chat_room_id])
+        )
+
+
+# 대화방의 마지막 메시지/메시지 수를 메시지 테이블 기준으로 다시 계산
+# 대화방 batch_size개씩 UPDATE 한 번으로 처리하고 갱신한 대화방 수를 반환
+def repair_room_stats(batch_size=1000):
+    messages = Message.objects.filter(chat_room=OuterRef("pk"))
+    archived_count = (
+        MessageArchive.objects.filter(chat_room=OuterRef("pk"))
+        .values("chat_room")
+        .annotate(total=Sum("message_count"))
+        .values("total")
+    )
+    message_count = (
+        messages.values("chat_room").annotate(total=Count("id")).values("total")
+    )
+
+    repaired, last_id = 0, None
+    while True:
+        rooms = ChatRoom.objects.order_by("id")
+        if last_id is not None:
+            rooms = rooms.filter(id__gt=last_id)
+        ids = list(rooms.values_list("id", flat=True)[:batch_size])
+        if not ids:
+            return repaired
+
+        with transaction.atomic():
+            # 대화방을 먼저 잠가 동시에 저장 중인 메시지가 두 번 세어지거나 빠지지 않게 함
+            # (잠금 이후 UPDATE는 새 스냅숏으로 실행되고, 대기 중인 메시지 저장은 그 위에 더함)
+            user_ids = set(
+                ChatRoom.objects.select_for_update()
+                .filter(id__in=ids)
+                .order_by("id")
+                .values_list("user_id", flat=True)
+            )
+            repaired += ChatRoom.objects.filter(id__in=ids).update(
+                message_count=(
+                    Coalesce(Subquery(message_count), 0, output_field=IntegerField())
+                    + Coalesce(Subquery(archived_count), 0, output_field=IntegerField())
+                ),
+                **latest_message_updates(),
+            )
+            _repair_archived_rooms(ids)
+        bump_list_versions(user_ids=user_ids)
+        last_id = ids[-1]
+
+
+# 모든 메시지가 보관된 대화방은 가장 최근 보관 묶음에서 마지막 메시지를 가져옴
+def _repair_archived_rooms(ids):
+    archives = (
+        MessageArchive.objects.filter(
+            chat_room__in=ids, chat_room__last_message_at__isnull=True
+        )
+        .order_by("chat_room_id", "-newest_created_at")
+        .distinct("chat_room_id")
+    )
+    for archive in archives:
+        last = decompress_messages(archive)[-1]
+        ChatRoom.objects.filter(pk=archive.chat_room_id).update(
+            last_message_at=last.created_at,
+            last_message_preview=preview_text(last.content),
+        )
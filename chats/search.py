@@ -0,0 +1,85 @@
+import html
+import re
+
+from django.contrib.postgres.fields import ArrayField
+from django.db import connection
+from django.db.models import CharField, F, Func, Lookup, Value
+
+from .models import ChatRoom, Message
+
+# 단어 구분자 (공백과 ASCII 문장부호, DB 함수 message_search_bigrams와 같음)
+SEPARATORS = r"\s!-/:-@\[-`{-~"
+_TERM = re.compile(f"[^{SEPARATORS}]+")
+
+# 스니펫에 포함할 첫 검색어 앞/뒤 글자 수
+SNIPPET_BEFORE = 30
+SNIPPET_AFTER = 90
+
+
+# content ILIKE '%검색어%' (icontains의 UPPER(content) LIKE는 열 통계를 쓰지 못해
+# 흔한 검색어의 결과 수를 지나치게 적게 추정하고 최신순 인덱스 대신 전체 정렬을 선택함)
+class _ILike(Lookup):
+    lookup_name = "ilike"
+
+    def as_sql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        return f"{lhs} ILIKE {rhs}", [*lhs_params, *rhs_params]
+
+
+# 검색어를 단어 목록으로 변환
+def search_terms(text):
+    return _TERM.findall(text)
+
+
+# 대화방 id -> 제목 (검색 결과 페이지에 나온 대화방만 조회)
+def room_titles(messages):
+    room_ids = {message.chat_room_id for message in messages}
+    return dict(ChatRoom.objects.filter(id__in=room_ids).values_list("id", "title"))
+
+
+# 사용자의 모든 대화방에서 모든 검색어를 포함한 메시지 검색
+# 검색어의 글자 2-gram을 모두 가진 메시지를 message_search_bigrams_idx로 찾은 뒤 실제로
+# 포함하는지 다시 확인하므로 "비타민"으로 "종합비타민은"처럼 단어 중간도 검색됨
+# (메시지에 복사된 user_id로 필터링하므로, 흔한 검색어는 message_user_created_idx를
+#  최신순으로 읽다가 한 페이지를 채우면 멈추고 드문 검색어는 2-gram 색인을 사용)
+def search_messages(user, terms):
+    queryset = Message.objects.filter(user=user).defer("search_bigrams")
+    # 색인 조건에는 검색어마다 첫 2-gram만 사용 (1글자 검색어는 내용 확인만 사용)
+    # 한 단어의 2-gram들은 함께 나타나므로 모두 넣으면 결과 수를 곱으로 지나치게 적게
+    # 추정하여, 흔한 검색어에도 전체 일치 행을 읽어 정렬하는 실행 계획을 고름
+    indexed = " ".join(term[:2] for term in terms if len(term) > 1)
+    if indexed:
+        queryset = queryset.filter(
+            search_bigrams__contains=Func(
+                Value(indexed),
+                function="message_search_bigrams",
+                output_field=ArrayField(CharField(max_length=2)),
+            )
+        )
+    for term in terms:
+        pattern = f"%{connection.ops.prep_for_like_query(term)}%"
+        queryset = queryset.filter(_ILike(F("content"), pattern))
+    return queryset
+
+
+# 첫 검색어 주변을 잘라 HTML 이스케이프하고 검색어를 <mark>로 강조
+def render_snippet(content, terms):
+    pattern = re.compile(
+        "|".join(re.escape(term) for term in sorted(terms, key=len, reverse=True)),
+        re.IGNORECASE,
+    )
+    first = pattern.search(content)
+    start = max(0, first.start() - SNIPPET_BEFORE) if first else 0
+    end = min(len(content), (first.end() if first else 0) + SNIPPET_AFTER)
+    text = content[start:end]
+
+    parts, position = [], 0
+    for match in pattern.finditer(text):
+        parts.append(html.escape(text[position : match.start()]))
+        parts.append(f"<mark>{html.escape(match.group())}</mark>")
+        position = match.end()
+    parts.append(html.escape(text[position:]))
+    prefix = "…" if start > 0 else ""
+    suffix = "…" if end < len(content) else ""
+    return prefix + "".join(parts) + suffix
@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from .models import ChatRoom, Message
+from .search import render_snippet
 
 
 # 채팅방 serializer
@@ -7,8 +8,22 @@ class ChatRoomSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = ChatRoom
-        fields = ["id", "user", "title", "created_at", "updated_at"]
-        read_only_fields = ("user",)
+        fields = [
+            "id",
+            "user",
+            "title",
+            "last_message_preview",
+            "last_message_at",
+            "message_count",
+            "created_at",
+            "updated_at",
+        ]
+        read_only_fields = (
+            "user",
+            "last_message_preview",
+            "last_message_at",
+            "message_count",
+        )
 
 
 # 메시지 serializer
@@ -21,11 +36,30 @@ class MessageSerializer(serializers.ModelSerializer):
             "sender",
             "message_type",
             "content",
+            "token_count",
             "created_at",
         ]
         read_only_fields = (
             "chat_room",
             "sender",
             "message_type",
+            "token_count",
             "created_at",
         )
+
+
+# 메시지 검색 결과 serializer
+class MessageSearchSerializer(MessageSerializer):
+    chat_room_title = serializers.SerializerMethodField()
+    snippet = serializers.SerializerMethodField()
+
+    class Meta(MessageSerializer.Meta):
+        fields = MessageSerializer.Meta.fields + ["chat_room_title", "snippet"]
+
+    # 대화방 제목은 뷰에서 미리 조회한 {id: 제목}에서 사용
+    def get_chat_room_title(self, obj):
+        return self.context["room_titles"].get(obj.chat_room_id)
+
+    # 검색어가 <mark>로 강조된 HTML 스니펫
+    def get_snippet(self, obj):
+        return render_snippet(obj.content, self.context["search_terms"])
@@ -0,0 +1,19 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .list_cache import bump_list_versions
+from .models import ChatRoom
+
+
+# 대화방이 생성/수정/삭제되면 커밋 이후 목록 캐시 버전을 갱신
+# (메시지 저장은 room_stats.save_messages에서 갱신)
+@receiver(post_save, sender=ChatRoom)
+@receiver(post_delete, sender=ChatRoom)
+def bump_list_versions_on_room_change(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    user_id, chat_room_id = instance.user_id, instance.pk
+    transaction.on_commit(
+        lambda: bump_list_versions(user_ids=[user_id], chat_room_ids=[chat_room_id])
+    )
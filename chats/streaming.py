@@ -0,0 +1,64 @@
+import asyncio
+import json
+
+from asgiref.sync import sync_to_async
+from django.core.serializers.json import DjangoJSONEncoder
+from rest_framework.renderers import BaseRenderer
+
+from .backends.dispatcher import DispatcherBusy, get_dispatcher
+from .exceptions import AIBackendBusy
+from .models import Message
+from .pubsub import publish_messages
+from .room_stats import save_messages
+from .serializers import MessageSerializer
+
+
+# Server-Sent Events 형식의 이벤트 문자열 생성
+def sse_event(event, data):
+    payload = json.dumps(data, cls=DjangoJSONEncoder, ensure_ascii=False)
+    return f"event: {event}\ndata: {payload}\n\n"
+
+
+# text/event-stream 요청에서 발생한 오류 응답을 SSE 이벤트로 렌더링
+class EventStreamRenderer(BaseRenderer):
+    media_type = "text/event-stream"
+    format = "sse"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return sse_event("error", data).encode(self.charset)
+
+
+# AI 메시지는 생성이 끝난 뒤 한 번만 저장 (트랜잭션을 열어둔 채 생성하지 않음)
+async def _save_ai_message(chat_room, content, summary_updates):
+    message = Message(
+        chat_room=chat_room, sender=Message.SenderType.AI, content=content
+    )
+    await sync_to_async(save_messages)(chat_room, [message], **summary_updates)
+    publish_messages([message])
+    return message
+
+
+# 사용자 메시지 -> AI 토큰들 -> 저장된 AI 메시지 순서로 SSE 이벤트를 생성
+async def stream_ai_reply(chat_room, user_message, context, summary_updates):
+    yield sse_event("message", MessageSerializer(user_message).data)
+
+    tokens = []
+    try:
+        async for token in get_dispatcher().stream(user_message.content, context):
+            tokens.append(token)
+            yield sse_event("token", {"token": token})
+    except DispatcherBusy:
+        error = AIBackendBusy()
+        yield sse_event("error", {"detail": error.detail, "code": error.default_code})
+        return
+    except (asyncio.CancelledError, GeneratorExit):
+        # 클라이언트 연결이 끊겨도 생성된 부분까지는 저장
+        if tokens:
+            await asyncio.shield(
+                _save_ai_message(chat_room, "".join(tokens), summary_updates)
+            )
+        raise
+
+    ai_message = await _save_ai_message(chat_room, "".join(tokens), summary_updates)
+    yield sse_event("done", MessageSerializer(ai_message).data)
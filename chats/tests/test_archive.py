@@ -0,0 +1,126 @@
+from datetime import timedelta
+
+from django.test import Client
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from accounts.models import User
+from chats.archive import MessageArchiver, decompress_messages
+from chats.models import ChatRoom, Message, MessageArchive
+from chats.tests.test_context import create_messages
+
+
+# 오래된 메시지 보관 및 보관 메시지 페이지네이션 테스트
+class MessageArchiveTests(APITestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="testuser@example.com", password="password123", nickname="testuser"
+        )
+        self.client.force_authenticate(user=self.user)
+        self.chatroom = ChatRoom.objects.create(user=self.user, title="My Chat Room")
+        self.active_room = ChatRoom.objects.create(user=self.user, title="Active")
+        create_messages(self.chatroom, 1, 45)
+        create_messages(self.active_room, 1, 30)
+        ChatRoom.objects.filter(pk=self.chatroom.pk).update(
+            updated_at=timezone.now() - timedelta(days=100)
+        )
+        self.url = reverse(
+            "chat_message-list", kwargs={"chat_room_pk": self.chatroom.pk}
+        )
+
+    def archive(self):
+        return MessageArchiver(inactive_days=90, keep_recent=5, batch_size=20).run()
+
+    # 비활성 대화방의 오래된 메시지만 묶음 단위로 이동하는지 테스트
+    def test_archives_old_messages_of_inactive_rooms(self):
+        print("\n비활성 대화방 메시지 보관 테스트\n")
+        self.assertEqual(self.archive(), (1, 40, 2))
+
+        self.assertEqual(
+            list(
+                Message.objects.filter(chat_room=self.chatroom)
+                .order_by("created_at")
+                .values_list("content", flat=True)
+            ),
+            [f"메시지 {number:03d}" for number in range(41, 46)],
+        )
+        self.assertEqual(Message.objects.filter(chat_room=self.active_room).count(), 30)
+
+        archives = MessageArchive.objects.order_by("oldest_created_at")
+        self.assertEqual([archive.message_count for archive in archives], [20, 20])
+        restored = decompress_messages(archives[0])
+        self.assertEqual(restored[0].content, "메시지 001")
+        self.assertEqual(restored[-1].content, "메시지 020")
+        self.assertEqual(restored[0].chat_room_id, self.chatroom.pk)
+        self.assertEqual(restored[0].created_at, archives[0].oldest_created_at)
+
+        # 다시 실행해도 남겨 둔 최근 메시지는 보관하지 않음
+        self.assertEqual(self.archive(), (0, 0, 0))
+
+    # 최근 메시지 이후 보관 메시지까지 누락/중복 없이 최신순으로 조회되는지 테스트
+    def test_pagination_continues_into_archive(self):
+        print("\n보관 메시지 페이지네이션 테스트\n")
+        self.archive()
+
+        url, seen = self.url, []
+        while url:
+            response = self.client.get(url, format="json")
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertLessEqual(len(response.data["results"]), 10)
+            seen.extend(item["content"] for item in response.data["results"])
+            url = response.data["next"]
+
+        self.assertEqual(seen, [f"메시지 {number:03d}" for number in range(45, 0, -1)])
+
+    # 비동기 메시지 목록도 DRF 목록과 같은 순서로 보관 메시지까지 조회되는지 테스트
+    def test_async_pagination_continues_into_archive(self):
+        print("\n비동기 보관 메시지 페이지네이션 테스트\n")
+        self.archive()
+        client = Client(
+            headers={"Authorization": f"Bearer {AccessToken.for_user(self.user)}"}
+        )
+
+        url = reverse(
+            "async_chat_message-list", kwargs={"chat_room_pk": self.chatroom.pk}
+        )
+        seen = []
+        while url:
+            data = client.get(url).json()
+            self.assertLessEqual(len(data["results"]), 10)
+            seen.extend(item["content"] for item in data["results"])
+            url = data["next"]
+
+        self.assertEqual(seen, [f"메시지 {number:03d}" for number in range(45, 0, -1)])
+        response = client.get(
+            reverse(
+                "async_chat_message-list", kwargs={"chat_room_pk": self.chatroom.pk}
+            ),
+            {"archive_cursor": "invalid"},
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    # 다른 사용자의 보관 메시지는 조회되지 않는지 테스트
+    def test_archive_is_scoped_to_owner(self):
+        print("\n다른 사용자 보관 메시지 조회 테스트\n")
+        self.archive()
+        first_page = self.client.get(self.url, format="json")
+        next_url = first_page.data["next"]
+        self.assertIn("archive_cursor=", next_url)
+
+        other_user = User.objects.create_user(
+            email="otheruser@example.com", password="password123", nickname="otheruser"
+        )
+        self.client.force_authenticate(user=other_user)
+        response = self.client.get(next_url, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["results"], [])
+
+    # 잘못된 보관 cursor 테스트
+    def test_invalid_archive_cursor(self):
+        print("\n잘못된 보관 cursor 테스트\n")
+        response = self.client.get(self.url, {"archive_cursor": "invalid"})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
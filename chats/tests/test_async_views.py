@@ -0,0 +1,95 @@
+from django.test import AsyncClient, TestCase
+from django.urls import reverse
+from rest_framework_simplejwt.tokens import AccessToken
+
+from accounts.models import User
+from chats.models import ChatRoom, Message
+
+
+# 비동기 채팅 API 테스트
+class AsyncChatAPITests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="testuser@example.com", password="password123", nickname="testuser"
+        )
+        self.other_user = User.objects.create_user(
+            email="otheruser@example.com", password="password123", nickname="otheruser"
+        )
+        self.chatroom = ChatRoom.objects.create(user=self.user, title="My Chat Room")
+        self.other_chatroom = ChatRoom.objects.create(
+            user=self.other_user, title="Other's Chat Room"
+        )
+        self.client = AsyncClient()
+        self.headers = {"Authorization": f"Bearer {AccessToken.for_user(self.user)}"}
+
+    # 채팅방 생성 및 커서 페이지네이션 목록 조회 테스트
+    async def test_create_and_list_chatrooms(self):
+        print("\n비동기 채팅방 생성/목록 조회 테스트\n")
+        url = reverse("async_chatroom-list")
+        for i in range(11):
+            response = await self.client.post(
+                url,
+                {"title": f"Room {i}"},
+                content_type="application/json",
+                headers=self.headers,
+            )
+            self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()["user"], str(self.user.id))
+
+        first = (await self.client.get(url, headers=self.headers)).json()
+        self.assertEqual(len(first["results"]), 10)
+        self.assertEqual(first["results"][0]["title"], "Room 10")
+        second = (await self.client.get(first["next"], headers=self.headers)).json()
+        self.assertIsNone(second["next"])
+
+        # 다른 사용자의 채팅방은 포함되지 않음
+        titles = [room["title"] for room in first["results"] + second["results"]]
+        self.assertEqual(len(titles), 12)
+        self.assertNotIn(self.other_chatroom.title, titles)
+
+    # 메시지 전송 시 AI 응답 저장 테스트
+    async def test_post_message_creates_ai_response(self):
+        print("\n비동기 메시지 전송 테스트\n")
+        url = reverse(
+            "async_chat_message-list", kwargs={"chat_room_pk": self.chatroom.pk}
+        )
+        response = await self.client.post(
+            url,
+            {"content": "안녕하세요 AI"},
+            content_type="application/json",
+            headers=self.headers,
+        )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()["sender"], Message.SenderType.USER)
+        senders = [
+            sender
+            async for sender in Message.objects.filter(chat_room=self.chatroom)
+            .order_by("created_at")
+            .values_list("sender", flat=True)
+        ]
+        self.assertEqual(senders, [Message.SenderType.USER, Message.SenderType.AI])
+
+        listed = (await self.client.get(url, headers=self.headers)).json()
+        self.assertEqual(len(listed["results"]), 2)
+
+    # 인증/권한 테스트
+    async def test_requires_owner(self):
+        print("\n비동기 채팅 API 인증/권한 테스트\n")
+        url = reverse(
+            "async_chat_message-list", kwargs={"chat_room_pk": self.other_chatroom.pk}
+        )
+        response = await self.client.get(reverse("async_chatroom-list"))
+        self.assertEqual(response.status_code, 401)
+
+        response = await self.client.post(
+            url,
+            {"content": "안녕하세요"},
+            content_type="application/json",
+            headers=self.headers,
+        )
+        self.assertEqual(response.status_code, 404)
+        self.assertFalse(
+            await Message.objects.filter(chat_room=self.other_chatroom).aexists()
+        )
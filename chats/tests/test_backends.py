@@ -0,0 +1,148 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from accounts.models import User
+from chats.backends.base import BaseChatBackend
+from chats.backends.dispatcher import (
+    ChatDispatcher,
+    DispatcherBusy,
+    get_dispatcher,
+    reset_dispatcher,
+)
+from chats.backends.stub import StubChatBackend
+from chats.models import ChatRoom, Message
+
+
+# 호출 횟수를 세는 느린 테스트용 백엔드
+class CountingBackend(BaseChatBackend):
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.calls = 0
+
+    async def stream(self, prompt, context=None):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        yield f"{prompt} 답변"
+
+
+# AI 백엔드/디스패처 테스트
+class ChatDispatcherTests(SimpleTestCase):
+
+    # 스텁 백엔드 응답 고정 테스트
+    async def test_stub_backend_is_deterministic(self):
+        print("\n스텁 백엔드 고정 응답 테스트\n")
+        backend = StubChatBackend(reply="'{prompt}'에 대한 답변입니다.")
+
+        tokens = [token async for token in backend.stream("비타민 D")]
+        self.assertGreater(len(tokens), 1)
+        self.assertEqual("".join(tokens), "'비타민 D'에 대한 답변입니다.")
+        self.assertEqual(await backend.generate("비타민 D"), "".join(tokens))
+
+    # 진행 중인 동일 요청 병합 테스트
+    async def test_coalesces_identical_prompts(self):
+        print("\n동일 요청 병합 테스트\n")
+        backend = CountingBackend()
+        dispatcher = ChatDispatcher(backend, max_concurrency=4)
+
+        replies = await asyncio.gather(
+            *[dispatcher.generate("같은 질문") for _ in range(5)],
+            dispatcher.generate("다른 질문"),
+        )
+        self.assertEqual(replies[:5], ["같은 질문 답변"] * 5)
+        self.assertEqual(replies[5], "다른 질문 답변")
+        self.assertEqual(backend.calls, 2)
+        self.assertEqual(dispatcher.coalesced, 4)
+
+        # 완료된 요청은 다시 호출
+        await dispatcher.generate("같은 질문")
+        self.assertEqual(backend.calls, 3)
+
+    # 동시 실행 제한 초과 시 대기 시간 초과 테스트
+    async def test_rejects_when_saturated(self):
+        print("\n동시 실행 제한 초과 테스트\n")
+        dispatcher = ChatDispatcher(
+            CountingBackend(delay=0.2), max_concurrency=1, queue_timeout=0.01
+        )
+
+        results = await asyncio.gather(
+            dispatcher.generate("첫 번째"),
+            dispatcher.generate("두 번째"),
+            return_exceptions=True,
+        )
+        self.assertEqual(results[0], "첫 번째 답변")
+        self.assertIsInstance(results[1], DispatcherBusy)
+        self.assertEqual(dispatcher.rejected, 1)
+
+    # 여러 스레드의 동기 요청에도 동시 실행 제한과 요청 병합이 함께 적용되는지 테스트
+    def test_sync_requests_share_limit(self):
+        print("\n동기 요청 동시 실행 제한/병합 테스트\n")
+        backend = CountingBackend(delay=0.2)
+        dispatcher = ChatDispatcher(backend, max_concurrency=1, queue_timeout=0.05)
+
+        def generate(prompt):
+            try:
+                return dispatcher.generate_sync(prompt)
+            except DispatcherBusy:
+                return None
+
+        prompts = ["같은 질문"] * 3 + ["다른 질문"]
+        with ThreadPoolExecutor(max_workers=len(prompts)) as executor:
+            replies = list(executor.map(generate, prompts))
+
+        # 먼저 슬롯을 얻은 질문만 응답하고 나머지 질문은 대기 시간 초과로 거절
+        self.assertEqual(len(set(replies) - {None}), 1)
+        self.assertEqual(backend.calls, 1)
+        self.assertEqual(dispatcher.coalesced, 2)
+        self.assertEqual(dispatcher.rejected, 1)
+
+
+@override_settings(
+    CHAT_AI_BACKEND={
+        "BACKEND": "chats.backends.stub.StubChatBackend",
+        "OPTIONS": {"reply": "'{prompt}'에 대한 답변입니다."},
+    }
+)
+class MessageBackendAPITests(APITestCase):
+
+    def setUp(self):
+        reset_dispatcher()
+        self.user = User.objects.create_user(
+            email="testuser@example.com", password="password123", nickname="testuser"
+        )
+        self.client.force_authenticate(user=self.user)
+        self.chatroom = ChatRoom.objects.create(user=self.user, title="My Chat Room")
+        self.url = reverse(
+            "chat_message-list", kwargs={"chat_room_pk": self.chatroom.pk}
+        )
+
+    def tearDown(self):
+        reset_dispatcher()
+
+    # 설정된 백엔드의 응답 저장 테스트
+    def test_create_message_uses_backend(self):
+        print("\n설정된 백엔드 응답 저장 테스트\n")
+        response = self.client.post(self.url, {"content": "안녕"}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        ai_message = Message.objects.get(
+            chat_room=self.chatroom, sender=Message.SenderType.AI
+        )
+        self.assertEqual(ai_message.content, "'안녕'에 대한 답변입니다.")
+
+    # 생성 요청이 밀린 경우 503 응답 테스트
+    def test_create_message_when_backend_busy(self):
+        print("\nAI 백엔드 과부하 시 503 응답 테스트\n")
+        with mock.patch.object(
+            get_dispatcher(), "generate", side_effect=DispatcherBusy
+        ):
+            response = self.client.post(self.url, {"content": "안녕"}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.assertFalse(Message.objects.filter(chat_room=self.chatroom).exists())
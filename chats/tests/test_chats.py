@@ -1,4 +1,6 @@
 from rest_framework.test import APITestCase
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
 from accounts.models import User
@@ -151,6 +153,44 @@ class MessageAPITests(APITestCase):
         self.assertEqual(response.data["message_type"], Message.MessageType.TEXT)
         self.assertEqual(response.data["chat_room"], self.chatroom.id)
 
+    # 메시지 생성 쿼리 수 테스트
+    # (채팅방 조회, 컨텍스트 메시지 조회, 메시지 INSERT, 채팅방 UPDATE)
+    def test_create_message_query_budget(self):
+        print("\n메시지 생성 쿼리 수 테스트\n")
+        url = reverse("chat_message-list", kwargs={"chat_room_pk": self.chatroom.pk})
+        updated_at = self.chatroom.updated_at
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.post(url, {"content": "안녕하세요"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        # 테스트 트랜잭션 안의 SAVEPOINT 구문은 제외
+        queries = [
+            query["sql"]
+            for query in context.captured_queries
+            if "SAVEPOINT" not in query["sql"]
+        ]
+        self.assertEqual(len(queries), 4, queries)
+        self.assertTrue(queries[0].startswith('SELECT "chats_chatroom"'))
+        self.assertTrue(queries[1].startswith('SELECT "chats_message"'))
+        self.assertTrue(queries[2].startswith('INSERT INTO "chats_message"'))
+        self.assertTrue(queries[3].startswith('UPDATE "chats_chatroom"'))
+
+        self.chatroom.refresh_from_db()
+        self.assertGreater(self.chatroom.updated_at, updated_at)
+        self.assertEqual(self.chatroom.title, "My Chat Room")
+
+    # 다른 사용자 채팅방에 메시지 생성 시도 테스트
+    def test_create_message_in_other_users_room(self):
+        print("\n다른 사용자 채팅방 메시지 생성 권한 테스트\n")
+        url = reverse(
+            "chat_message-list", kwargs={"chat_room_pk": self.other_chatroom.pk}
+        )
+        response = self.client.post(url, {"content": "안녕하세요"}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertFalse(Message.objects.filter(chat_room=self.other_chatroom).exists())
+
     # 메시지 목록 조회
     def test_list_messages_by_chatroom_with_pagination(self):
         print("\n메시지 목록 조회 성공 테스트\n")
@@ -168,6 +208,31 @@ class MessageAPITests(APITestCase):
         # 모든 결과가 요청한 chat_room에 속하는지 확인
         self.assertTrue(all(item["chat_room"] == self.chatroom.id for item in results))
 
+    # 같은 시각의 메시지가 많아도 페이지 간 누락/중복이 없는지 테스트
+    def test_message_pagination_with_same_created_at(self):
+        print("\n동일 시각 메시지 페이지네이션 테스트\n")
+        Message.objects.bulk_create(
+            Message(
+                chat_room=self.chatroom,
+                sender=Message.SenderType.USER,
+                content=f"메시지 {i}",
+            )
+            for i in range(25)
+        )
+        created_at = Message.objects.first().created_at
+        Message.objects.filter(chat_room=self.chatroom).update(created_at=created_at)
+
+        url = reverse("chat_message-list", kwargs={"chat_room_pk": self.chatroom.pk})
+        seen = []
+        while url:
+            response = self.client.get(url, format="json")
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            seen.extend(item["id"] for item in response.data["results"])
+            url = response.data["next"]
+
+        self.assertEqual(len(seen), 25)
+        self.assertEqual(len(set(seen)), 25)
+
     # 메시지 상세 조회 성공 테스트
     def test_retrieve_message_detail(self):
         print("\n메시지 상세 조회 성공 테스트\n")
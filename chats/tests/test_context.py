@@ -0,0 +1,197 @@
+import tempfile
+
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from accounts.models import User
+from chats.context import CONTEXT_ROOM_FIELDS, ChatContextBuilder, estimate_tokens
+from chats.models import ChatRoom, Message
+from data_managements.knowledge import KnowledgeIndexBuilder, reset_knowledge_index
+from data_managements.models import Ingredient
+
+
+# 메시지 번호 순서대로 1초 간격의 생성 시각을 부여 ("메시지 001" 형식)
+def create_messages(chat_room, start, count):
+    Message.objects.bulk_create(
+        Message(
+            chat_room=chat_room,
+            sender=Message.SenderType.USER,
+            content=f"메시지 {number:03d}",
+        )
+        for number in range(start, start + count)
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "UPDATE chats_message "
+            "SET created_at = "
+            "%s + split_part(content, ' ', 2)::int * interval '1 second' "
+            "WHERE chat_room_id = %s",
+            [chat_room.created_at, chat_room.pk],
+        )
+
+
+# 토큰 예산 기반 대화 컨텍스트 구성 테스트
+class ChatContextBuilderTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="testuser@example.com", password="password123", nickname="testuser"
+        )
+        self.chatroom = ChatRoom.objects.create(user=self.user, title="My Chat Room")
+        # 메시지당 4토큰, 요약 한 줄당 7토큰
+        self.builder = ChatContextBuilder(token_budget=100, summary_budget=40)
+
+    def load_room(self):
+        return ChatRoom.objects.only(*CONTEXT_ROOM_FIELDS).get(pk=self.chatroom.pk)
+
+    # 저장 시 계산된 토큰 수와 추정 함수 일치 테스트
+    def test_token_count_matches_estimate(self):
+        print("\n메시지 토큰 수 계산 테스트\n")
+        for content in ["hello world", "비타민 D는 하루에 얼마나?", "a"]:
+            message = Message.objects.create(
+                chat_room=self.chatroom, sender=Message.SenderType.USER, content=content
+            )
+            self.assertEqual(message.token_count, estimate_tokens(content))
+            message.refresh_from_db()
+            self.assertEqual(message.token_count, estimate_tokens(content))
+
+        message.content = "내용을 수정한 메시지"
+        message.save(update_fields=["content"])
+        message.refresh_from_db()
+        self.assertEqual(message.token_count, estimate_tokens(message.content))
+
+    # 토큰 수가 아직 채워지지 않은 이전 메시지는 내용으로 계산하는지 테스트
+    def test_missing_token_count_is_estimated(self):
+        print("\n토큰 수 없는 이전 메시지 컨텍스트 테스트\n")
+        create_messages(self.chatroom, 1, 30)
+        Message.objects.filter(chat_room=self.chatroom).update(token_count=None)
+
+        context, _ = self.builder.build(self.load_room(), "질문")
+
+        self.assertEqual(len(context.messages), 14)
+
+    # 예산 안의 최신 메시지만 한 번의 쿼리로 조회하고 나머지는 요약 테스트
+    def test_builds_recent_window_and_summary(self):
+        print("\n최신 메시지 컨텍스트 및 요약 생성 테스트\n")
+        create_messages(self.chatroom, 1, 500)
+        chat_room = self.load_room()
+
+        with self.assertNumQueries(1):
+            context, updates = self.builder.build(chat_room, "질문")
+
+        # 예산 58토큰(100 - 요약 40 - 질문 2) 안의 최신 14개, 오래된 순서
+        self.assertEqual(
+            [content for _, content in context.messages],
+            [f"메시지 {number:03d}" for number in range(487, 501)],
+        )
+        self.assertLessEqual(context.token_count, 100)
+
+        # 요약 예산 안에서 가장 최근에 밀려난 메시지까지 요약
+        boundary = Message.objects.get(content="메시지 486")
+        self.assertEqual(updates["summary_until_id"], boundary.id)
+        self.assertEqual(updates["summary_until"], boundary.created_at)
+        self.assertEqual(
+            updates["summary"].splitlines(),
+            [f"사용자: 메시지 {number:03d}" for number in range(482, 487)],
+        )
+
+    # 새 메시지가 추가되면 밀려난 메시지만 기존 요약에 이어서 반영 테스트
+    def test_updates_summary_incrementally(self):
+        print("\n이전 대화 요약 점진 갱신 테스트\n")
+        create_messages(self.chatroom, 1, 500)
+        _, updates = self.builder.build(self.load_room(), "질문")
+        ChatRoom.objects.filter(pk=self.chatroom.pk).update(**updates)
+
+        create_messages(self.chatroom, 501, 3)
+        chat_room = self.load_room()
+        with self.assertNumQueries(1):
+            context, updates = self.builder.build(chat_room, "질문")
+
+        self.assertEqual(context.messages[-1][1], "메시지 503")
+        self.assertEqual(context.messages[0][1], "메시지 490")
+        self.assertEqual(
+            updates["summary"].splitlines(),
+            [f"사용자: 메시지 {number:03d}" for number in range(485, 490)],
+        )
+        self.assertEqual(
+            updates["summary_until_id"], Message.objects.get(content="메시지 489").id
+        )
+
+    # 예산 안에 모두 들어가면 요약하지 않음
+    def test_short_room_has_no_summary(self):
+        print("\n짧은 대화방 컨텍스트 테스트\n")
+        create_messages(self.chatroom, 1, 5)
+
+        context, updates = self.builder.build(self.load_room(), "질문")
+        self.assertEqual(len(context.messages), 5)
+        self.assertEqual(context.summary, "")
+        self.assertEqual(updates, {})
+
+    # 질문과 관련된 지식 구절이 예산 안에서 컨텍스트에 포함되는지 테스트
+    def test_context_includes_knowledge(self):
+        print("\n컨텍스트 지식 구절 포함 테스트\n")
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        settings_override = override_settings(KNOWLEDGE_INDEX_DIR=directory.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        reset_knowledge_index()
+        self.addCleanup(reset_knowledge_index)
+        Ingredient.objects.create(
+            name="비타민D", functionality="칼슘과 인이 흡수되고 이용되는데 필요"
+        )
+        Ingredient.objects.create(
+            name="루테인",
+            functionality="노화로 인해 감소될 수 있는 황반색소밀도를 유지",
+        )
+        KnowledgeIndexBuilder().run()
+        create_messages(self.chatroom, 1, 5)
+
+        builder = ChatContextBuilder(
+            token_budget=100, summary_budget=40, knowledge_budget=20
+        )
+        context, _ = builder.build(self.load_room(), "칼슘 흡수")
+        passage = ("비타민D", "칼슘과 인이 흡수되고 이용되는데 필요")
+        self.assertEqual(context.knowledge, (passage,))
+        self.assertEqual(
+            context.token_count,
+            sum(estimate_tokens(text) for text in passage) + 5 * 4,
+        )
+
+        # 예산보다 긴 구절은 포함하지 않음
+        builder = ChatContextBuilder(
+            token_budget=100, summary_budget=40, knowledge_budget=5
+        )
+        context, _ = builder.build(self.load_room(), "칼슘 흡수")
+        self.assertEqual(context.knowledge, ())
+
+
+@override_settings(CHAT_CONTEXT_TOKEN_BUDGET=60, CHAT_SUMMARY_TOKEN_BUDGET=30)
+class MessageContextAPITests(APITestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="testuser@example.com", password="password123", nickname="testuser"
+        )
+        self.client.force_authenticate(user=self.user)
+        self.chatroom = ChatRoom.objects.create(user=self.user, title="My Chat Room")
+
+    # 대화가 예산을 넘으면 메시지 전송 시 채팅방 요약이 저장되는지 테스트
+    def test_posting_messages_saves_summary(self):
+        print("\n메시지 전송 시 이전 대화 요약 저장 테스트\n")
+        url = reverse("chat_message-list", kwargs={"chat_room_pk": self.chatroom.pk})
+        for number in range(10):
+            response = self.client.post(
+                url, {"content": f"질문 {number}"}, format="json"
+            )
+            self.assertEqual(response.status_code, 201)
+            self.assertEqual(
+                response.data["token_count"], estimate_tokens(f"질문 {number}")
+            )
+
+        self.chatroom.refresh_from_db()
+        self.assertIn("사용자: 질문", self.chatroom.summary)
+        self.assertIsNotNone(self.chatroom.summary_until_id)
+        self.assertLessEqual(estimate_tokens(self.chatroom.summary), 30)
@@ -0,0 +1,85 @@
+import json
+from datetime import timedelta
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from accounts.models import User
+from chats.archive import MessageArchiver
+from chats.models import ChatRoom, Message
+from chats.serializers import MessageSerializer
+from chats.tests.test_context import create_messages
+
+
+# 대화 내용 NDJSON 내보내기 테스트
+class MessageExportAPITests(APITestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="testuser@example.com", password="password123", nickname="testuser"
+        )
+        self.other_user = User.objects.create_user(
+            email="otheruser@example.com", password="password123", nickname="otheruser"
+        )
+        self.client.force_authenticate(user=self.user)
+        self.chatroom = ChatRoom.objects.create(user=self.user, title="My Chat Room")
+        self.url = reverse(
+            "chat_message-export", kwargs={"chat_room_pk": self.chatroom.pk}
+        )
+
+    def read_lines(self, response):
+        chunks = [chunk.decode() for chunk in response.streaming_content]
+        return chunks, [json.loads(line) for line in "".join(chunks).splitlines()]
+
+    # 보관된 메시지와 최근 메시지를 오래된 순서로 모두 내보내는지 테스트
+    def test_exports_archived_and_recent_messages(self):
+        print("\n대화 내용 NDJSON 내보내기 테스트\n")
+        create_messages(self.chatroom, 1, 30)
+        ChatRoom.objects.filter(pk=self.chatroom.pk).update(
+            updated_at=timezone.now() - timedelta(days=100)
+        )
+        MessageArchiver(inactive_days=90, keep_recent=10, batch_size=8).run()
+        self.assertEqual(Message.objects.filter(chat_room=self.chatroom).count(), 10)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        self.assertIn("attachment", response["Content-Disposition"])
+        chunks, records = self.read_lines(response)
+        # 첫 메시지는 바로 전송
+        self.assertEqual(chunks[0].count("\n"), 1)
+        self.assertEqual(
+            [record["content"] for record in records],
+            [f"메시지 {number:03d}" for number in range(1, 31)],
+        )
+
+        # 최근 메시지는 목록 API와 같은 형식
+        recent = Message.objects.filter(chat_room=self.chatroom).order_by("created_at")
+        expected = json.loads(
+            json.dumps(MessageSerializer(recent, many=True).data, cls=DjangoJSONEncoder)
+        )
+        self.assertEqual(records[20:], expected)
+        self.assertEqual(list(records[0]), list(expected[0]))
+
+    # 메시지가 없는 대화방 테스트
+    def test_export_empty_room(self):
+        print("\n빈 대화방 내보내기 테스트\n")
+        response = self.client.get(self.url, HTTP_ACCEPT="application/x-ndjson")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.read_lines(response)[1], [])
+
+    # 다른 사용자의 대화방은 내보낼 수 없는지 테스트
+    def test_export_other_users_room(self):
+        print("\n다른 사용자 대화방 내보내기 테스트\n")
+        other_chatroom = ChatRoom.objects.create(user=self.other_user, title="Other")
+        create_messages(other_chatroom, 1, 3)
+        url = reverse("chat_message-export", kwargs={"chat_room_pk": other_chatroom.pk})
+
+        response = self.client.get(url, HTTP_ACCEPT="application/x-ndjson")
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertIn("detail", json.loads(response.content))
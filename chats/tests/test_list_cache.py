@@ -0,0 +1,111 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from accounts.models import User
+from chats.list_cache import stats
+from chats.models import ChatRoom
+from chats.tests.test_context import create_messages
+
+
+# 대화방/메시지 목록 첫 페이지 캐시 테스트
+class ChatListCacheTests(APITestCase):
+
+    def setUp(self):
+        cache.clear()
+        stats.reset()
+        self.user = User.objects.create_user(
+            email="testuser@example.com", password="password123", nickname="testuser"
+        )
+        self.other_user = User.objects.create_user(
+            email="otheruser@example.com", password="password123", nickname="otheruser"
+        )
+        self.client.force_authenticate(user=self.user)
+        self.chatroom = ChatRoom.objects.create(user=self.user, title="My Chat Room")
+        ChatRoom.objects.create(user=self.other_user, title="Other's Chat Room")
+        self.rooms_url = reverse("chatroom-list")
+        self.messages_url = reverse(
+            "chat_message-list", kwargs={"chat_room_pk": self.chatroom.pk}
+        )
+
+    def get(self, url, data=None):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, data)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response, len(queries)
+
+    # 변경이 없으면 쿼리 없이 캐시된 목록을 반환하고, 메시지 전송 후에는 다시 조회하는지 테스트
+    def test_room_list_cached_until_message_created(self):
+        print("\n대화방 목록 캐시 적중 및 메시지 전송 시 무효화 테스트\n")
+        first, first_queries = self.get(self.rooms_url)
+        second, second_queries = self.get(self.rooms_url)
+        self.assertGreater(first_queries, 0)
+        self.assertEqual(second_queries, 0)
+        self.assertEqual(first.data, second.data)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(self.messages_url, {"content": "안녕"}, format="json")
+
+        third, third_queries = self.get(self.rooms_url)
+        self.assertGreater(third_queries, 0)
+        self.assertEqual(third.data["results"][0]["message_count"], 2)
+        snapshot = stats.snapshot()["rooms"]
+        self.assertEqual((snapshot["hits"], snapshot["misses"]), (1, 2))
+        self.assertAlmostEqual(snapshot["hit_rate"], 1 / 3)
+
+    # 사용자별로 다른 목록이 캐시되고, 대화방 수정 시 무효화되는지 테스트
+    def test_room_list_per_user_and_room_update(self):
+        print("\n사용자별 대화방 목록 캐시 및 수정 시 무효화 테스트\n")
+        mine, _ = self.get(self.rooms_url)
+        self.client.force_authenticate(user=self.other_user)
+        theirs, _ = self.get(self.rooms_url)
+        self.assertEqual(mine.data["results"][0]["title"], "My Chat Room")
+        self.assertEqual(theirs.data["results"][0]["title"], "Other's Chat Room")
+
+        self.client.force_authenticate(user=self.user)
+        url = reverse("chatroom-detail", kwargs={"pk": self.chatroom.pk})
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.patch(url, {"title": "Renamed"}, format="json")
+        response, _ = self.get(self.rooms_url)
+        self.assertEqual(response.data["results"][0]["title"], "Renamed")
+
+    # 메시지 목록은 첫 페이지만 캐시하고 cursor/검색 요청은 캐시를 거치지 않는지 테스트
+    def test_message_list_first_page_only(self):
+        print("\n메시지 목록 첫 페이지 캐시 및 cursor 요청 우회 테스트\n")
+        create_messages(self.chatroom, 1, 15)
+        first, _ = self.get(self.messages_url)
+        _, cached_queries = self.get(self.messages_url)
+        self.assertEqual(cached_queries, 0)
+
+        cursor = first.data["next"].split("cursor=")[1]
+        second, second_queries = self.get(self.messages_url, {"cursor": cursor})
+        self.assertGreater(second_queries, 0)
+        self.assertEqual(len(second.data["results"]), 5)
+        self.get(self.rooms_url, {"search": "My"})
+
+        snapshot = stats.snapshot()
+        self.assertEqual(
+            (snapshot["messages"]["hits"], snapshot["messages"]["bypasses"]), (1, 1)
+        )
+        self.assertEqual(snapshot["rooms"]["bypasses"], 1)
+
+    # 목록 캐시 통계는 관리자만 조회할 수 있는지 테스트
+    def test_stats_endpoint_requires_admin(self):
+        print("\n목록 캐시 통계 API 권한 테스트\n")
+        url = reverse("chat_list_cache_stats")
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+        self.user.is_staff = True
+        self.user.save()
+        self.get(self.rooms_url)
+        self.get(self.rooms_url)
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["rooms"]["hits"], 1)
+        self.assertEqual(response.data["rooms"]["misses"], 1)
+        self.assertEqual(response.data["rooms"]["hit_rate"], 0.5)
@@ -0,0 +1,163 @@
+import importlib
+from io import StringIO
+from datetime import timedelta
+from types import SimpleNamespace
+
+from django.apps import apps
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from accounts.models import User
+from chats.archive import MessageArchiver
+from chats.models import ChatRoom, Message
+from chats.room_stats import message_stats_updates, save_messages
+from chats.tests.test_context import create_messages
+
+
+# 대화방 마지막 메시지/메시지 수 비정규화 테스트
+class ChatRoomStatsTests(APITestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="testuser@example.com", password="password123", nickname="testuser"
+        )
+        self.client.force_authenticate(user=self.user)
+        self.chatroom = ChatRoom.objects.create(user=self.user, title="My Chat Room")
+
+    # 메시지 전송 시 대화방 목록에 마지막 메시지와 메시지 수가 반영되는지 테스트
+    def test_create_message_updates_room(self):
+        print("\n메시지 전송 시 대화방 통계 갱신 테스트\n")
+        url = reverse("chat_message-list", kwargs={"chat_room_pk": self.chatroom.pk})
+        for content in ("안녕", "비타민 추천해줘"):
+            response = self.client.post(url, {"content": content}, format="json")
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        last = Message.objects.filter(chat_room=self.chatroom).latest("created_at")
+        self.assertEqual(last.sender, Message.SenderType.AI)
+
+        ChatRoom.objects.create(user=self.user, title="Empty Chat Room")
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("chatroom-list"))
+        self.assertEqual(len(queries), 1)
+
+        room, empty = sorted(
+            response.data["results"], key=lambda room: room["message_count"]
+        )[::-1]
+        self.assertEqual(room["message_count"], 4)
+        self.assertEqual(room["last_message_preview"], last.content[:100])
+        self.assertEqual(
+            room["last_message_at"], last.created_at.isoformat().replace("+00:00", "Z")
+        )
+        self.assertEqual(
+            (empty["message_count"], empty["last_message_preview"]), (0, "")
+        )
+        self.assertIsNone(empty["last_message_at"])
+
+    # 늦게 반영된 이전 메시지가 더 최근 마지막 메시지를 덮어쓰지 않는지 테스트
+    def test_keeps_newer_last_message(self):
+        print("\n최근 마지막 메시지 유지 테스트\n")
+        newer = Message(
+            chat_room=self.chatroom, sender=Message.SenderType.USER, content="최근"
+        )
+        save_messages(self.chatroom, [newer])
+        older = Message(
+            chat_room=self.chatroom,
+            sender=Message.SenderType.AI,
+            content="이전",
+            created_at=newer.created_at - timedelta(seconds=1),
+        )
+        ChatRoom.objects.filter(pk=self.chatroom.pk).update(
+            **message_stats_updates([older])
+        )
+
+        self.chatroom.refresh_from_db()
+        self.assertEqual(self.chatroom.message_count, 2)
+        self.assertEqual(self.chatroom.last_message_preview, "최근")
+        self.assertEqual(self.chatroom.last_message_at, newer.created_at)
+
+    # 재계산 명령과 마이그레이션 백필이 보관된 메시지를 포함해 통계를 다시 계산하는지 테스트
+    def test_repair_command(self):
+        print("\n대화방 통계 재계산 명령 테스트\n")
+        create_messages(self.chatroom, 1, 30)
+        archived_room = ChatRoom.objects.create(user=self.user, title="Archived")
+        create_messages(archived_room, 1, 5)
+        ChatRoom.objects.update(updated_at=timezone.now() - timedelta(days=100))
+        MessageArchiver(inactive_days=90, keep_recent=10, batch_size=8).run()
+        MessageArchiver(inactive_days=90, keep_recent=0).archive_room(archived_room.pk)
+        self.assertFalse(Message.objects.filter(chat_room=archived_room).exists())
+
+        migration = importlib.import_module("chats.migrations.0006_room_last_message")
+        repairs = {
+            "command": lambda: call_command(
+                "repair_chat_room_stats", batch_size=1, stdout=StringIO()
+            ),
+            "migration": lambda: migration.backfill_room_stats(
+                apps, SimpleNamespace(connection=connection), batch_size=1
+            ),
+        }
+        for name, repair in repairs.items():
+            with self.subTest(name):
+                ChatRoom.objects.update(
+                    message_count=0, last_message_at=None, last_message_preview=""
+                )
+                repair()
+
+                self.chatroom.refresh_from_db()
+                archived_room.refresh_from_db()
+                last = Message.objects.filter(chat_room=self.chatroom).latest(
+                    "created_at"
+                )
+                self.assertEqual(self.chatroom.message_count, 30)
+                self.assertEqual(self.chatroom.last_message_preview, "메시지 030")
+                self.assertEqual(self.chatroom.last_message_at, last.created_at)
+                self.assertEqual(archived_room.message_count, 5)
+                self.assertEqual(archived_room.last_message_preview, "메시지 005")
+                self.assertIsNotNone(archived_room.last_message_at)
+
+    # 메시지 수정/삭제 시 대화방 목록의 마지막 메시지와 메시지 수가 바로 반영되는지 테스트
+    def test_update_and_delete_message_updates_room(self):
+        print("\n메시지 수정/삭제 시 대화방 통계 갱신 테스트\n")
+        first = Message(
+            chat_room=self.chatroom, sender=Message.SenderType.USER, content="처음"
+        )
+        save_messages(self.chatroom, [first])
+        last = Message(
+            chat_room=self.chatroom, sender=Message.SenderType.AI, content="마지막"
+        )
+        save_messages(self.chatroom, [last])
+        self.client.get(reverse("chatroom-list"))
+
+        def detail_url(message):
+            return reverse(
+                "chat_message-detail",
+                kwargs={"chat_room_pk": self.chatroom.pk, "pk": message.pk},
+            )
+
+        def listed_room():
+            response = self.client.get(reverse("chatroom-list"))
+            room = response.data["results"][0]
+            return room["message_count"], room["last_message_preview"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch(
+                detail_url(last), {"content": "수정한 마지막"}, format="json"
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(listed_room(), (2, "수정한 마지막"))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.delete(detail_url(last))
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(listed_room(), (1, "처음"))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.delete(detail_url(first))
+        self.chatroom.refresh_from_db()
+        self.assertEqual(self.chatroom.message_count, 0)
+        self.assertEqual(self.chatroom.last_message_preview, "")
+        self.assertIsNone(self.chatroom.last_message_at)
@@ -0,0 +1,117 @@
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from accounts.models import User
+from chats.models import ChatRoom, Message
+
+
+# 메시지 검색 API 테스트
+class MessageSearchAPITests(APITestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="testuser@example.com", password="password123", nickname="testuser"
+        )
+        self.other_user = User.objects.create_user(
+            email="otheruser@example.com", password="password123", nickname="otheruser"
+        )
+        self.client.force_authenticate(user=self.user)
+        self.chatroom = ChatRoom.objects.create(user=self.user, title="My Chat Room")
+        self.other_chatroom = ChatRoom.objects.create(
+            user=self.other_user, title="Other's Chat Room"
+        )
+        self.url = reverse("chat_message_search")
+
+    def create_message(self, chat_room, content):
+        return Message.objects.create(
+            chat_room=chat_room, sender=Message.SenderType.USER, content=content
+        )
+
+    # 조사가 붙거나 다른 단어와 붙어 쓴 단어도 검색되고 다른 사용자의 메시지는 제외되는지 테스트
+    def test_search_inside_words_in_own_rooms(self):
+        print("\n메시지 단어 중간 검색 테스트\n")
+        suffixed = self.create_message(self.chatroom, "비타민을 하루에 얼마나 먹나요?")
+        compound = self.create_message(self.chatroom, "종합비타민은 식후에 드세요")
+        self.create_message(self.chatroom, "오메가3 추천해주세요")
+        self.create_message(self.other_chatroom, "비타민을 같이 먹어도 되나요?")
+
+        response = self.client.get(self.url, {"q": "비타민"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.data["results"]
+        self.assertEqual(
+            [item["id"] for item in results], [str(compound.id), str(suffixed.id)]
+        )
+        self.assertEqual(results[0]["chat_room_title"], "My Chat Room")
+        self.assertIn("종합<mark>비타민</mark>은", results[0]["snippet"])
+        self.assertIn("<mark>비타민</mark>을", results[1]["snippet"])
+
+    # 일괄 저장하거나 다른 대화방으로 옮긴 메시지도 대화방 소유자로 검색되는지 테스트
+    def test_message_user_follows_chat_room(self):
+        print("\n메시지 사용자 복사 테스트\n")
+        moved, created = Message.objects.bulk_create(
+            Message(chat_room=self.other_chatroom, sender="user", content=content)
+            for content in ["비타민 질문", "비타민 답변"]
+        )
+        Message.objects.filter(pk=moved.pk).update(chat_room=self.chatroom)
+
+        response = self.client.get(self.url, {"q": "비타민"})
+        self.assertEqual(
+            [item["id"] for item in response.data["results"]], [str(moved.id)]
+        )
+        self.assertEqual(Message.objects.get(pk=created.pk).user_id, self.other_user.pk)
+
+    # 2-gram이 모두 있어도 검색어가 이어져 있지 않으면 제외하고 1글자 검색어도 찾는지 테스트
+    def test_search_checks_contiguous_terms(self):
+        print("\n메시지 2-gram 검색 결과 확인 테스트\n")
+        self.create_message(self.chatroom, "비타 타민")
+        matched = self.create_message(self.chatroom, "비타민D 수치가 낮아요")
+
+        for query in ["비타민", "d"]:
+            response = self.client.get(self.url, {"q": query})
+            self.assertEqual(
+                [item["id"] for item in response.data["results"]], [str(matched.id)]
+            )
+
+    # 여러 단어는 모두 포함한 메시지만 검색되는지 테스트
+    def test_search_requires_all_terms(self):
+        print("\n여러 단어 메시지 검색 테스트\n")
+        matched = self.create_message(self.chatroom, "루테인은 공복에 먹어도 되나요?")
+        self.create_message(self.chatroom, "루테인은 식후에 먹나요?")
+
+        response = self.client.get(self.url, {"q": "루테인 공복"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [item["id"] for item in response.data["results"]], [str(matched.id)]
+        )
+
+    # 스니펫의 메시지 내용은 HTML 이스케이프되는지 테스트
+    def test_snippet_is_escaped(self):
+        print("\n검색 스니펫 HTML 이스케이프 테스트\n")
+        self.create_message(self.chatroom, "칼슘 & 마그네슘")
+
+        response = self.client.get(self.url, {"q": "마그네슘"})
+
+        snippet = response.data["results"][0]["snippet"]
+        self.assertIn("칼슘 &amp; <mark>마그네슘</mark>", snippet)
+
+    # 검색 결과 cursor pagination 테스트
+    def test_search_pagination(self):
+        print("\n메시지 검색 페이지네이션 테스트\n")
+        for number in range(25):
+            self.create_message(self.chatroom, f"유산균 질문 {number}")
+
+        first = self.client.get(self.url, {"q": "유산균"})
+        self.assertEqual(len(first.data["results"]), 20)
+        second = self.client.get(first.data["next"])
+        self.assertEqual(len(second.data["results"]), 5)
+        self.assertIsNone(second.data["next"])
+
+    # 검색어가 없는 경우 테스트
+    def test_search_without_query(self):
+        print("\n검색어 없는 메시지 검색 테스트\n")
+        response = self.client.get(self.url, {"q": " !? "})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("q", response.data)
@@ -0,0 +1,91 @@
+import json
+
+from django.test import AsyncClient, TestCase
+from django.urls import reverse
+from rest_framework_simplejwt.tokens import AccessToken
+
+from accounts.models import User
+from chats.models import ChatRoom, Message
+
+
+def parse_events(body):
+    events = []
+    for block in body.strip().split("\n\n"):
+        event, data = block.split("\n", 1)
+        events.append((event[len("event: ") :], json.loads(data[len("data: ") :])))
+    return events
+
+
+# AI 응답 SSE 스트리밍 테스트
+class MessageStreamTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="testuser@example.com", password="password123", nickname="testuser"
+        )
+        self.other_user = User.objects.create_user(
+            email="otheruser@example.com", password="password123", nickname="otheruser"
+        )
+        self.chatroom = ChatRoom.objects.create(user=self.user, title="My Chat Room")
+        self.other_chatroom = ChatRoom.objects.create(
+            user=self.other_user, title="Other's Chat Room"
+        )
+        self.client = AsyncClient()
+        self.headers = {
+            "Authorization": f"Bearer {AccessToken.for_user(self.user)}",
+            "Accept": "text/event-stream",
+        }
+
+    async def _read(self, response):
+        chunks = [chunk async for chunk in response.streaming_content]
+        return b"".join(chunks).decode()
+
+    # 토큰 단위 스트리밍 후 AI 메시지 저장 테스트
+    async def test_stream_ai_reply(self):
+        print("\nAI 응답 SSE 스트리밍 테스트\n")
+        url = reverse("chat_message-stream", kwargs={"chat_room_pk": self.chatroom.pk})
+        response = await self.client.post(
+            url,
+            {"content": "안녕하세요 AI"},
+            content_type="application/json",
+            headers=self.headers,
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        events = parse_events(await self._read(response))
+
+        self.assertEqual(events[0][0], "message")
+        self.assertEqual(events[0][1]["content"], "안녕하세요 AI")
+        tokens = [data["token"] for event, data in events if event == "token"]
+        self.assertGreater(len(tokens), 1)
+
+        # 마지막 이벤트는 저장된 AI 메시지이며, 내용은 토큰을 이어 붙인 것과 같음
+        event, ai_message = events[-1]
+        self.assertEqual(event, "done")
+        self.assertEqual(ai_message["sender"], Message.SenderType.AI)
+        self.assertEqual(ai_message["content"], "".join(tokens))
+        saved = await Message.objects.aget(pk=ai_message["id"])
+        self.assertEqual(saved.content, "".join(tokens))
+        self.assertEqual(
+            await Message.objects.filter(chat_room=self.chatroom).acount(), 2
+        )
+
+    # 다른 사용자 채팅방 스트리밍 요청 시 오류 이벤트 반환 테스트
+    async def test_stream_other_users_room(self):
+        print("\n다른 사용자 채팅방 스트리밍 권한 테스트\n")
+        url = reverse(
+            "chat_message-stream", kwargs={"chat_room_pk": self.other_chatroom.pk}
+        )
+        response = await self.client.post(
+            url,
+            {"content": "안녕하세요"},
+            content_type="application/json",
+            headers=self.headers,
+        )
+
+        self.assertEqual(response.status_code, 404)
+        self.assertTrue(response.content.decode().startswith("event: error\n"))
+        self.assertFalse(
+            await Message.objects.filter(chat_room=self.other_chatroom).aexists()
+        )
@@ -0,0 +1,201 @@
+import threading
+from contextlib import ExitStack
+from unittest import mock
+
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+from django.test import AsyncClient, TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from accounts.models import User
+from chats.models import ChatRoom, Message
+from chats.throttles import (
+    ConcurrencyLimit,
+    TokenBucket,
+    get_chat_throttle,
+    reset_chat_throttle,
+)
+
+
+async def read_stream(response):
+    return [chunk async for chunk in response.streaming_content]
+
+
+THROTTLE = {"RATE": "2/min", "BURST": 2, "MAX_CONCURRENT": 1, "RETRY_AFTER": 3}
+
+
+# 토큰 버킷/동시 생성 수 제한 단위 테스트
+class ChatThrottleUnitTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+
+    # burst만큼 연속 허용하고 이후에는 토큰이 채워지는 간격마다 하나씩 허용하는지 테스트
+    def test_token_bucket(self):
+        print("\n사용자별 토큰 버킷 테스트\n")
+        bucket = TokenBucket("6/min", burst=3)
+        self.assertEqual([bucket.consume("user", now=100.0) for _ in range(3)], [0] * 3)
+        self.assertEqual(bucket.consume("user", now=100.0), 10.0)
+        self.assertEqual(bucket.consume("other", now=100.0), 0)
+
+        # 거절된 사용자는 다음 토큰까지 캐시를 읽지 않음
+        with mock.patch("chats.throttles.cache") as shared:
+            self.assertEqual(bucket.consume("user", now=104.0), 6.0)
+            shared.get.assert_not_called()
+
+        self.assertEqual(bucket.consume("user", now=110.0), 0)
+        self.assertEqual(bucket.consume("user", now=110.0), 10.0)
+
+    def test_concurrency_limit(self):
+        print("\n전체 동시 생성 수 제한 테스트\n")
+        limit = ConcurrencyLimit(2)
+        self.assertEqual([limit.acquire() for _ in range(3)], [True, True, False])
+        self.assertEqual(cache.get(limit.key), 2)
+        limit.release()
+        self.assertTrue(limit.acquire())
+
+    # 슬롯을 얻을 때 카운터 만료를 연장하고, 만료 후 반환된 슬롯으로 음수가 되지 않는지 테스트
+    def test_concurrency_counter_expiry(self):
+        print("\n동시 생성 수 카운터 만료 테스트\n")
+        limit = ConcurrencyLimit(3)
+        with mock.patch.object(cache, "touch", wraps=cache.touch) as touch:
+            self.assertTrue(limit.acquire())
+            touch.assert_called_once_with(limit.key, limit.timeout)
+        self.assertTrue(limit.acquire())
+
+        # 카운터가 만료된 뒤 새 슬롯 하나를 얻고 이전 슬롯 두 개를 반환
+        cache.delete(limit.key)
+        self.assertTrue(limit.acquire())
+        for _ in range(3):
+            limit.release()
+        self.assertEqual(cache.get(limit.key), 0)
+
+        self.assertEqual([limit.acquire() for _ in range(4)], [True] * 3 + [False])
+
+
+# AI 메시지 전송 API 요청 제한 테스트
+@override_settings(CHAT_THROTTLE=THROTTLE)
+class ChatThrottleAPITests(APITestCase):
+
+    def setUp(self):
+        cache.clear()
+        reset_chat_throttle()
+        self.addCleanup(reset_chat_throttle)
+        self.user = User.objects.create_user(
+            email="testuser@example.com", password="password123", nickname="testuser"
+        )
+        self.client.force_authenticate(user=self.user)
+        self.chatroom = ChatRoom.objects.create(user=self.user, title="My Chat Room")
+        self.url = reverse(
+            "chat_message-list", kwargs={"chat_room_pk": self.chatroom.pk}
+        )
+
+    def post(self, url=None):
+        return self.client.post(url or self.url, {"content": "안녕"}, format="json")
+
+    # 사용자별 요청 수를 넘으면 429와 Retry-After를 응답하는지 테스트
+    def test_rate_limit(self):
+        print("\n사용자별 메시지 전송 요청 제한 테스트\n")
+        self.assertEqual(self.post().status_code, status.HTTP_201_CREATED)
+        stream_url = reverse(
+            "chat_message-stream", kwargs={"chat_room_pk": self.chatroom.pk}
+        )
+        response = self.client.post(
+            stream_url,
+            {"content": "안녕"},
+            format="json",
+            HTTP_ACCEPT="text/event-stream",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        async_to_sync(read_stream)(response)
+
+        response = self.post()
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertEqual(response["Retry-After"], "30")
+        self.assertEqual(response.data["detail"].code, "chat_throttled")
+        self.assertIn("30초 후에 다시 시도해주세요.", response.data["detail"])
+        # 조회 요청과 AI 응답이 끝난 스트리밍은 슬롯을 점유하지 않음
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_200_OK)
+        self.assertEqual(cache.get(get_chat_throttle().concurrency.key), 0)
+
+    # 전체 동시 생성 수를 넘으면 메시지를 저장하지 않고 429를 응답하는지 테스트
+    def test_concurrency_limit(self):
+        print("\n전체 동시 생성 수 제한 테스트\n")
+        with get_chat_throttle().generation_slot():
+            response = self.post()
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertEqual(response["Retry-After"], "3")
+        self.assertFalse(Message.objects.exists())
+        self.assertEqual(self.post().status_code, status.HTTP_201_CREATED)
+
+
+# 비동기 메시지 전송 API 요청 제한 테스트
+@override_settings(CHAT_THROTTLE=THROTTLE)
+class AsyncChatThrottleTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        reset_chat_throttle()
+        self.addCleanup(reset_chat_throttle)
+        self.user = User.objects.create_user(
+            email="testuser@example.com", password="password123", nickname="testuser"
+        )
+        self.chatroom = ChatRoom.objects.create(user=self.user, title="My Chat Room")
+        self.headers = {"Authorization": f"Bearer {AccessToken.for_user(self.user)}"}
+
+    async def test_async_rate_limit(self):
+        print("\n비동기 메시지 전송 요청 제한 테스트\n")
+        url = reverse(
+            "async_chat_message-list", kwargs={"chat_room_pk": self.chatroom.pk}
+        )
+        statuses = []
+        for _ in range(3):
+            response = await AsyncClient().post(
+                url,
+                {"content": "안녕"},
+                content_type="application/json",
+                headers=self.headers,
+            )
+            statuses.append(response.status_code)
+
+        self.assertEqual(statuses, [201, 201, 429])
+        self.assertEqual(response["Retry-After"], "30")
+        self.assertEqual(await Message.objects.acount(), 4)
+
+    # 비동기 뷰의 요청 제한 캐시 호출이 이벤트 루프 스레드 밖에서 실행되는지 테스트
+    async def test_async_throttle_runs_off_event_loop(self):
+        print("\n비동기 요청 제한 캐시 호출 스레드 테스트\n")
+        url = reverse(
+            "async_chat_message-list", kwargs={"chat_room_pk": self.chatroom.pk}
+        )
+        loop_thread = threading.current_thread()
+        threads = []
+
+        def recorded(method):
+            def call(*args, **kwargs):
+                threads.append(threading.current_thread())
+                return method(*args, **kwargs)
+
+            return call
+
+        with ExitStack() as stack:
+            for name in ["get", "set", "add", "incr", "decr", "touch"]:
+                stack.enter_context(
+                    mock.patch.object(
+                        cache, name, side_effect=recorded(getattr(cache, name))
+                    )
+                )
+            response = await AsyncClient().post(
+                url,
+                {"content": "안녕"},
+                content_type="application/json",
+                headers=self.headers,
+            )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertTrue(threads)
+        self.assertNotIn(loop_thread, threads)
+        self.assertEqual(await cache.aget(get_chat_throttle().concurrency.key), 0)
@@ -0,0 +1,236 @@
+import asyncio
+import json
+from unittest import mock
+
+from asgiref.sync import sync_to_async
+from django.test import AsyncClient, TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from accounts.models import User
+from chats.models import ChatRoom, Message
+from chats.pubsub import (
+    ChatFanout,
+    LocalPubSubBackend,
+    get_fanout,
+    publish_messages,
+    reset_fanout,
+    room_channel,
+)
+from chats.websocket import (
+    CLOSE_NOT_FOUND,
+    CLOSE_TRY_AGAIN_LATER,
+    CLOSE_UNAUTHORIZED,
+    websocket_application,
+)
+
+
+# ASGI WebSocket 앱을 직접 호출하는 테스트용 클라이언트
+class SocketClient:
+
+    def __init__(self, path, query_string=b"", headers=()):
+        self.scope = {
+            "type": "websocket",
+            "path": path,
+            "query_string": query_string,
+            "headers": list(headers),
+        }
+        self.inbox = asyncio.Queue()
+        self.outbox = asyncio.Queue()
+        # 해제하면 서버의 전송이 멈춰 느린 클라이언트를 흉내 냄
+        self.sending = asyncio.Event()
+        self.sending.set()
+        self.blocked = asyncio.Event()
+
+    async def _send(self, event):
+        if not self.sending.is_set():
+            self.blocked.set()
+        await self.sending.wait()
+        await self.outbox.put(event)
+
+    async def connect(self):
+        self.task = asyncio.ensure_future(
+            websocket_application(self.scope, self.inbox.get, self._send)
+        )
+        await self.inbox.put({"type": "websocket.connect"})
+        return await self.receive()
+
+    async def receive(self):
+        return await asyncio.wait_for(self.outbox.get(), timeout=2)
+
+    async def receive_json(self):
+        event = await self.receive()
+        return json.loads(event["text"])
+
+    async def disconnect(self):
+        await self.inbox.put({"type": "websocket.disconnect", "code": 1000})
+        await asyncio.wait_for(self.task, timeout=2)
+
+
+# 대화방 WebSocket 실시간 채널 테스트
+class ChatRoomSocketTests(TestCase):
+
+    def setUp(self):
+        reset_fanout()
+        self.addCleanup(reset_fanout)
+        # 테스트 트랜잭션이 열린 DB 연결을 닫지 않도록 함
+        patcher = mock.patch("chats.websocket.close_old_connections")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.user = User.objects.create_user(
+            email="testuser@example.com", password="password123", nickname="testuser"
+        )
+        self.other_user = User.objects.create_user(
+            email="otheruser@example.com", password="password123", nickname="otheruser"
+        )
+        self.chatroom = ChatRoom.objects.create(user=self.user, title="My Chat Room")
+        self.other_chatroom = ChatRoom.objects.create(
+            user=self.other_user, title="Other's Chat Room"
+        )
+        self.token = str(AccessToken.for_user(self.user))
+        self.path = f"/ws/v1/chats/rooms/{self.chatroom.pk}/"
+
+    def socket(self, path=None, token=None):
+        token = token or self.token
+        return SocketClient(
+            path or self.path, headers=[(b"authorization", f"Bearer {token}".encode())]
+        )
+
+    # 메시지를 전송하면 구독 중인 연결로 사용자/AI 메시지가 전달되는지 테스트
+    async def test_pushes_created_messages(self):
+        print("\nWebSocket 새 메시지 전달 테스트\n")
+        socket = self.socket()
+        self.assertEqual((await socket.connect())["type"], "websocket.accept")
+        channel = room_channel(self.chatroom.pk)
+        self.assertEqual(get_fanout().subscriber_count(channel), 1)
+
+        response = await AsyncClient().post(
+            reverse(
+                "async_chat_message-list", kwargs={"chat_room_pk": self.chatroom.pk}
+            ),
+            {"content": "안녕"},
+            content_type="application/json",
+            headers={"Authorization": f"Bearer {self.token}"},
+        )
+        self.assertEqual(response.status_code, 201)
+
+        user_event = await socket.receive_json()
+        ai_event = await socket.receive_json()
+        self.assertEqual(user_event["type"], "message")
+        self.assertEqual(user_event["message"]["id"], response.json()["id"])
+        self.assertEqual(user_event["message"]["content"], "안녕")
+        self.assertEqual(ai_event["message"]["sender"], Message.SenderType.AI)
+
+        await socket.disconnect()
+        self.assertEqual(get_fanout().subscriber_count(channel), 0)
+
+    # 쿼리 파라미터 토큰 인증과 다른 스레드에서의 발행 테스트
+    async def test_query_token_and_publish_from_thread(self):
+        print("\nWebSocket 쿼리 토큰 인증 및 스레드 발행 테스트\n")
+        socket = SocketClient(self.path, query_string=f"token={self.token}".encode())
+        self.assertEqual((await socket.connect())["type"], "websocket.accept")
+
+        message = await Message.objects.acreate(
+            chat_room=self.chatroom, sender=Message.SenderType.USER, content="질문"
+        )
+        await sync_to_async(publish_messages, thread_sensitive=False)([message])
+
+        event = await socket.receive_json()
+        self.assertEqual(event["message"]["id"], str(message.id))
+        await socket.disconnect()
+
+    # 인증 실패/다른 사용자의 대화방/없는 경로 연결 거부 테스트
+    async def test_rejects_connections(self):
+        print("\nWebSocket 연결 거부 테스트\n")
+        cases = [
+            (self.socket(token="invalid"), CLOSE_UNAUTHORIZED),
+            (SocketClient(self.path), CLOSE_UNAUTHORIZED),
+            (
+                self.socket(path=f"/ws/v1/chats/rooms/{self.other_chatroom.pk}/"),
+                CLOSE_NOT_FOUND,
+            ),
+            (self.socket(path="/ws/v1/unknown/"), CLOSE_NOT_FOUND),
+            (self.socket(path=f"/ws/v1/chats/rooms/{'-' * 36}/"), CLOSE_NOT_FOUND),
+        ]
+        for socket, code in cases:
+            event = await socket.connect()
+            self.assertEqual(event, {"type": "websocket.close", "code": code})
+            await asyncio.wait_for(socket.task, timeout=2)
+
+    # 전송 대기열이 가득 찬 느린 연결은 종료되는지 테스트
+    @override_settings(
+        CHAT_PUBSUB={"BACKEND": "chats.pubsub.LocalPubSubBackend", "MAX_BUFFER": 2}
+    )
+    async def test_closes_slow_consumer(self):
+        print("\nWebSocket 느린 연결 종료 테스트\n")
+        reset_fanout()
+        socket = self.socket()
+        await socket.connect()
+        socket.sending.clear()
+
+        # 첫 이벤트 전송이 멈춘 동안 대기열(2개)을 넘치게 발행
+        channel = room_channel(self.chatroom.pk)
+        get_fanout().publish(channel, {"type": "message", "number": 0})
+        await asyncio.wait_for(socket.blocked.wait(), timeout=2)
+        for number in range(1, 4):
+            get_fanout().publish(channel, {"type": "message", "number": number})
+        await asyncio.sleep(0.01)
+        socket.sending.set()
+
+        self.assertEqual((await socket.receive_json())["number"], 0)
+        self.assertEqual(
+            await socket.receive(),
+            {"type": "websocket.close", "code": CLOSE_TRY_AGAIN_LATER},
+        )
+        await socket.disconnect()
+        self.assertEqual(get_fanout().subscriber_count(channel), 0)
+
+
+# fan-out 계층 테스트
+class ChatFanoutTests(TestCase):
+
+    # 같은 채널의 모든 구독자에게 한 번 직렬화한 이벤트를 전달하는지 테스트
+    async def test_fans_out_to_channel_subscribers(self):
+        print("\n채널 구독자 fan-out 테스트\n")
+        fanout = ChatFanout(LocalPubSubBackend(), max_buffer=10)
+        first, second = fanout.subscribe("a"), fanout.subscribe("a")
+        other = fanout.subscribe("b")
+
+        fanout.publish("a", {"type": "message", "content": "비타민"})
+        await asyncio.sleep(0)
+
+        for subscription in (first, second):
+            payload = await asyncio.wait_for(subscription.get(), timeout=1)
+            self.assertEqual(json.loads(payload)["content"], "비타민")
+        self.assertTrue(other.queue.empty())
+
+        fanout.unsubscribe(first)
+        self.assertEqual(fanout.subscriber_count("a"), 1)
+
+
+# REST API 메시지 전송 시 커밋 이후 발행 테스트
+class MessagePublishAPITests(APITestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="testuser@example.com", password="password123", nickname="testuser"
+        )
+        self.client.force_authenticate(user=self.user)
+        self.chatroom = ChatRoom.objects.create(user=self.user, title="My Chat Room")
+
+    def test_create_message_publishes_on_commit(self):
+        print("\n메시지 저장 커밋 이후 발행 테스트\n")
+        url = reverse("chat_message-list", kwargs={"chat_room_pk": self.chatroom.pk})
+        with mock.patch("chats.views.publish_messages") as publish:
+            with self.captureOnCommitCallbacks(execute=False) as callbacks:
+                self.client.post(url, {"content": "안녕"}, format="json")
+            publish.assert_not_called()
+            for callback in callbacks:
+                callback()
+
+        (messages,), _ = publish.call_args
+        self.assertEqual(
+            [message.sender for message in messages],
+            [Message.SenderType.USER, Message.SenderType.AI],
+        )
@@ -0,0 +1,256 @@
+import asyncio
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.throttling import BaseThrottle
+
+from .exceptions import ChatThrottled
+
+# 요청 수/기간 형식의 기간 단위 (DRF 기본 throttle의 rate 형식과 같음)
+RATE_PERIODS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+# 거절 시각을 기억하는 사용자 수 상한 (넘으면 지난 항목을 정리)
+MAX_LOCAL_DENIALS = 10000
+
+
+def parse_rate(rate):
+    count, period = rate.split("/")
+    return int(count), RATE_PERIODS[period[0]]
+
+
+# 사용자별 토큰 버킷 (GCRA: 다음 토큰이 채워지는 이론상 시각 하나만 캐시에 저장)
+# 같은 사용자의 요청이 여러 프로세스에서 동시에 들어오면 읽기/쓰기 사이에 갱신이
+# 덮어써져 조금 더 허용될 수 있음 (DRF 기본 throttle과 같은 수준의 근사)
+class TokenBucket:
+
+    def __init__(self, rate, burst, key_prefix="chat_throttle:bucket"):
+        count, duration = parse_rate(rate)
+        self.interval = duration / count
+        # 비어 있는 버킷에서 연속으로 허용하는 요청 수가 burst가 되도록 하는 허용 오차
+        self.tolerance = self.interval * (burst - 1)
+        self.timeout = int(self.interval * burst) + 1
+        self.key_prefix = key_prefix
+        # 프로세스 안 빠른 경로: 거절된 사용자는 다음 토큰이 채워질 때까지 캐시를 읽지 않음
+        self._denied_until = {}
+
+    # 요청 하나를 허용하면 0, 아니면 다시 요청할 수 있을 때까지의 시간(초)을 반환
+    def consume(self, key, now=None):
+        now = time.time() if now is None else now
+        wait = self._denied_wait(key, now)
+        if wait:
+            return wait
+        cache_key = f"{self.key_prefix}:{key}"
+        tat, wait = self._next(key, cache.get(cache_key, now), now)
+        if not wait:
+            cache.set(cache_key, tat, self.timeout)
+        return wait
+
+    # 비동기 뷰용 consume (캐시 조회가 이벤트 루프를 막지 않음)
+    async def aconsume(self, key, now=None):
+        now = time.time() if now is None else now
+        wait = self._denied_wait(key, now)
+        if wait:
+            return wait
+        cache_key = f"{self.key_prefix}:{key}"
+        tat, wait = self._next(key, await cache.aget(cache_key, now), now)
+        if not wait:
+            await cache.aset(cache_key, tat, self.timeout)
+        return wait
+
+    # 이 프로세스에서 이미 거절한 사용자면 남은 대기 시간(초), 아니면 0
+    def _denied_wait(self, key, now):
+        denied_until = self._denied_until.get(key)
+        if denied_until is not None:
+            if now < denied_until:
+                return denied_until - now
+            self._denied_until.pop(key, None)
+        return 0.0
+
+    # 캐시에 저장된 시각으로 (새로 저장할 시각, 대기 시간)을 계산 (거절하면 시각은 None)
+    def _next(self, key, tat, now):
+        tat = max(tat, now)
+        allow_at = tat - self.tolerance
+        if now < allow_at:
+            if len(self._denied_until) >= MAX_LOCAL_DENIALS:
+                self._denied_until = {
+                    key: until
+                    for key, until in self._denied_until.items()
+                    if until > now
+                }
+            self._denied_until[key] = allow_at
+            return None, allow_at - now
+        return tat + self.interval, 0.0
+
+
+# 전체 사용자의 동시 AI 메시지 생성 수 제한 (공유 캐시의 원자적 incr/decr 사용)
+# 카운터 만료 시각은 슬롯을 얻을 때마다 연장하므로 사용 중에는 초기화되지 않고,
+# 프로세스가 중간에 종료되어 반환하지 못한 슬롯은 timeout 동안 새 요청이 없을 때 정리됨
+class ConcurrencyLimit:
+
+    def __init__(self, limit, key="chat_throttle:in_flight", timeout=600):
+        self.limit = limit
+        self.key = key
+        self.timeout = timeout
+        self._local = 0
+        self._lock = threading.Lock()
+
+    # 슬롯을 얻으면 True (이 프로세스만으로 이미 상한이면 캐시를 거치지 않고 거절)
+    def acquire(self):
+        if not self._reserve_local():
+            return False
+        try:
+            count = cache.incr(self.key)
+        except ValueError:
+            cache.add(self.key, 0, self.timeout)
+            count = cache.incr(self.key)
+        cache.touch(self.key, self.timeout)
+        if count > self.limit:
+            self.release()
+            return False
+        return True
+
+    # 비동기 뷰용 acquire (캐시 조회가 이벤트 루프를 막지 않음)
+    async def aacquire(self):
+        if not self._reserve_local():
+            return False
+        try:
+            count = await cache.aincr(self.key)
+        except ValueError:
+            await cache.aadd(self.key, 0, self.timeout)
+            count = await cache.aincr(self.key)
+        await cache.atouch(self.key, self.timeout)
+        if count > self.limit:
+            await self.arelease()
+            return False
+        return True
+
+    def release(self):
+        self._release_local()
+        try:
+            count = cache.decr(self.key)
+        except ValueError:
+            # 카운터가 만료된 경우
+            return
+        # 만료 후 다시 만들어진 카운터에 이전 슬롯을 반환한 경우 0 아래로 내려가지 않게 함
+        if count < 0:
+            cache.incr(self.key, -count)
+
+    async def arelease(self):
+        self._release_local()
+        try:
+            count = await cache.adecr(self.key)
+        except ValueError:
+            return
+        if count < 0:
+            await cache.aincr(self.key, -count)
+
+    def _reserve_local(self):
+        with self._lock:
+            if self._local >= self.limit:
+                return False
+            self._local += 1
+            return True
+
+    def _release_local(self):
+        with self._lock:
+            self._local -= 1
+
+
+# settings.CHAT_THROTTLE 설정의 사용자별 요청 제한과 전체 동시 생성 수 제한
+class ChatThrottle:
+
+    def __init__(self, rate=None, burst=1, max_concurrent=None, retry_after=1):
+        self.bucket = TokenBucket(rate, burst) if rate else None
+        self.concurrency = ConcurrencyLimit(max_concurrent) if max_concurrent else None
+        self.retry_after = retry_after
+
+    def consume(self, user_id):
+        if self.bucket is None:
+            return 0.0
+        return self.bucket.consume(user_id)
+
+    async def aconsume(self, user_id):
+        if self.bucket is None:
+            return 0.0
+        return await self.bucket.aconsume(user_id)
+
+    # 전체 동시 생성 슬롯 하나를 점유하고 반환 함수를 돌려줌 (없으면 ChatThrottled)
+    def acquire_slot(self):
+        if self.concurrency is None:
+            return lambda: None
+        if not self.concurrency.acquire():
+            raise ChatThrottled(wait=self.retry_after)
+        return self.concurrency.release
+
+    # AI 메시지 생성 동안 슬롯을 점유
+    @contextmanager
+    def generation_slot(self):
+        release = self.acquire_slot()
+        try:
+            yield
+        finally:
+            release()
+
+    # 비동기 뷰에서 AI 메시지 생성 동안 슬롯을 점유
+    @asynccontextmanager
+    async def ageneration_slot(self):
+        if self.concurrency is None:
+            yield
+            return
+        if not await self.concurrency.aacquire():
+            raise ChatThrottled(wait=self.retry_after)
+        try:
+            yield
+        finally:
+            await self.concurrency.arelease()
+
+
+# 스트리밍 응답이 끝나거나 중단될 때 슬롯을 반환하도록 감싼 비동기 이터레이터
+# (반환은 캐시를 사용하므로 이벤트 루프 밖의 스레드에서 실행하고, 연결이 끊겨도 반환되도록 보호)
+async def release_after(stream, release):
+    try:
+        async for chunk in stream:
+            yield chunk
+    finally:
+        await asyncio.shield(sync_to_async(release)())
+
+
+_throttle = None
+_throttle_lock = threading.Lock()
+
+
+def get_chat_throttle():
+    global _throttle
+    with _throttle_lock:
+        if _throttle is None:
+            config = settings.CHAT_THROTTLE
+            _throttle = ChatThrottle(
+                rate=config.get("RATE"),
+                burst=config.get("BURST", 1),
+                max_concurrent=config.get("MAX_CONCURRENT"),
+                retry_after=config.get("RETRY_AFTER", 1),
+            )
+        return _throttle
+
+
+def reset_chat_throttle():
+    global _throttle
+    with _throttle_lock:
+        _throttle = None
+
+
+# AI 메시지를 생성하는 POST 요청에만 적용하는 사용자별 요청 제한
+class ChatMessageRateThrottle(BaseThrottle):
+
+    def allow_request(self, request, view):
+        if request.method != "POST":
+            return True
+        self.wait_seconds = get_chat_throttle().consume(request.user.pk)
+        return not self.wait_seconds
+
+    def wait(self):
+        return self.wait_seconds
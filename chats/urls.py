@@ -1,6 +1,12 @@
 from django.urls import path, include
 
-from .views import ChatRoomViewSet, MessageViewSet
+from .async_views import AsyncChatRoomListView, AsyncMessageListView
+from .views import (
+    ChatListCacheStatsView,
+    ChatRoomViewSet,
+    MessageSearchView,
+    MessageViewSet,
+)
 from core.routers import NestedRouter
 
 router = NestedRouter()
@@ -15,4 +21,19 @@ router.register_nested(
 
 urlpatterns = [
     path("", include(router.urls)),
+    # 사용자의 전체 대화방 메시지 검색
+    path("messages/search/", MessageSearchView.as_view(), name="chat_message_search"),
+    # 목록 캐시 통계 (관리자 전용)
+    path(
+        "list-cache/stats/",
+        ChatListCacheStatsView.as_view(),
+        name="chat_list_cache_stats",
+    ),
+    # 비동기 ORM 기반 채팅 API (ASGI 서버에서 스레드 전환 없이 처리)
+    path("async/rooms/", AsyncChatRoomListView.as_view(), name="async_chatroom-list"),
+    path(
+        "async/rooms/<uuid:chat_room_pk>/messages/",
+        AsyncMessageListView.as_view(),
+        name="async_chat_message-list",
+    ),
 ]
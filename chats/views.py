@@ -1,32 +1,116 @@
-from rest_framework import viewsets, permissions, filters
+from django.db import transaction
+from django.http import StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+from rest_framework import viewsets, permissions, filters, generics
+from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound, ValidationError
 from rest_framework.pagination import CursorPagination
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+from rest_framework.views import APIView
+
+from accounts.authentication import ClaimsJWTAuthentication
+from .archive import load_archived_messages
+from .async_views import decode_cursor, encode_cursor
+from .backends.dispatcher import DispatcherBusy, get_dispatcher
+from .context import CONTEXT_ROOM_FIELDS, ChatContextBuilder
+from .exceptions import AIBackendBusy, ChatThrottled
+from .export import NDJSONRenderer, export_messages
+from .list_cache import (
+    CachedFirstPageMixin,
+    room_version_key,
+    stats as list_cache_stats,
+    user_version_key,
+)
 from .models import ChatRoom, Message
-from .serializers import ChatRoomSerializer, MessageSerializer
+from .pubsub import publish_messages
+from .room_stats import refresh_room_after_change, save_messages
+from .search import room_titles, search_messages, search_terms
+from .serializers import (
+    ChatRoomSerializer,
+    MessageSearchSerializer,
+    MessageSerializer,
+)
+from .streaming import EventStreamRenderer, stream_ai_reply
+from .throttles import ChatMessageRateThrottle, get_chat_throttle, release_after
 
 
 # 채팅방 cursor pagination
 class ChatRoomCursorPagination(CursorPagination):
     page_size = 10
-    ordering = "-updated_at"
+    ordering = ("-updated_at", "-id")
 
 
 # 메시지 cursor pagination
+# 최근 메시지를 모두 넘기면 보관된 이전 메시지로 이어서 조회 (?archive_cursor=...)
 class MessageCursorPagination(CursorPagination):
     page_size = 10
-    ordering = "-created_at"
+    ordering = ("-created_at", "-id")
+    archive_query_param = "archive_cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.archive_position = None
+        archive_cursor = request.query_params.get(self.archive_query_param)
+        if archive_cursor is None:
+            page = super().paginate_queryset(queryset, request, view)
+            if page is None or self.has_next:
+                return page
+            before = (page[-1].created_at, page[-1].id) if page else None
+        else:
+            # 보관 메시지 페이지는 이전 메시지 방향으로만 이동
+            try:
+                before = decode_cursor(archive_cursor)
+            except ValueError:
+                raise NotFound(self.invalid_cursor_message)
+            self.request = request
+            self.page_size = self.get_page_size(request)
+            self.base_url = request.build_absolute_uri()
+            self.cursor = None
+            self.has_next = self.has_previous = False
+            page = []
+
+        remaining = self.page_size - len(page)
+        archived = load_archived_messages(
+            view.kwargs.get("chat_room_pk"), request.user, before, remaining + 1
+        )
+        page = self.page = page + archived[:remaining]
+        if len(archived) > remaining:
+            self.archive_position = (page[-1].created_at, page[-1].id)
+            self.display_page_controls = True
+        return page
+
+    def get_next_link(self):
+        if self.archive_position is None:
+            return super().get_next_link()
+        url = remove_query_param(self.base_url, self.cursor_query_param)
+        return replace_query_param(
+            url, self.archive_query_param, encode_cursor(*self.archive_position)
+        )
+
+
+# 메시지 검색 cursor pagination
+class MessageSearchCursorPagination(CursorPagination):
+    page_size = 20
+    ordering = ("-created_at", "-id")
 
 
-# 채팅방 viewset
-class ChatRoomViewSet(viewsets.ModelViewSet):
+# 채팅방 viewset (첫 페이지 목록은 사용자 버전 아래에 캐시)
+class ChatRoomViewSet(CachedFirstPageMixin, viewsets.ModelViewSet):
 
     queryset = ChatRoom.objects.all().order_by("-updated_at")
     serializer_class = ChatRoomSerializer
 
+    authentication_classes = [ClaimsJWTAuthentication]
     permission_classes = [permissions.IsAuthenticated]
     pagination_class = ChatRoomCursorPagination
 
     filter_backends = [filters.SearchFilter]
     search_fields = ["title"]
+    list_cache_name = "rooms"
+
+    def get_list_version_key(self):
+        return user_version_key(self.request.user.pk)
 
     def get_queryset(self):
         return self.queryset.filter(user=self.request.user)
@@ -35,30 +119,164 @@ class ChatRoomViewSet(viewsets.ModelViewSet):
         serializer.save(user=self.request.user)
 
 
-# 메시지 viewset
-class MessageViewSet(viewsets.ModelViewSet):
+# 메시지 viewset (첫 페이지 목록은 대화방 버전 아래에 캐시)
+class MessageViewSet(CachedFirstPageMixin, viewsets.ModelViewSet):
     queryset = Message.objects.all()
     serializer_class = MessageSerializer
+    authentication_classes = [ClaimsJWTAuthentication]
     permission_classes = [permissions.IsAuthenticated]
     pagination_class = MessageCursorPagination
+    throttle_classes = [ChatMessageRateThrottle]
+    list_cache_name = "messages"
+
+    def get_list_version_key(self):
+        return room_version_key(self.kwargs.get("chat_room_pk"))
+
+    def throttled(self, request, wait):
+        raise ChatThrottled(wait=wait)
 
     def get_queryset(self):
         chat_room_pk = self.kwargs.get("chat_room_pk")
         return self.queryset.filter(chat_room=chat_room_pk)
 
     def perform_create(self, serializer):
-        chat_room_pk = self.kwargs.get("chat_room_pk")
-        chat_room = ChatRoom.objects.get(pk=chat_room_pk)
+        # 채팅방 조회와 소유자 확인을 한 번의 쿼리로 처리
+        chat_room = get_object_or_404(
+            ChatRoom.objects.only(*CONTEXT_ROOM_FIELDS),
+            pk=self.kwargs.get("chat_room_pk"),
+            user=self.request.user,
+        )
+        content = serializer.validated_data["content"]
+        context, summary_updates = ChatContextBuilder().build(chat_room, content)
 
-        # 사용자 메시지 저장
-        user_message = serializer.save(
-            chat_room=chat_room, sender=Message.SenderType.USER
+        # AI 응답 생성 (요청이 밀리면 메시지를 저장하지 않고 503 응답)
+        try:
+            with get_chat_throttle().generation_slot():
+                reply = get_dispatcher().generate_sync(content, context)
+        except DispatcherBusy:
+            raise AIBackendBusy()
+
+        # 사용자/AI 메시지를 한 번에 저장하고 채팅방은 마지막 메시지와 요약만 갱신
+        user_message = Message(
+            chat_room=chat_room, sender=Message.SenderType.USER, content=content
+        )
+        ai_message = Message(
+            chat_room=chat_room, sender=Message.SenderType.AI, content=reply
         )
-        # AI 응답 메시지 저장 로직 생성 예정
-        Message.objects.create(
+        with transaction.atomic():
+            save_messages(chat_room, [user_message, ai_message], **summary_updates)
+            transaction.on_commit(lambda: publish_messages([user_message, ai_message]))
+
+        serializer.instance = user_message
+
+    # 메시지 수정/삭제는 신호 대신 여기서 대화방 통계와 목록 캐시 버전을 갱신
+    # (Message에 post_delete 수신자를 두면 대화방 삭제 시 CASCADE가 행마다 처리됨)
+    def perform_update(self, serializer):
+        with transaction.atomic():
+            super().perform_update(serializer)
+            refresh_room_after_change(serializer.instance.chat_room_id)
+
+    def perform_destroy(self, instance):
+        with transaction.atomic():
+            super().perform_destroy(instance)
+            refresh_room_after_change(instance.chat_room_id, deleted=1)
+
+    # AI 응답을 Server-Sent Events로 토큰 단위 스트리밍
+    # (ASGI 환경에서는 이벤트 루프에서 비동기로 전송되어 첫 토큰부터 바로 전달)
+    @action(
+        detail=False,
+        methods=["post"],
+        renderer_classes=[JSONRenderer, EventStreamRenderer],
+    )
+    def stream(self, request, *args, **kwargs):
+        chat_room = get_object_or_404(
+            ChatRoom.objects.only(*CONTEXT_ROOM_FIELDS),
+            pk=self.kwargs.get("chat_room_pk"),
+            user=request.user,
+        )
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        context, summary_updates = ChatContextBuilder().build(
+            chat_room, serializer.validated_data["content"]
+        )
+
+        # 스트리밍이 끝날 때까지 동시 생성 슬롯을 점유 (없으면 메시지를 저장하지 않음)
+        release = get_chat_throttle().acquire_slot()
+
+        # 사용자 메시지는 먼저 저장하고, AI 메시지는 스트리밍이 끝난 뒤 저장
+        user_message = Message(
             chat_room=chat_room,
-            sender=Message.SenderType.AI,
-            content=f"AI 응답: 기능 생성 예정",
+            sender=Message.SenderType.USER,
+            content=serializer.validated_data["content"],
+        )
+        try:
+            save_messages(chat_room, [user_message])
+        except Exception:
+            release()
+            raise
+        publish_messages([user_message])
+        response = StreamingHttpResponse(
+            release_after(
+                stream_ai_reply(chat_room, user_message, context, summary_updates),
+                release,
+            ),
+            content_type="text/event-stream",
+        )
+        response["Cache-Control"] = "no-cache"
+        response["X-Accel-Buffering"] = "no"
+        return response
+
+    # 대화 내용을 NDJSON으로 스트리밍 내보내기 (보관된 메시지 포함, 오래된 순서)
+    @action(
+        detail=False,
+        methods=["get"],
+        renderer_classes=[JSONRenderer, NDJSONRenderer],
+    )
+    def export(self, request, *args, **kwargs):
+        chat_room = get_object_or_404(
+            ChatRoom.objects.only("id"),
+            pk=self.kwargs.get("chat_room_pk"),
+            user=request.user,
+        )
+        response = StreamingHttpResponse(
+            export_messages(chat_room.pk), content_type="application/x-ndjson"
+        )
+        response["Content-Disposition"] = (
+            f'attachment; filename="chat-{chat_room.pk}.ndjson"'
         )
+        response["X-Accel-Buffering"] = "no"
+        return response
+
+
+# 사용자의 전체 대화방 메시지 검색 (?q=검색어, 최신순)
+class MessageSearchView(generics.ListAPIView):
+    serializer_class = MessageSearchSerializer
+    authentication_classes = [ClaimsJWTAuthentication]
+    permission_classes = [permissions.IsAuthenticated]
+    pagination_class = MessageSearchCursorPagination
+
+    def get_queryset(self):
+        self.terms = search_terms(self.request.query_params.get("q", ""))
+        if not self.terms:
+            raise ValidationError({"q": ["검색어를 입력해주세요."]})
+        return search_messages(self.request.user, self.terms)
+
+    # 대화방 제목은 결과 페이지의 대화방만 조회
+    def paginate_queryset(self, queryset):
+        page = super().paginate_queryset(queryset)
+        self.room_titles = room_titles(page)
+        return page
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context["room_titles"] = getattr(self, "room_titles", {})
+        context["search_terms"] = getattr(self, "terms", [])
+        return context
+
+
+# 대화방/메시지 목록 캐시 적중률 및 재생성 지연 시간 (현재 프로세스 기준)
+class ChatListCacheStatsView(APIView):
+    permission_classes = [permissions.IsAdminUser]
 
-        chat_room.save()
+    def get(self, request, *args, **kwargs):
+        return Response(list_cache_stats.snapshot())
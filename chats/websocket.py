@@ -0,0 +1,121 @@
+import asyncio
+import re
+import uuid
+from urllib.parse import parse_qs
+
+from asgiref.sync import sync_to_async
+from django.db import close_old_connections
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.settings import api_settings
+
+from .async_views import aget_user_for_token
+from .models import ChatRoom
+from .pubsub import get_fanout, room_channel
+
+# 연결 종료 코드 (4000번대는 HTTP 상태 코드에 맞춤)
+CLOSE_UNAUTHORIZED = 4401
+CLOSE_NOT_FOUND = 4404
+# 전송 대기열이 가득 찬 느린 연결 (클라이언트는 재연결 후 REST API로 누락분을 조회)
+CLOSE_TRY_AGAIN_LATER = 1013
+
+# REST API와 같은 인증 헤더 (ASGI scope 헤더 이름은 소문자)
+AUTH_HEADER = (
+    api_settings.AUTH_HEADER_NAME.removeprefix("HTTP_").replace("_", "-").lower()
+).encode()
+
+
+# Authorization 헤더 또는 헤더를 지정할 수 없는 브라우저용 ?token= 쿼리 파라미터
+def scope_token(scope):
+    for name, value in scope.get("headers", []):
+        if name == AUTH_HEADER:
+            try:
+                return JWTAuthentication().get_raw_token(value)
+            except AuthenticationFailed:
+                return None
+    tokens = parse_qs(scope.get("query_string", b"").decode()).get("token")
+    return tokens[0] if tokens else None
+
+
+async def close(send, code):
+    await send({"type": "websocket.close", "code": code})
+
+
+# 구독한 이벤트를 전송하면서 클라이언트 연결 종료를 기다림
+async def pump(subscription, receive, send):
+    async def forward():
+        while True:
+            payload = await subscription.get()
+            try:
+                if payload is None:
+                    await close(send, CLOSE_TRY_AGAIN_LATER)
+                    return
+                await send({"type": "websocket.send", "text": payload})
+            except OSError:
+                # 전송 중 클라이언트 연결이 끊긴 경우
+                return
+
+    async def drain():
+        # 클라이언트가 보내는 메시지는 사용하지 않음
+        while (await receive())["type"] != "websocket.disconnect":
+            pass
+
+    tasks = [asyncio.ensure_future(forward()), asyncio.ensure_future(drain())]
+    done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+    for task in pending:
+        task.cancel()
+    await asyncio.gather(*pending, return_exceptions=True)
+    for task in done:
+        task.result()
+
+
+# 대화방 실시간 채널: 대화방에 새로 저장되는 메시지를 JSON 텍스트 프레임으로 전송
+async def chat_room_socket(scope, receive, send, chat_room_pk):
+    if (await receive())["type"] != "websocket.connect":
+        return
+
+    raw_token = scope_token(scope)
+    user = await aget_user_for_token(raw_token) if raw_token else None
+    if user is None:
+        await close(send, CLOSE_UNAUTHORIZED)
+        return
+    # 경로 패턴은 UUID 형식을 느슨하게만 확인하므로 ("-" 36개 등) 직접 변환
+    try:
+        chat_room_pk = uuid.UUID(chat_room_pk)
+    except ValueError:
+        await close(send, CLOSE_NOT_FOUND)
+        return
+    exists = await ChatRoom.objects.filter(pk=chat_room_pk, user=user).aexists()
+    # 연결이 유지되는 동안 DB 연결을 점유하지 않도록 반환
+    await sync_to_async(close_old_connections)()
+    if not exists:
+        await close(send, CLOSE_NOT_FOUND)
+        return
+
+    fanout = get_fanout()
+    subscription = fanout.subscribe(room_channel(chat_room_pk))
+    try:
+        await send({"type": "websocket.accept"})
+        await pump(subscription, receive, send)
+    finally:
+        fanout.unsubscribe(subscription)
+
+
+websocket_routes = [
+    (
+        re.compile(r"^/ws/v1/chats/rooms/(?P<chat_room_pk>[0-9a-f-]{36})/$"),
+        chat_room_socket,
+    ),
+]
+
+
+# ASGI WebSocket 연결을 경로에 맞는 핸들러로 전달
+async def websocket_application(scope, receive, send):
+    for pattern, handler in websocket_routes:
+        match = pattern.match(scope["path"])
+        if match:
+            await handler(scope, receive, send, **match.groupdict())
+            return
+
+    if (await receive())["type"] == "websocket.connect":
+        await close(send, CLOSE_NOT_FOUND)
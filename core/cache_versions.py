@@ -0,0 +1,31 @@
+import uuid
+
+from django.core.cache import cache
+
+# 버전 키 방식의 캐시 무효화
+# 캐시 항목은 키에 현재 버전을 넣어 저장하고, 데이터가 바뀌면 버전만 새 값으로 바꿈
+# 항목을 만들 때는 조회 전에 current_version으로 버전을 읽어 두어,
+# 조회 중 바뀐 결과는 이전 버전 아래에만 저장되고 다시 읽히지 않게 함
+
+
+# 버전은 증가하는 숫자 대신 매번 새 임의 값을 사용
+# (버전 키가 만료/축출된 뒤 같은 번호로 다시 시작해 이전 항목을 읽는 일이 없음)
+def new_version():
+    return uuid.uuid4().hex[:16]
+
+
+# 버전 키의 현재 버전 (없으면 새로 저장하고, 동시에 다른 요청이 먼저 저장했다면 그 값을 사용)
+def current_version(key, timeout):
+    version = cache.get(key)
+    if version is None:
+        version = new_version()
+        if not cache.add(key, version, timeout):
+            version = cache.get(key, version)
+    return version
+
+
+# 버전 키들을 새 버전으로 바꿈 (이전 버전의 항목은 만료될 때까지 사용되지 않음)
+def bump_versions(keys, timeout):
+    versions = {key: new_version() for key in keys}
+    if versions:
+        cache.set_many(versions, timeout)
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class DataManagementsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'data_managements'
+
+    def ready(self):
+        from . import signals  # noqa: F401
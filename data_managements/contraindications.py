@@ -0,0 +1,238 @@
+import re
+from collections import deque
+
+from django.db import transaction
+from django.db.models import Exists, OuterRef, Q
+
+from accounts.models import Allergy, ChronicDisease, Medication
+from accounts.registry import get_registry
+
+from .models import (
+    Contraindication,
+    DietarySupplements,
+    DietarySupplementsIngredient,
+    Ingredient,
+)
+
+# Contraindication 모델의 건강 정보 FK 필드명과 대상 모델
+HEALTH_INFO_FIELDS = {
+    "chronic_disease": ChronicDisease,
+    "allergy": Allergy,
+    "medication": Medication,
+}
+
+# 한 글자 이름은 주의사항 문장 대부분과 겹치므로 색인에서 제외
+MIN_KEYWORD_LENGTH = 2
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+# 띄어쓰기 차이("우유 단백"/"우유단백")를 무시하도록 공백을 제거하고 소문자로 변환
+def normalize_text(text):
+    return _WHITESPACE.sub("", text or "").lower()
+
+
+# 여러 키워드를 텍스트 한 번 순회로 찾는 Aho-Corasick 매처
+class KeywordMatcher:
+
+    def __init__(self):
+        self._goto = [{}]
+        self._fail = [0]
+        self._outputs = [[]]
+        self._keyword_count = 0
+        self._built = False
+
+    def __len__(self):
+        return self._keyword_count
+
+    def add(self, keyword, value):
+        keyword = normalize_text(keyword)
+        if len(keyword) < MIN_KEYWORD_LENGTH:
+            return
+
+        node = 0
+        for char in keyword:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][char] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._outputs.append([])
+            node = next_node
+        self._outputs[node].append(value)
+        self._keyword_count += 1
+        self._built = False
+
+    # 실패 링크를 BFS로 계산하고 접미사 노드의 출력을 병합
+    def build(self):
+        queue = deque(self._goto[0].values())
+        for node in queue:
+            self._fail[node] = 0
+
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0)
+                self._outputs[child] = (
+                    self._outputs[child] + self._outputs[self._fail[child]]
+                )
+        self._built = True
+        return self
+
+    # 텍스트에 포함된 모든 키워드의 value 집합을 반환
+    def find(self, text):
+        if not self._built:
+            self.build()
+
+        found = set()
+        node = 0
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        for char in normalize_text(text):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if outputs[node]:
+                found.update(outputs[node])
+        return found
+
+
+# 건강 정보 이름으로 매처를 구성 (value는 (FK 필드명, id), 목록은 accounts.registry 사용)
+def build_health_info_matcher():
+    matcher = KeywordMatcher()
+    for field_name, model in HEALTH_INFO_FIELDS.items():
+        for item in get_registry(model).all():
+            matcher.add(item.name, (field_name, item.pk))
+    return matcher.build()
+
+
+# 건강기능식품/원료 주의사항과 건강 정보 간의 매칭 결과를 색인하는 오프라인 작업
+class ContraindicationIndexer:
+
+    def __init__(self, batch_size=1000, chunk_size=2000):
+        self.batch_size = batch_size
+        self.chunk_size = chunk_size
+
+    # 전체 또는 지정한 제품들의 색인을 다시 생성하고 저장한 행 수를 반환
+    def rebuild(self, supplement_ids=None):
+        matcher = build_health_info_matcher()
+        return self._reindex(matcher, supplement_ids=supplement_ids)
+
+    # 주의사항이 바뀐 원료를 포함하는 제품들만 다시 색인
+    def refresh_ingredients(self, ingredient_ids):
+        supplement_ids = set(
+            DietarySupplementsIngredient.objects.filter(
+                ingredient_id__in=list(ingredient_ids)
+            )
+            .order_by()
+            .values_list("dietary_supplements_id", flat=True)
+        )
+        if not supplement_ids:
+            return 0
+        return self.rebuild(supplement_ids=supplement_ids)
+
+    # 건강 정보 한 건(이름 추가/변경)에 대해서만 전체 카탈로그를 다시 매칭
+    def refresh_health_info(self, instance):
+        field_name = next(
+            name
+            for name, model in HEALTH_INFO_FIELDS.items()
+            if isinstance(instance, model)
+        )
+        matcher = KeywordMatcher()
+        matcher.add(instance.name, (field_name, instance.pk))
+        return self._reindex(matcher.build(), scope=Q(**{field_name: instance.pk}))
+
+    def _reindex(self, matcher, supplement_ids=None, scope=None):
+        hits = self._collect_hits(matcher, supplement_ids)
+
+        existing = Contraindication.objects.all()
+        if supplement_ids is not None:
+            existing = existing.filter(supplement_id__in=list(supplement_ids))
+        if scope is not None:
+            existing = existing.filter(scope)
+
+        with transaction.atomic():
+            existing.delete()
+            Contraindication.objects.bulk_create(
+                hits, batch_size=self.batch_size, ignore_conflicts=True
+            )
+        return len(hits)
+
+    def _collect_hits(self, matcher, supplement_ids=None):
+        if not len(matcher):
+            return []
+
+        hits = []
+
+        # 원료 주의사항 매칭 결과를 먼저 계산 (원료 목록은 제품보다 훨씬 작음)
+        ingredient_hits = {}
+        ingredients = (
+            Ingredient.objects.exclude(precautions__isnull=True)
+            .exclude(precautions="")
+            .order_by()
+            .values_list("id", "precautions")
+        )
+        for ingredient_id, precautions in ingredients.iterator(
+            chunk_size=self.chunk_size
+        ):
+            found = matcher.find(precautions)
+            if found:
+                ingredient_hits[ingredient_id] = found
+
+        # 제품 주의사항 직접 매칭
+        supplements = DietarySupplements.objects.exclude(precautions="").order_by()
+        if supplement_ids is not None:
+            supplements = supplements.filter(id__in=list(supplement_ids))
+        for supplement_id, precautions in supplements.values_list(
+            "id", "precautions"
+        ).iterator(chunk_size=self.chunk_size):
+            for field_name, pk in matcher.find(precautions):
+                hits.append(
+                    Contraindication(
+                        supplement_id=supplement_id, **{f"{field_name}_id": pk}
+                    )
+                )
+
+        # 원료 매칭 결과를 해당 원료를 포함한 제품으로 확장
+        if ingredient_hits:
+            relations = DietarySupplementsIngredient.objects.filter(
+                ingredient_id__in=list(ingredient_hits)
+            ).order_by()
+            if supplement_ids is not None:
+                relations = relations.filter(
+                    dietary_supplements_id__in=list(supplement_ids)
+                )
+            for supplement_id, ingredient_id in relations.values_list(
+                "dietary_supplements_id", "ingredient_id"
+            ).iterator(chunk_size=self.chunk_size):
+                for field_name, pk in ingredient_hits[ingredient_id]:
+                    hits.append(
+                        Contraindication(
+                            supplement_id=supplement_id,
+                            ingredient_id=ingredient_id,
+                            **{f"{field_name}_id": pk},
+                        )
+                    )
+
+        return hits
+
+
+# 사용자의 건강 정보와 매칭된 색인 행
+def contraindications_for(user):
+    return Contraindication.objects.filter(
+        Q(chronic_disease__in=user.chronic_diseases.all())
+        | Q(allergy__in=user.allergies.all())
+        | Q(medication__in=user.medications.all())
+    )
+
+
+# 사용자의 건강 정보와 겹치는 주의사항이 없는 제품 (색인을 이용한 anti-join)
+def safe_supplements_for(user, queryset=None):
+    conflicts = contraindications_for(user).filter(supplement=OuterRef("pk"))
+    if queryset is None:
+        queryset = DietarySupplements.objects.all()
+    return queryset.exclude(Exists(conflicts))
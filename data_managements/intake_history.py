@@ -0,0 +1,120 @@
+from datetime import datetime, time, timedelta
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+from .models import DailyIntakeRollup, IntakeLog
+
+# 섭취 기록을 사용자/원료/일 단위로 합산 (원료 함량 x 섭취량)
+ROLLUP_SQL = """
+INSERT INTO "daily_intake_rollup" ("user_id", "ingredient_id", "day", "total_amount")
+SELECT
+    log."user_id",
+    relation."ingredient_id",
+    (log."taken_at" AT TIME ZONE %s)::date,
+    SUM(log."amount" * relation."content")
+FROM "intake_log" AS log
+JOIN "dietary_supplements_ingredient" AS relation
+    ON relation."dietary_supplements_id" = log."supplement_id"
+WHERE log."taken_at" >= %s AND log."taken_at" < %s
+GROUP BY 1, 2, 3
+"""
+
+
+def _month_start(value):
+    return value.replace(day=1)
+
+
+def _next_month(value):
+    return (value.replace(day=1) + timedelta(days=32)).replace(day=1)
+
+
+def _day_start(day):
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def partition_name(month):
+    return f"{IntakeLog._meta.db_table}_y{month.year}m{month.month:02d}"
+
+
+def default_partition_name():
+    return f"{IntakeLog._meta.db_table}_default"
+
+
+# start_day가 속한 달부터 months개월치 월 단위 파티션을 미리 생성
+# 기본 파티션에 이미 해당 달의 기록이 있으면 그대로는 생성할 수 없으므로
+# 기본 파티션을 분리한 뒤 새 파티션을 만들고 그 달의 기록을 옮겨 다시 연결
+def ensure_intake_log_partitions(start_day, months=3):
+    created = []
+    month = _month_start(start_day)
+    for _ in range(months):
+        next_month = _next_month(month)
+        _create_month_partition(month, next_month)
+        created.append(partition_name(month))
+        month = next_month
+    return created
+
+
+def _create_month_partition(month, next_month):
+    quote = connection.ops.quote_name
+    table = quote(IntakeLog._meta.db_table)
+    default = quote(default_partition_name())
+    bounds = [_day_start(month), _day_start(next_month)]
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute("SELECT to_regclass(%s)", [partition_name(month)])
+        if cursor.fetchone()[0] is not None:
+            return
+
+        # 확인과 생성 사이에 기본 파티션으로 그 달의 기록이 들어오지 않도록 쓰기를 막음
+        cursor.execute(f"LOCK TABLE {default} IN SHARE MODE")
+        cursor.execute(
+            f'SELECT EXISTS (SELECT 1 FROM {default} WHERE "taken_at" >= %s '
+            f'AND "taken_at" < %s)',
+            bounds,
+        )
+        has_default_rows = cursor.fetchone()[0]
+        if has_default_rows:
+            cursor.execute(f"ALTER TABLE {table} DETACH PARTITION {default}")
+
+        cursor.execute(
+            f"CREATE TABLE {quote(partition_name(month))} PARTITION OF {table} "
+            f"FOR VALUES FROM (%s) TO (%s)",
+            bounds,
+        )
+
+        if has_default_rows:
+            columns = ", ".join(
+                quote(field.column) for field in IntakeLog._meta.concrete_fields
+            )
+            cursor.execute(
+                f'WITH moved AS (DELETE FROM {default} WHERE "taken_at" >= %s '
+                f'AND "taken_at" < %s RETURNING {columns}) '
+                f"INSERT INTO {table} ({columns}) SELECT {columns} FROM moved",
+                bounds,
+            )
+            cursor.execute(f"ALTER TABLE {table} ATTACH PARTITION {default} DEFAULT")
+
+
+# [start_day, end_day) 구간의 일일 집계를 섭취 기록에서 다시 계산 (재실행해도 동일한 결과)
+def rollup_daily_intake(start_day, end_day):
+    with transaction.atomic():
+        DailyIntakeRollup.objects.filter(day__gte=start_day, day__lt=end_day).delete()
+        with connection.cursor() as cursor:
+            cursor.execute(
+                ROLLUP_SQL,
+                [settings.TIME_ZONE, _day_start(start_day), _day_start(end_day)],
+            )
+            return cursor.rowcount
+
+
+# 차트용 사용자 일일 섭취량 이력 (미리 계산된 집계만 조회)
+def daily_intake_history(user_id, start_day, end_day):
+    return (
+        DailyIntakeRollup.objects.filter(
+            user_id=user_id, day__gte=start_day, day__lt=end_day
+        )
+        .select_related("ingredient")
+        .order_by("day", "ingredient__name")
+    )
@@ -0,0 +1,188 @@
+import uuid
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+
+from django.db import connections, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import (
+    DietarySupplementsIngredient,
+    Ingredient,
+    IntakeAlert,
+    UserSupplementIntake,
+)
+
+
+# 일일섭취량 상한이 있는 원료와 제품별 함량을 미리 메모리에 적재한 조회 테이블
+class IngredientLimitTable:
+
+    def __init__(self, limits, compositions):
+        self.limits = limits  # ingredient_id -> daily_intake_high
+        self.compositions = compositions  # supplement_id -> [(ingredient_id, content)]
+
+    @classmethod
+    def load(cls, chunk_size=5000):
+        limits = dict(
+            Ingredient.objects.filter(daily_intake_high__isnull=False)
+            .order_by()
+            .values_list("id", "daily_intake_high")
+        )
+
+        # 기본 ordering(제품명, 원료명)은 JOIN과 정렬을 유발하므로 제거
+        compositions = defaultdict(list)
+        relations = (
+            DietarySupplementsIngredient.objects.filter(
+                ingredient__daily_intake_high__isnull=False
+            )
+            .order_by()
+            .values_list("dietary_supplements_id", "ingredient_id", "content")
+        )
+        for supplement_id, ingredient_id, content in relations.iterator(
+            chunk_size=chunk_size
+        ):
+            compositions[supplement_id].append((ingredient_id, content))
+
+        return cls(limits, dict(compositions))
+
+    # 한 사용자의 섭취 목록(supplement_id, intake_amount)에서 상한 초과 원료를 계산
+    def find_excess(self, intakes):
+        totals = defaultdict(Decimal)
+        for supplement_id, intake_amount in intakes:
+            for ingredient_id, content in self.compositions.get(supplement_id, ()):
+                totals[ingredient_id] += intake_amount * content
+
+        return [
+            (ingredient_id, total, self.limits[ingredient_id])
+            for ingredient_id, total in totals.items()
+            if total > self.limits[ingredient_id]
+        ]
+
+
+# UUID 공간을 균등 분할하여 워커별 사용자 범위를 생성
+def _user_id_ranges(workers):
+    step = (1 << 128) // workers
+    bounds = [uuid.UUID(int=step * i) for i in range(workers)] + [None]
+    bounds[0] = None
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+# 전체 사용자의 영양제 합산 섭취량을 스트리밍으로 스캔하여 상한 초과 알림을 기록
+class OverIntakeScanner:
+
+    def __init__(self, chunk_size=2000, workers=1, batch_size=1000, scan_date=None):
+        self.chunk_size = chunk_size
+        self.workers = max(1, workers)
+        self.batch_size = batch_size
+        self.scan_date = scan_date or timezone.localdate()
+
+    # 스캔을 실행하고 (스캔한 사용자 수, 기록한 알림 수)를 반환
+    def run(self):
+        table = IngredientLimitTable.load()
+        if not table.compositions:
+            return 0, 0
+
+        if self.workers == 1:
+            results = [self._scan_range(table, None, None)]
+        else:
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                futures = [
+                    executor.submit(self._scan_range_in_thread, table, low, high)
+                    for low, high in _user_id_ranges(self.workers)
+                ]
+                results = [future.result() for future in futures]
+
+        return sum(r[0] for r in results), sum(r[1] for r in results)
+
+    # 워커 스레드는 자신의 DB 커넥션을 사용하므로 종료 시 정리
+    def _scan_range_in_thread(self, table, low, high):
+        try:
+            return self._scan_range(table, low, high)
+        finally:
+            connections.close_all()
+
+    def _scan_range(self, table, low, high):
+        # user_id 순으로 정렬된 섭취 정보를 서버 사이드 커서로 스트리밍
+        queryset = UserSupplementIntake.objects.filter(user__is_active=True)
+        if low is not None:
+            queryset = queryset.filter(user_id__gte=low)
+        if high is not None:
+            queryset = queryset.filter(user_id__lt=high)
+        rows = queryset.order_by("user_id").values_list(
+            "user_id", "supplement_id", "intake_amount"
+        )
+
+        users_scanned = 0
+        alerts_written = 0
+        pending_users = []
+        pending_alerts = []
+        current_user_id = None
+        intakes = []
+
+        for user_id, supplement_id, intake_amount in rows.iterator(
+            chunk_size=self.chunk_size
+        ):
+            if user_id != current_user_id:
+                if current_user_id is not None:
+                    users_scanned += 1
+                    pending_users.append(current_user_id)
+                    self._collect_alerts(
+                        table, current_user_id, intakes, pending_alerts
+                    )
+                    if (
+                        len(pending_alerts) >= self.batch_size
+                        or len(pending_users) >= self.batch_size
+                    ):
+                        alerts_written += self._write_alerts(
+                            pending_users, pending_alerts
+                        )
+                        pending_users = []
+                        pending_alerts = []
+                current_user_id = user_id
+                intakes = []
+            intakes.append((supplement_id, intake_amount))
+
+        if current_user_id is not None:
+            users_scanned += 1
+            pending_users.append(current_user_id)
+            self._collect_alerts(table, current_user_id, intakes, pending_alerts)
+        if pending_users:
+            alerts_written += self._write_alerts(pending_users, pending_alerts)
+
+        return users_scanned, alerts_written
+
+    def _collect_alerts(self, table, user_id, intakes, pending_alerts):
+        for ingredient_id, total, limit in table.find_excess(intakes):
+            pending_alerts.append(
+                IntakeAlert(
+                    user_id=user_id,
+                    ingredient_id=ingredient_id,
+                    total_amount=total,
+                    daily_intake_high=limit,
+                    scan_date=self.scan_date,
+                )
+            )
+
+    # 같은 날 재실행하면 기존 알림의 수치만 갱신하고,
+    # 스캔한 사용자 중 더 이상 상한을 넘지 않는 원료의 알림은 같은 트랜잭션에서 삭제
+    @transaction.atomic
+    def _write_alerts(self, user_ids, alerts):
+        IntakeAlert.objects.bulk_create(
+            alerts,
+            batch_size=self.batch_size,
+            update_conflicts=True,
+            unique_fields=["user", "ingredient", "scan_date"],
+            update_fields=["total_amount", "daily_intake_high", "updated_at"],
+        )
+
+        emitted = defaultdict(list)
+        for alert in alerts:
+            emitted[alert.user_id].append(alert.ingredient_id)
+        keep = Q()
+        for user_id, ingredient_ids in emitted.items():
+            keep |= Q(user_id=user_id, ingredient_id__in=ingredient_ids)
+        IntakeAlert.objects.filter(
+            scan_date=self.scan_date, user_id__in=user_ids
+        ).exclude(keep).delete()
+        return len(alerts)
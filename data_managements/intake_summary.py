@@ -0,0 +1,158 @@
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import F, Sum
+
+from core.cache_versions import bump_versions, current_version
+
+from .models import DietarySupplementsIngredient, UserSupplementIntake
+
+
+def summary_version_key(user_id):
+    return f"intake_summary_version:{user_id}"
+
+
+# 프로세스 단위 캐시 적중률/재생성 지연 시간 통계
+class IntakeSummaryCacheStats:
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+            self.rebuild_seconds_total = 0.0
+            self.rebuild_seconds_max = 0.0
+
+    def record_hit(self):
+        with self._lock:
+            self.hits += 1
+
+    def record_rebuild(self, seconds):
+        with self._lock:
+            self.misses += 1
+            self.rebuild_seconds_total += seconds
+            self.rebuild_seconds_max = max(self.rebuild_seconds_max, seconds)
+
+    def snapshot(self):
+        with self._lock:
+            requests = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / requests if requests else 0.0,
+                "rebuild_avg_ms": (
+                    self.rebuild_seconds_total / self.misses * 1000
+                    if self.misses
+                    else 0.0
+                ),
+                "rebuild_max_ms": self.rebuild_seconds_max * 1000,
+            }
+
+
+stats = IntakeSummaryCacheStats()
+
+
+# 사용자의 원료별 합산 섭취량과 상한/하한 상태를 한 번의 쿼리로 계산
+def build_intake_summary(user_id):
+    rows = (
+        DietarySupplementsIngredient.objects.filter(
+            dietary_supplements__usersupplementintake__user_id=user_id
+        )
+        .values(
+            "ingredient_id",
+            "ingredient__name",
+            "ingredient__unit",
+            "ingredient__daily_intake_low",
+            "ingredient__daily_intake_high",
+        )
+        .annotate(
+            total=Sum(
+                F("content")
+                * F("dietary_supplements__usersupplementintake__intake_amount")
+            )
+        )
+        .order_by("ingredient__name")
+    )
+
+    ingredients = []
+    for row in rows:
+        low = row["ingredient__daily_intake_low"]
+        high = row["ingredient__daily_intake_high"]
+        total = row["total"]
+        if high is not None and total > high:
+            status = "over"
+        elif low is not None and total < low:
+            status = "under"
+        else:
+            status = "ok"
+        ingredients.append(
+            {
+                "ingredient_id": row["ingredient_id"],
+                "name": row["ingredient__name"],
+                "unit": row["ingredient__unit"],
+                "total": total,
+                "daily_intake_low": low,
+                "daily_intake_high": high,
+                "status": status,
+            }
+        )
+
+    return {
+        "ingredients": ingredients,
+        "over_limit_count": sum(1 for item in ingredients if item["status"] == "over"),
+    }
+
+
+# 사용자 버전 아래에 캐시된 요약을 반환하고, 없으면 다시 계산하여 캐시에 저장
+def get_intake_summary(user_id):
+    version = current_version(
+        summary_version_key(user_id), settings.INTAKE_SUMMARY_CACHE_TIMEOUT
+    )
+    key = f"intake_summary:{user_id}:{version}"
+    summary = cache.get(key)
+    if summary is not None:
+        stats.record_hit()
+        return summary
+
+    started = time.perf_counter()
+    summary = build_intake_summary(user_id)
+    stats.record_rebuild(time.perf_counter() - started)
+    cache.set(key, summary, settings.INTAKE_SUMMARY_CACHE_TIMEOUT)
+    return summary
+
+
+# 섭취 정보가 바뀐 사용자의 요약 버전을 갱신 (커밋 이후에 호출)
+def invalidate_intake_summaries(user_ids):
+    bump_versions(
+        [summary_version_key(user_id) for user_id in user_ids],
+        settings.INTAKE_SUMMARY_CACHE_TIMEOUT,
+    )
+
+
+# 원료 구성이 바뀐 제품을 섭취 중인 사용자의 요약을 무효화
+def invalidate_for_supplements(supplement_ids):
+    user_ids = (
+        UserSupplementIntake.objects.filter(supplement_id__in=list(supplement_ids))
+        .values_list("user_id", flat=True)
+        .distinct()
+    )
+    invalidate_intake_summaries(user_ids)
+
+
+# 일일섭취량 기준이 바뀐 원료를 포함한 제품을 섭취 중인 사용자의 요약을 무효화
+def invalidate_for_ingredients(ingredient_ids):
+    user_ids = (
+        UserSupplementIntake.objects.filter(
+            supplement__dietarysupplementsingredient__ingredient_id__in=list(
+                ingredient_ids
+            )
+        )
+        .values_list("user_id", flat=True)
+        .distinct()
+    )
+    invalidate_intake_summaries(user_ids)
@@ -0,0 +1,302 @@
+import json
+import os
+import shutil
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+from django.conf import settings
+from scipy import sparse
+
+from .models import DietarySupplements, Ingredient
+from .recommendations import tokenize
+
+# 색인 디렉터리에서 현재 버전을 가리키는 파일
+MANIFEST_NAME = "manifest.json"
+
+# 구절 출처 (배열에는 순서 번호로 저장)
+SOURCES = (
+    "ingredient_functionality",
+    "ingredient_precautions",
+    "supplement_functionality",
+)
+
+# 버전 디렉터리에 저장하는 배열 (모두 np.load(mmap_mode="r")로 연결)
+ARRAY_NAMES = (
+    "terms",
+    "postings_indptr",
+    "postings_documents",
+    "postings_weights",
+    "sources",
+    "object_ids",
+    "title_offsets",
+    "title_bytes",
+    "text_offsets",
+    "text_bytes",
+)
+
+
+# 검색된 구절
+class Passage(NamedTuple):
+    source: str
+    object_id: uuid.UUID
+    title: str
+    text: str
+    score: float
+
+
+# 문자열 목록을 (offsets, UTF-8 바이트 배열)로 묶음
+def pack_strings(strings):
+    encoded = [string.encode("utf-8") for string in strings]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(value) for value in encoded], dtype=np.int64)
+    return offsets, np.frombuffer(b"".join(encoded), dtype=np.uint8)
+
+
+# 원료 기능성/주의사항, 제품 주요 기능성을 (출처 번호, id, 이름, 본문) 구절로 조회
+def load_passages(chunk_size=2000):
+    querysets = [
+        (
+            SOURCES.index("ingredient_functionality"),
+            Ingredient.objects.exclude(functionality=""),
+            "functionality",
+        ),
+        (
+            SOURCES.index("ingredient_precautions"),
+            Ingredient.objects.exclude(precautions__isnull=True).exclude(
+                precautions=""
+            ),
+            "precautions",
+        ),
+        (
+            SOURCES.index("supplement_functionality"),
+            DietarySupplements.objects.exclude(main_functionality=""),
+            "main_functionality",
+        ),
+    ]
+    for source, queryset, field in querysets:
+        rows = queryset.order_by().values_list("id", "name", field)
+        for pk, name, text in rows.iterator(chunk_size=chunk_size):
+            yield source, pk, name, text
+
+
+# 카탈로그 구절의 BM25 역색인을 NumPy 배열 파일로 생성
+# 용어별 게시 목록(문서 번호, BM25 가중치)을 미리 계산해 두어 검색은 배열 합산만 수행
+class KnowledgeIndexBuilder:
+
+    def __init__(self, directory=None, k1=1.2, b=0.75, keep_versions=2):
+        self.directory = Path(directory or settings.KNOWLEDGE_INDEX_DIR)
+        self.k1 = k1
+        self.b = b
+        self.keep_versions = keep_versions
+
+    # 새 버전을 생성하고 manifest를 교체한 뒤 색인한 구절 수를 반환
+    def run(self):
+        sources, object_ids, titles, texts = [], [], [], []
+        for source, pk, name, text in load_passages():
+            sources.append(source)
+            object_ids.append(pk.bytes)
+            titles.append(name)
+            texts.append(text)
+
+        arrays = self.build_arrays(texts)
+        arrays["sources"] = np.asarray(sources, dtype=np.int8)
+        arrays["object_ids"] = np.asarray(object_ids, dtype="S16")
+        arrays["title_offsets"], arrays["title_bytes"] = pack_strings(titles)
+        arrays["text_offsets"], arrays["text_bytes"] = pack_strings(texts)
+
+        # 이름 순서가 생성 순서가 되도록 나노초 시각을 고정 길이로 사용 (_prune에서 사용)
+        version = f"{time.time_ns():020d}"
+        self._write_version(version, arrays)
+        self._write_manifest(
+            {
+                "version": version,
+                "documents": len(texts),
+                "terms": len(arrays["terms"]),
+                "built_at": time.time(),
+            }
+        )
+        self._prune(version)
+        return len(texts)
+
+    def build_arrays(self, texts):
+        document_terms = [tokenize(text) for text in texts]
+        terms = np.asarray(
+            sorted({term for tokens in document_terms for term in tokens}),
+            dtype=str,
+        )
+        term_index = {term: index for index, term in enumerate(terms.tolist())}
+
+        rows, columns = [], []
+        for row, tokens in enumerate(document_terms):
+            rows.extend([row] * len(tokens))
+            columns.extend(term_index[term] for term in tokens)
+        # 중복된 (문서, 용어) 항목은 합산되어 단어 빈도가 됨
+        frequencies = sparse.csr_matrix(
+            (
+                np.ones(len(rows), dtype=np.float32),
+                (np.asarray(rows, dtype=np.int32), np.asarray(columns, dtype=np.int32)),
+            ),
+            shape=(len(texts), len(terms)),
+        )
+
+        document_count = len(texts)
+        lengths = np.asarray(frequencies.sum(axis=1), dtype=np.float32).ravel()
+        average_length = float(lengths.mean()) if document_count else 0.0
+        document_frequency = np.bincount(frequencies.indices, minlength=len(terms))
+        idf = np.log(
+            1 + (document_count - document_frequency + 0.5) / (document_frequency + 0.5)
+        ).astype(np.float32)
+
+        # 문서 길이로 정규화한 BM25 용어 가중치
+        row_of_entry = np.repeat(np.arange(document_count), np.diff(frequencies.indptr))
+        norms = self.k1 * (1 - self.b + self.b * lengths / max(average_length, 1.0))
+        frequency = frequencies.data
+        frequencies.data = (
+            idf[frequencies.indices]
+            * frequency
+            * (self.k1 + 1)
+            / (frequency + norms[row_of_entry])
+        ).astype(np.float32)
+
+        postings = frequencies.tocsc()
+        postings.sort_indices()
+        return {
+            "terms": terms,
+            "postings_indptr": postings.indptr.astype(np.int64),
+            "postings_documents": postings.indices.astype(np.int32),
+            "postings_weights": postings.data.astype(np.float32),
+        }
+
+    # 임시 디렉터리에 쓴 뒤 rename하여 읽는 쪽이 완성된 버전만 보도록 함
+    def _write_version(self, version, arrays):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        staging = self.directory / f".tmp-{version}"
+        staging.mkdir()
+        for name in ARRAY_NAMES:
+            np.save(staging / f"{name}.npy", arrays[name], allow_pickle=False)
+        staging.rename(self.directory / version)
+
+    def _write_manifest(self, manifest):
+        staging = self.directory / f".{MANIFEST_NAME}.tmp"
+        staging.write_text(json.dumps(manifest))
+        os.replace(staging, self.directory / MANIFEST_NAME)
+
+    # 최근 버전 몇 개만 남김 (이전 버전을 mmap 중인 워커는 다음 조회 때 새 버전으로 교체)
+    def _prune(self, current):
+        versions = sorted(
+            (
+                path
+                for path in self.directory.iterdir()
+                if path.is_dir() and path.name.isdigit()
+            ),
+            key=lambda path: int(path.name),
+        )
+        for path in versions[: -self.keep_versions]:
+            if path.name != current:
+                shutil.rmtree(path, ignore_errors=True)
+
+
+# 메모리 매핑된 BM25 색인 (워커 프로세스들이 같은 파일 페이지를 공유)
+class KnowledgeIndex:
+
+    def __init__(self, version, arrays):
+        self.version = version
+        for name in ARRAY_NAMES:
+            setattr(self, name, arrays[name])
+
+    @classmethod
+    def load(cls, path):
+        path = Path(path)
+        arrays = {
+            name: np.load(path / f"{name}.npy", mmap_mode="r", allow_pickle=False)
+            for name in ARRAY_NAMES
+        }
+        return cls(path.name, arrays)
+
+    def __len__(self):
+        return len(self.sources)
+
+    def _string(self, offsets, blob, index):
+        return bytes(blob[offsets[index] : offsets[index + 1]]).decode("utf-8")
+
+    def _term_ids(self, query):
+        tokens = np.unique(np.asarray(tokenize(query), dtype=str))
+        if not len(tokens) or not len(self.terms):
+            return np.zeros(0, dtype=np.int64)
+        positions = np.searchsorted(self.terms, tokens)
+        positions = positions[positions < len(self.terms)]
+        return positions[np.isin(self.terms[positions], tokens)]
+
+    # 질의와 BM25 점수가 높은 상위 k개 구절 (sources로 출처를 제한할 수 있음)
+    def search(self, query, k=5, sources=None):
+        scores = np.zeros(len(self), dtype=np.float32)
+        for term in self._term_ids(query):
+            begin, end = self.postings_indptr[term], self.postings_indptr[term + 1]
+            # 한 용어의 게시 목록 안에서 문서 번호는 중복되지 않음
+            scores[self.postings_documents[begin:end]] += self.postings_weights[
+                begin:end
+            ]
+
+        if sources is not None:
+            allowed = np.isin(self.sources, [SOURCES.index(name) for name in sources])
+            scores[~allowed] = 0
+
+        candidates = np.flatnonzero(scores > 0)
+        if len(candidates) > k:
+            candidates = candidates[np.argpartition(-scores[candidates], k - 1)[:k]]
+        candidates = candidates[np.argsort(-scores[candidates], kind="stable")]
+        return [
+            Passage(
+                source=SOURCES[self.sources[index]],
+                # 원소 단위로 읽으면 끝의 0 바이트가 잘리므로 원본 16바이트를 그대로 사용
+                object_id=uuid.UUID(bytes=self.object_ids[index : index + 1].tobytes()),
+                title=self._string(self.title_offsets, self.title_bytes, index),
+                text=self._string(self.text_offsets, self.text_bytes, index),
+                score=float(scores[index]),
+            )
+            for index in candidates
+        ]
+
+
+_index = None
+_index_key = None
+_index_lock = threading.Lock()
+
+
+# manifest가 바뀌었으면 새 버전을 연결 (워커 재시작 없이 동기화 결과 반영)
+def get_knowledge_index():
+    global _index, _index_key
+    directory = Path(settings.KNOWLEDGE_INDEX_DIR)
+    try:
+        key = (directory, (directory / MANIFEST_NAME).stat().st_mtime_ns)
+    except FileNotFoundError:
+        return None
+    if key == _index_key:
+        return _index
+
+    with _index_lock:
+        if key != _index_key:
+            manifest = json.loads((directory / MANIFEST_NAME).read_text())
+            if _index is None or _index.version != manifest["version"]:
+                _index = KnowledgeIndex.load(directory / manifest["version"])
+            _index_key = key
+        return _index
+
+
+def reset_knowledge_index():
+    global _index, _index_key
+    with _index_lock:
+        _index = None
+        _index_key = None
+
+
+# 색인이 아직 생성되지 않았으면 빈 목록을 반환
+def search_knowledge(query, k=5, sources=None):
+    index = get_knowledge_index()
+    if index is None:
+        return []
+    return index.search(query, k=k, sources=sources)
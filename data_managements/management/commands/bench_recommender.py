@@ -0,0 +1,88 @@
+import random
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+
+from accounts.models import User
+from data_managements.models import UserSupplementIntake
+from data_managements.recommendations import SupplementRecommender
+
+# 사용자 데이터가 없을 때 사용할 건강 목표 예시
+SAMPLE_GOALS = [
+    "눈 건강",
+    "면역력 증진",
+    "관절 및 뼈 건강",
+    "혈행 개선과 콜레스테롤 관리",
+    "피로 회복",
+    "장 건강",
+]
+
+
+class Command(BaseCommand):
+    help = "전체 카탈로그로 영양제 추천 모델의 생성 시간, 메모리, 질의 지연 시간을 측정합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--queries", type=int, default=500, help="측정할 추천 질의 수"
+        )
+        parser.add_argument("--k", type=int, default=10, help="추천 개수")
+        parser.add_argument("--seed", type=int, default=0, help="난수 시드")
+
+    def handle(self, *args, **options):
+        rng = random.Random(options["seed"])
+
+        recommender = SupplementRecommender.build()
+        self.stdout.write(
+            f"모델 생성: {recommender.build_seconds:.2f}초, "
+            f"제품 {len(recommender.product_ids)}개, "
+            f"어휘 {len(recommender.vectorizer.vocabulary)}개, "
+            f"메모리 {recommender.memory_bytes() / 1024 / 1024:.1f}MB"
+        )
+
+        # 실제 사용자의 건강 목표와 섭취 정보를 질의로 사용 (없으면 예시 목표 사용)
+        users = list(
+            User.objects.filter(is_active=True)
+            .exclude(health_goals="")
+            .values_list("id", "health_goals")[: options["queries"]]
+        )
+        intakes_by_user = {}
+        for (
+            user_id,
+            supplement_id,
+            intake_amount,
+        ) in UserSupplementIntake.objects.filter(
+            user_id__in=[user_id for user_id, _ in users]
+        ).values_list(
+            "user_id", "supplement_id", "intake_amount"
+        ):
+            intakes_by_user.setdefault(user_id, []).append(
+                (supplement_id, intake_amount)
+            )
+
+        latencies = []
+        for i in range(max(1, options["queries"])):
+            if users:
+                user_id, goals = users[i % len(users)]
+                intakes = intakes_by_user.get(user_id, [])
+            else:
+                goals = rng.choice(SAMPLE_GOALS)
+                intakes = [
+                    (supplement_id, 1)
+                    for supplement_id in rng.sample(
+                        recommender.product_ids, min(3, len(recommender.product_ids))
+                    )
+                ]
+
+            started = time.perf_counter()
+            recommender.recommend(goals=goals, intakes=intakes, k=options["k"])
+            latencies.append((time.perf_counter() - started) * 1000)
+
+        latencies.sort()
+        p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"질의 {len(latencies)}회: 평균 {statistics.mean(latencies):.2f}ms, "
+                f"p50 {statistics.median(latencies):.2f}ms, p99 {p99:.2f}ms"
+            )
+        )
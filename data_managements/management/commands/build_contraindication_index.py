@@ -0,0 +1,28 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from data_managements.contraindications import ContraindicationIndexer
+
+
+class Command(BaseCommand):
+    help = "건강 정보(지병/알레르기/복용 약물)와 제품·원료 주의사항의 매칭 색인을 전체 재생성합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="색인 행을 한 번에 bulk 저장할 개수",
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write(self.style.SUCCESS("주의 대상 색인 생성 작업을 시작합니다."))
+
+        started = time.perf_counter()
+        indexed = ContraindicationIndexer(batch_size=options["batch_size"]).rebuild()
+        elapsed = time.perf_counter() - started
+
+        self.stdout.write(
+            self.style.SUCCESS(f"색인 생성 완료. {indexed}건 ({elapsed:.2f}초)")
+        )
@@ -0,0 +1,30 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from data_managements.knowledge import KnowledgeIndexBuilder
+
+
+class Command(BaseCommand):
+    help = "원료 기능성/주의사항과 제품 주요 기능성의 BM25 검색 색인을 생성합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--directory",
+            help="색인을 저장할 디렉터리 (기본값: settings.KNOWLEDGE_INDEX_DIR)",
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write(self.style.SUCCESS("지식 색인 생성 작업을 시작합니다."))
+
+        builder = KnowledgeIndexBuilder(directory=options["directory"])
+        started = time.perf_counter()
+        indexed = builder.run()
+        elapsed = time.perf_counter() - started
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"색인 생성 완료. 구절: {indexed}개 ({elapsed:.2f}초), "
+                f"저장 위치: {builder.directory}"
+            )
+        )
@@ -0,0 +1,44 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from data_managements.neighbors import SupplementNeighborBuilder
+
+
+class Command(BaseCommand):
+    help = "원료 구성이 유사한 제품(코사인 유사도 상위 k개)을 계산하여 저장합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--k", type=int, default=10, help="제품별 유사 제품 수")
+        parser.add_argument(
+            "--block-size",
+            type=int,
+            default=1000,
+            help="한 번에 유사도를 계산할 제품 수",
+        )
+        parser.add_argument(
+            "--min-score",
+            type=float,
+            default=0.0,
+            help="저장할 최소 코사인 유사도",
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write(self.style.SUCCESS("유사 제품 계산 작업을 시작합니다."))
+
+        builder = SupplementNeighborBuilder(
+            k=options["k"],
+            block_size=options["block_size"],
+            min_score=options["min_score"],
+        )
+        started = time.perf_counter()
+        processed = builder.run()
+        elapsed = time.perf_counter() - started
+
+        products_per_sec = processed / elapsed if elapsed > 0 else 0.0
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"계산 완료. 제품: {processed}개, 소요 시간: {elapsed:.2f}초 "
+                f"({products_per_sec:.1f} products/sec)"
+            )
+        )
@@ -0,0 +1,55 @@
+import time
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from data_managements.intake_history import (
+    ensure_intake_log_partitions,
+    rollup_daily_intake,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "섭취 기록 파티션을 미리 생성하고 사용자/원료별 일일 섭취량 집계를 갱신합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--date",
+            type=date.fromisoformat,
+            default=None,
+            help="집계 마지막 날짜 (YYYY-MM-DD, 기본값: 오늘)",
+        )
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=2,
+            help="마지막 날짜부터 거슬러 올라가 다시 집계할 일수 (늦게 들어온 기록 반영)",
+        )
+        parser.add_argument(
+            "--months-ahead",
+            type=int,
+            default=3,
+            help="미리 생성할 월 단위 파티션 수",
+        )
+
+    def handle(self, *args, **options):
+        end_day = (options["date"] or timezone.localdate()) + timedelta(days=1)
+        start_day = end_day - timedelta(days=max(1, options["days"]))
+
+        partitions = ensure_intake_log_partitions(
+            start_day, months=options["months_ahead"]
+        )
+        self.stdout.write(f"파티션 확인 완료: {', '.join(partitions)}")
+
+        started = time.perf_counter()
+        rows = rollup_daily_intake(start_day, end_day)
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{start_day} ~ {end_day - timedelta(days=1)} 집계 완료. "
+                f"{rows}건 ({elapsed:.2f}초)"
+            )
+        )
@@ -0,0 +1,57 @@
+import time
+from datetime import date
+
+from django.core.management.base import BaseCommand
+
+from data_managements.intake_scan import OverIntakeScanner
+
+
+class Command(BaseCommand):
+    help = "전체 사용자의 영양제 합산 섭취량을 스캔하여 일일섭취량 상한 초과 알림을 기록합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=2000,
+            help="서버 사이드 커서에서 한 번에 가져올 섭취 정보 행 수",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="사용자 ID 범위를 나누어 병렬로 스캔할 워커 수",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="알림을 한 번에 bulk 저장할 개수",
+        )
+        parser.add_argument(
+            "--date",
+            type=date.fromisoformat,
+            default=None,
+            help="스캔 기준일 (YYYY-MM-DD, 기본값: 오늘)",
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write(self.style.SUCCESS("섭취 상한 초과 스캔 작업을 시작합니다."))
+
+        scanner = OverIntakeScanner(
+            chunk_size=options["chunk_size"],
+            workers=options["workers"],
+            batch_size=options["batch_size"],
+            scan_date=options["date"],
+        )
+        started = time.perf_counter()
+        users_scanned, alerts_written = scanner.run()
+        elapsed = time.perf_counter() - started
+
+        users_per_sec = users_scanned / elapsed if elapsed > 0 else 0.0
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"스캔 완료. 사용자: {users_scanned}명, 알림: {alerts_written}건, "
+                f"소요 시간: {elapsed:.2f}초 ({users_per_sec:.1f} users/sec)"
+            )
+        )
@@ -0,0 +1,37 @@
+# Generated by Django 5.2 on 2026-10-19 15:19
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('data_managements', '0003_alter_dietarysupplementsingredient_content'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IntakeAlert',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('total_amount', models.DecimalField(decimal_places=2, help_text='영양제 합산 섭취량', max_digits=20)),
+                ('daily_intake_high', models.DecimalField(decimal_places=2, help_text='스캔 시점의 일일섭취량 상한', max_digits=20)),
+                ('scan_date', models.DateField(help_text='스캔 기준일')),
+                ('ingredient', models.ForeignKey(help_text='상한을 초과한 원료 (FK)', on_delete=django.db.models.deletion.CASCADE, related_name='intake_alerts', to='data_managements.ingredient')),
+                ('user', models.ForeignKey(help_text='사용자 (FK)', on_delete=django.db.models.deletion.CASCADE, related_name='intake_alerts', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': '섭취 상한 초과 알림',
+                'verbose_name_plural': '섭취 상한 초과 알림 목록',
+                'db_table': 'intake_alert',
+                'ordering': ['-scan_date'],
+                'unique_together': {('user', 'ingredient', 'scan_date')},
+            },
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2 on 2026-10-19 15:21
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0001_initial'),
+        ('data_managements', '0004_intakealert'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Contraindication',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('allergy', models.ForeignKey(blank=True, help_text='매칭된 알레르기 (FK)', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='contraindications', to='accounts.allergy')),
+                ('chronic_disease', models.ForeignKey(blank=True, help_text='매칭된 지병 (FK)', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='contraindications', to='accounts.chronicdisease')),
+                ('ingredient', models.ForeignKey(blank=True, help_text='원료 주의사항에서 매칭된 경우 해당 원료 (FK)', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='contraindications', to='data_managements.ingredient')),
+                ('medication', models.ForeignKey(blank=True, help_text='매칭된 복용 약물 (FK)', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='contraindications', to='accounts.medication')),
+                ('supplement', models.ForeignKey(help_text='주의가 필요한 제품 (FK)', on_delete=django.db.models.deletion.CASCADE, related_name='contraindications', to='data_managements.dietarysupplements')),
+            ],
+            options={
+                'verbose_name': '건강기능식품 주의 대상',
+                'verbose_name_plural': '건강기능식품 주의 대상 목록',
+                'db_table': 'contraindication',
+                'constraints': [models.CheckConstraint(condition=models.Q(models.Q(('allergy__isnull', True), ('chronic_disease__isnull', False), ('medication__isnull', True)), models.Q(('allergy__isnull', False), ('chronic_disease__isnull', True), ('medication__isnull', True)), models.Q(('allergy__isnull', True), ('chronic_disease__isnull', True), ('medication__isnull', False)), _connector='OR'), name='contraindication_single_health_info'), models.UniqueConstraint(fields=('supplement', 'ingredient', 'chronic_disease', 'allergy', 'medication'), name='contraindication_unique_hit', nulls_distinct=False)],
+            },
+        ),
+    ]
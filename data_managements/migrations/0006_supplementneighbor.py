@@ -0,0 +1,31 @@
+# Generated by Django 5.2 on 2026-10-19 15:27
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('data_managements', '0005_contraindication'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SupplementNeighbor',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('rank', models.PositiveSmallIntegerField(help_text='유사도 순위 (1부터 시작)')),
+                ('score', models.FloatField(help_text='원료 구성 코사인 유사도')),
+                ('neighbor', models.ForeignKey(help_text='유사 제품 (FK)', on_delete=django.db.models.deletion.CASCADE, related_name='+', to='data_managements.dietarysupplements')),
+                ('supplement', models.ForeignKey(help_text='기준 제품 (FK)', on_delete=django.db.models.deletion.CASCADE, related_name='neighbors', to='data_managements.dietarysupplements')),
+            ],
+            options={
+                'verbose_name': '유사 제품',
+                'verbose_name_plural': '유사 제품 목록',
+                'db_table': 'supplement_neighbor',
+                'ordering': ['supplement', 'rank'],
+                'unique_together': {('supplement', 'rank')},
+            },
+        ),
+    ]
@@ -0,0 +1,77 @@
+# Generated by Django 5.2 on 2026-10-19 15:31
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+CREATE_INTAKE_LOG_SQL = """
+CREATE TABLE "intake_log" (
+    "id" bigint NOT NULL GENERATED BY DEFAULT AS IDENTITY,
+    "amount" numeric(10, 2) NOT NULL,
+    "taken_at" timestamp with time zone NOT NULL,
+    "supplement_id" uuid NOT NULL
+        REFERENCES "dietary_supplements" ("id") DEFERRABLE INITIALLY DEFERRED,
+    "user_id" uuid NOT NULL
+        REFERENCES "accounts_user" ("id") DEFERRABLE INITIALLY DEFERRED,
+    PRIMARY KEY ("id", "taken_at")
+) PARTITION BY RANGE ("taken_at");
+CREATE TABLE "intake_log_default" PARTITION OF "intake_log" DEFAULT;
+CREATE INDEX "intake_log_user_taken_idx" ON "intake_log" ("user_id", "taken_at");
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('data_managements', '0006_supplementneighbor'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyIntakeRollup',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('day', models.DateField(help_text='집계일')),
+                ('total_amount', models.DecimalField(decimal_places=2, help_text='일일 합산 섭취량', max_digits=20)),
+                ('ingredient', models.ForeignKey(help_text='원료 (FK)', on_delete=django.db.models.deletion.CASCADE, related_name='daily_intake_rollups', to='data_managements.ingredient')),
+                ('user', models.ForeignKey(help_text='사용자 (FK)', on_delete=django.db.models.deletion.CASCADE, related_name='daily_intake_rollups', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': '일일 섭취량 집계',
+                'verbose_name_plural': '일일 섭취량 집계 목록',
+                'db_table': 'daily_intake_rollup',
+                'ordering': ['day'],
+                'unique_together': {('user', 'day', 'ingredient')},
+            },
+        ),
+        # 섭취 기록은 taken_at 기준 RANGE 파티션 테이블로 직접 생성
+        # (파티션 키가 PK에 포함되어야 하므로 DB의 PK는 (id, taken_at))
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.CreateModel(
+                    name='IntakeLog',
+                    fields=[
+                        ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                        ('amount', models.DecimalField(decimal_places=2, help_text='섭취량', max_digits=10)),
+                        ('taken_at', models.DateTimeField(default=django.utils.timezone.now, help_text='섭취 시각')),
+                        ('supplement', models.ForeignKey(db_index=False, help_text='섭취한 영양제 (FK)', on_delete=django.db.models.deletion.CASCADE, related_name='intake_logs', to='data_managements.dietarysupplements')),
+                        ('user', models.ForeignKey(db_index=False, help_text='사용자 (FK)', on_delete=django.db.models.deletion.CASCADE, related_name='intake_logs', to=settings.AUTH_USER_MODEL)),
+                    ],
+                    options={
+                        'verbose_name': '섭취 기록',
+                        'verbose_name_plural': '섭취 기록 목록',
+                        'db_table': 'intake_log',
+                        'indexes': [models.Index(fields=['user', 'taken_at'], name='intake_log_user_taken_idx')],
+                    },
+                ),
+            ],
+            database_operations=[
+                migrations.RunSQL(
+                    sql=CREATE_INTAKE_LOG_SQL,
+                    reverse_sql='DROP TABLE IF EXISTS "intake_log" CASCADE;',
+                ),
+            ],
+        ),
+    ]
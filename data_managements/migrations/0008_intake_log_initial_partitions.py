@@ -0,0 +1,21 @@
+from django.db import migrations
+from django.utils import timezone
+
+
+# 첫 rollup_intake_logs 실행 전에 들어온 기록이 기본 파티션에 쌓이지 않도록
+# 이번 달과 다음 달 파티션을 미리 생성 (이미 기본 파티션에 있는 기록은 옮김)
+def create_initial_partitions(apps, schema_editor):
+    from data_managements.intake_history import ensure_intake_log_partitions
+
+    ensure_intake_log_partitions(timezone.localdate(), months=2)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('data_managements', '0007_intake_log'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_initial_partitions, migrations.RunPython.noop),
+    ]
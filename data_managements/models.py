@@ -1,7 +1,8 @@
-from accounts.models import User
+from accounts.models import Allergy, ChronicDisease, Medication, User
 from core.models import DataBaseModel
 
 from django.db import models
+from django.utils import timezone
 
 
 # 제조사
@@ -138,3 +139,219 @@ class UserSupplementIntake(DataBaseModel):
 
     def __str__(self):
         return f"{self.user.username} - {self.supplement.name}"
+
+
+# 일일섭취량 상한 초과 알림 (야간 스캔 결과)
+class IntakeAlert(DataBaseModel):
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name="intake_alerts",
+        help_text="사용자 (FK)",
+    )
+    ingredient = models.ForeignKey(
+        Ingredient,
+        on_delete=models.CASCADE,
+        related_name="intake_alerts",
+        help_text="상한을 초과한 원료 (FK)",
+    )
+    total_amount = models.DecimalField(
+        max_digits=20, decimal_places=2, help_text="영양제 합산 섭취량"
+    )
+    daily_intake_high = models.DecimalField(
+        max_digits=20, decimal_places=2, help_text="스캔 시점의 일일섭취량 상한"
+    )
+    scan_date = models.DateField(help_text="스캔 기준일")
+
+    class Meta:
+        db_table = "intake_alert"
+        verbose_name = "섭취 상한 초과 알림"
+        verbose_name_plural = "섭취 상한 초과 알림 목록"
+        unique_together = ("user", "ingredient", "scan_date")
+        ordering = ["-scan_date"]
+
+    def __str__(self):
+        return f"{self.user.email} - {self.ingredient.name} ({self.scan_date})"
+
+
+# 건강 정보(지병/알레르기/복용 약물)와 주의사항이 겹치는 건강기능식품 색인
+class Contraindication(DataBaseModel):
+    supplement = models.ForeignKey(
+        DietarySupplements,
+        on_delete=models.CASCADE,
+        related_name="contraindications",
+        help_text="주의가 필요한 제품 (FK)",
+    )
+    ingredient = models.ForeignKey(
+        Ingredient,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="contraindications",
+        help_text="원료 주의사항에서 매칭된 경우 해당 원료 (FK)",
+    )
+    chronic_disease = models.ForeignKey(
+        ChronicDisease,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="contraindications",
+        help_text="매칭된 지병 (FK)",
+    )
+    allergy = models.ForeignKey(
+        Allergy,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="contraindications",
+        help_text="매칭된 알레르기 (FK)",
+    )
+    medication = models.ForeignKey(
+        Medication,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="contraindications",
+        help_text="매칭된 복용 약물 (FK)",
+    )
+
+    class Meta:
+        db_table = "contraindication"
+        verbose_name = "건강기능식품 주의 대상"
+        verbose_name_plural = "건강기능식품 주의 대상 목록"
+        constraints = [
+            # 지병/알레르기/복용 약물 중 정확히 하나만 지정
+            models.CheckConstraint(
+                condition=(
+                    models.Q(
+                        chronic_disease__isnull=False,
+                        allergy__isnull=True,
+                        medication__isnull=True,
+                    )
+                    | models.Q(
+                        chronic_disease__isnull=True,
+                        allergy__isnull=False,
+                        medication__isnull=True,
+                    )
+                    | models.Q(
+                        chronic_disease__isnull=True,
+                        allergy__isnull=True,
+                        medication__isnull=False,
+                    )
+                ),
+                name="contraindication_single_health_info",
+            ),
+            models.UniqueConstraint(
+                fields=[
+                    "supplement",
+                    "ingredient",
+                    "chronic_disease",
+                    "allergy",
+                    "medication",
+                ],
+                name="contraindication_unique_hit",
+                nulls_distinct=False,
+            ),
+        ]
+
+    def __str__(self):
+        health_info = self.chronic_disease or self.allergy or self.medication
+        return f"{self.supplement.name} - {health_info}"
+
+
+# 원료 구성이 유사한 제품 (오프라인 작업으로 미리 계산)
+class SupplementNeighbor(models.Model):
+    id = models.BigAutoField(primary_key=True)
+    supplement = models.ForeignKey(
+        DietarySupplements,
+        on_delete=models.CASCADE,
+        related_name="neighbors",
+        help_text="기준 제품 (FK)",
+    )
+    neighbor = models.ForeignKey(
+        DietarySupplements,
+        on_delete=models.CASCADE,
+        related_name="+",
+        help_text="유사 제품 (FK)",
+    )
+    rank = models.PositiveSmallIntegerField(help_text="유사도 순위 (1부터 시작)")
+    score = models.FloatField(help_text="원료 구성 코사인 유사도")
+
+    class Meta:
+        db_table = "supplement_neighbor"
+        verbose_name = "유사 제품"
+        verbose_name_plural = "유사 제품 목록"
+        unique_together = ("supplement", "rank")
+        ordering = ["supplement", "rank"]
+
+    def __str__(self):
+        return f"{self.supplement.name} -> {self.neighbor.name} ({self.score:.3f})"
+
+
+# 사용자 섭취 기록 (append-only)
+# DB에서는 taken_at 기준 월 단위 RANGE 파티션 테이블로 생성되며 PK는 (id, taken_at)
+class IntakeLog(models.Model):
+    id = models.BigAutoField(primary_key=True)
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        db_index=False,
+        related_name="intake_logs",
+        help_text="사용자 (FK)",
+    )
+    supplement = models.ForeignKey(
+        DietarySupplements,
+        on_delete=models.CASCADE,
+        db_index=False,
+        related_name="intake_logs",
+        help_text="섭취한 영양제 (FK)",
+    )
+    amount = models.DecimalField(max_digits=10, decimal_places=2, help_text="섭취량")
+    taken_at = models.DateTimeField(default=timezone.now, help_text="섭취 시각")
+
+    class Meta:
+        db_table = "intake_log"
+        verbose_name = "섭취 기록"
+        verbose_name_plural = "섭취 기록 목록"
+        indexes = [
+            models.Index(fields=["user", "taken_at"], name="intake_log_user_taken_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} - {self.supplement_id} ({self.taken_at})"
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding:
+            raise ValueError("섭취 기록은 수정할 수 없습니다.")
+        super().save(*args, **kwargs)
+
+
+# 사용자/원료별 일일 섭취량 집계 (섭취 기록에서 주기적으로 생성)
+class DailyIntakeRollup(models.Model):
+    id = models.BigAutoField(primary_key=True)
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name="daily_intake_rollups",
+        help_text="사용자 (FK)",
+    )
+    ingredient = models.ForeignKey(
+        Ingredient,
+        on_delete=models.CASCADE,
+        related_name="daily_intake_rollups",
+        help_text="원료 (FK)",
+    )
+    day = models.DateField(help_text="집계일")
+    total_amount = models.DecimalField(
+        max_digits=20, decimal_places=2, help_text="일일 합산 섭취량"
+    )
+
+    class Meta:
+        db_table = "daily_intake_rollup"
+        verbose_name = "일일 섭취량 집계"
+        verbose_name_plural = "일일 섭취량 집계 목록"
+        unique_together = ("user", "day", "ingredient")
+        ordering = ["day"]
+
+    def __str__(self):
+        return f"{self.user_id} - {self.ingredient_id} ({self.day})"
@@ -0,0 +1,81 @@
+import numpy as np
+from django.db import transaction
+from scipy import sparse
+
+from .models import DietarySupplements, Ingredient, SupplementNeighbor
+from .recommendations import load_content_matrix, normalize_rows
+
+
+# 원료 함량 벡터의 코사인 유사도로 제품별 상위 k개 유사 제품을 계산하여 저장
+class SupplementNeighborBuilder:
+
+    def __init__(self, k=10, block_size=1000, min_score=0.0):
+        self.k = k
+        self.block_size = block_size
+        self.min_score = min_score
+
+    # 원료마다 단위(mg, µg 등)가 달라 열 최대값으로 스케일을 맞춘 뒤 행 정규화
+    def build_vectors(self):
+        product_ids = list(
+            DietarySupplements.objects.order_by().values_list("id", flat=True)
+        )
+        ingredient_ids = list(
+            Ingredient.objects.order_by().values_list("id", flat=True)
+        )
+        contents = load_content_matrix(product_ids, ingredient_ids)
+        if not contents.nnz:
+            return product_ids, None
+
+        column_max = contents.max(axis=0).toarray().ravel()
+        column_max[column_max == 0] = 1.0
+        vectors = normalize_rows(contents @ sparse.diags(1.0 / column_max))
+        return product_ids, vectors.astype(np.float32).tocsr()
+
+    # 블록 단위로 유사도를 계산하고 저장한 뒤 처리한 제품 수를 반환
+    def run(self):
+        product_ids, vectors = self.build_vectors()
+        if vectors is None:
+            return 0
+        transposed = vectors.T.tocsc()
+
+        for start in range(0, len(product_ids), self.block_size):
+            stop = min(start + self.block_size, len(product_ids))
+            similarities = (vectors[start:stop] @ transposed).tocsr()
+            neighbors = []
+            for offset in range(stop - start):
+                row = start + offset
+                neighbors.extend(
+                    self._top_neighbors(product_ids, row, similarities, offset)
+                )
+            self._save_block(product_ids[start:stop], neighbors)
+
+        return len(product_ids)
+
+    def _top_neighbors(self, product_ids, row, similarities, offset):
+        begin, end = similarities.indptr[offset], similarities.indptr[offset + 1]
+        columns = similarities.indices[begin:end]
+        scores = similarities.data[begin:end]
+
+        # 자기 자신과 최소 유사도 이하 제외
+        mask = (columns != row) & (scores > self.min_score)
+        columns, scores = columns[mask], scores[mask]
+        if len(columns) > self.k:
+            top = np.argpartition(-scores, self.k - 1)[: self.k]
+            columns, scores = columns[top], scores[top]
+        order = np.argsort(-scores, kind="stable")
+
+        return [
+            SupplementNeighbor(
+                supplement_id=product_ids[row],
+                neighbor_id=product_ids[columns[index]],
+                rank=rank,
+                score=float(scores[index]),
+            )
+            for rank, index in enumerate(order, start=1)
+        ]
+
+    # 블록 단위의 짧은 트랜잭션으로 기존 결과를 교체
+    def _save_block(self, supplement_ids, neighbors):
+        with transaction.atomic():
+            SupplementNeighbor.objects.filter(supplement_id__in=supplement_ids).delete()
+            SupplementNeighbor.objects.bulk_create(neighbors, batch_size=5000)
@@ -0,0 +1,306 @@
+import logging
+import math
+import re
+import threading
+import time
+from collections import Counter
+
+import numpy as np
+from django.conf import settings
+from django.db import connection
+from scipy import sparse
+
+from .models import DietarySupplements, DietarySupplementsIngredient, Ingredient
+
+# 섭취 부족 원료를 채워주는 제품에 더하는 가중치
+GAP_WEIGHT = 0.5
+# 이미 상한에 도달한 원료를 포함한 제품에 주는 감점
+OVER_LIMIT_PENALTY = 1.0
+
+_WORD = re.compile(r"[0-9a-z가-힣]+")
+
+
+# 한국어 기능성 문구는 조사/어미가 붙으므로 단어 내부 글자 bigram으로 토큰화
+def tokenize(text):
+    tokens = []
+    for word in _WORD.findall((text or "").lower()):
+        if len(word) == 1:
+            tokens.append(word)
+        else:
+            tokens.extend(word[i : i + 2] for i in range(len(word) - 1))
+    return tokens
+
+
+# 행 단위 L2 정규화 (0인 행은 그대로 유지)
+def normalize_rows(matrix):
+    if matrix.shape[0] == 0:
+        return matrix
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    norms[norms == 0] = 1.0
+    return sparse.diags(1.0 / norms).astype(np.float32) @ matrix
+
+
+# 제품 x 원료 함량 희소 행렬 (행/열 순서는 전달한 id 목록 순서)
+def load_content_matrix(product_ids, ingredient_ids, chunk_size=5000):
+    product_index = {pk: index for index, pk in enumerate(product_ids)}
+    ingredient_index = {pk: index for index, pk in enumerate(ingredient_ids)}
+
+    # 기본 ordering(제품명, 원료명)은 JOIN과 정렬을 유발하므로 제거
+    rows, columns, values = [], [], []
+    relations = (
+        DietarySupplementsIngredient.objects.order_by()
+        .values_list("dietary_supplements_id", "ingredient_id", "content")
+        .iterator(chunk_size=chunk_size)
+    )
+    for supplement_id, ingredient_id, content in relations:
+        # 목록을 읽은 뒤 동기화로 추가된 제품/원료는 다음 생성 때 반영
+        row = product_index.get(supplement_id)
+        column = ingredient_index.get(ingredient_id)
+        if row is None or column is None:
+            continue
+        rows.append(row)
+        columns.append(column)
+        values.append(float(content))
+
+    return sparse.csr_matrix(
+        (
+            np.asarray(values, dtype=np.float32),
+            (np.asarray(rows, dtype=np.int32), np.asarray(columns, dtype=np.int32)),
+        ),
+        shape=(len(product_ids), len(ingredient_ids)),
+    )
+
+
+# 외부 라이브러리 없이 로컬에서 동작하는 TF-IDF 벡터라이저
+class TfidfVectorizer:
+
+    def __init__(self):
+        self.vocabulary = {}
+        self.idf = np.zeros(0, dtype=np.float32)
+
+    def fit(self, documents):
+        document_frequency = Counter()
+        document_count = 0
+        for document in documents:
+            document_frequency.update(set(tokenize(document)))
+            document_count += 1
+
+        self.vocabulary = {
+            token: index for index, token in enumerate(sorted(document_frequency))
+        }
+        self.idf = np.array(
+            [
+                math.log((1 + document_count) / (1 + document_frequency[token])) + 1
+                for token in sorted(document_frequency)
+            ],
+            dtype=np.float32,
+        )
+        return self
+
+    def transform(self, documents):
+        data, indices, indptr = [], [], [0]
+        for document in documents:
+            counts = Counter(
+                self.vocabulary[token]
+                for token in tokenize(document)
+                if token in self.vocabulary
+            )
+            for column, count in counts.items():
+                indices.append(column)
+                data.append(count * self.idf[column])
+            indptr.append(len(indices))
+
+        matrix = sparse.csr_matrix(
+            (
+                np.asarray(data, dtype=np.float32),
+                np.asarray(indices, dtype=np.int32),
+                np.asarray(indptr, dtype=np.int32),
+            ),
+            shape=(len(indptr) - 1, len(self.vocabulary)),
+        )
+        return normalize_rows(matrix)
+
+
+# 제품 x 원료 함량 희소 행렬과 기능성 TF-IDF 벡터로 영양제를 추천
+class SupplementRecommender:
+
+    def __init__(
+        self,
+        vectorizer,
+        product_ids,
+        product_vectors,
+        contents,
+        daily_intake_low,
+        daily_intake_high,
+    ):
+        self.vectorizer = vectorizer
+        self.product_ids = product_ids
+        self.product_index = {pk: index for index, pk in enumerate(product_ids)}
+        self.product_vectors = product_vectors.tocsr()
+        self.contents = contents.tocsr()
+
+        presence = self.contents.copy()
+        presence.data[:] = 1.0
+        self.presence = presence
+        self.presence_normalized = normalize_rows(presence).tocsr()
+
+        self.daily_intake_low = daily_intake_low
+        self.daily_intake_high = daily_intake_high
+        self.built_at = time.monotonic()
+        self.build_seconds = 0.0
+
+    @classmethod
+    def build(cls, chunk_size=5000):
+        started = time.perf_counter()
+
+        ingredients = list(
+            Ingredient.objects.order_by().values_list(
+                "id", "functionality", "daily_intake_low", "daily_intake_high"
+            )
+        )
+        products = list(
+            DietarySupplements.objects.order_by().values_list(
+                "id", "main_functionality"
+            )
+        )
+        product_ids = [row[0] for row in products]
+        contents = load_content_matrix(
+            product_ids, [row[0] for row in ingredients], chunk_size=chunk_size
+        )
+
+        ingredient_texts = [row[1] for row in ingredients]
+        product_texts = [row[1] for row in products]
+        vectorizer = TfidfVectorizer().fit(ingredient_texts + product_texts)
+        ingredient_vectors = vectorizer.transform(ingredient_texts)
+
+        # 제품의 주요 기능성 + 포함 원료들의 기능성을 합쳐 제품 벡터를 구성
+        presence = contents.copy()
+        presence.data[:] = 1.0
+        product_vectors = normalize_rows(
+            vectorizer.transform(product_texts)
+            + normalize_rows(presence) @ ingredient_vectors
+        )
+
+        recommender = cls(
+            vectorizer,
+            product_ids,
+            product_vectors,
+            contents,
+            np.array([float(row[2] or 0) for row in ingredients], dtype=np.float32),
+            np.array([float(row[3] or 0) for row in ingredients], dtype=np.float32),
+        )
+        recommender.build_seconds = time.perf_counter() - started
+        return recommender
+
+    @property
+    def age(self):
+        return time.monotonic() - self.built_at
+
+    # 모델이 차지하는 배열 메모리(byte)
+    def memory_bytes(self):
+        total = self.vectorizer.idf.nbytes
+        total += self.daily_intake_low.nbytes + self.daily_intake_high.nbytes
+        for matrix in (
+            self.product_vectors,
+            self.contents,
+            self.presence,
+            self.presence_normalized,
+        ):
+            total += matrix.data.nbytes + matrix.indices.nbytes + matrix.indptr.nbytes
+        return total
+
+    # 사용자의 현재 섭취량(원료별 합계)을 행렬 곱으로 계산
+    def intake_totals(self, intakes):
+        amounts = np.zeros(len(self.product_ids), dtype=np.float32)
+        for supplement_id, intake_amount in intakes:
+            index = self.product_index.get(supplement_id)
+            if index is not None:
+                amounts[index] += float(intake_amount)
+        return self.contents.T @ amounts
+
+    # 건강 목표와 섭취 부족/초과 원료를 반영하여 상위 k개 (product_id, score)를 반환
+    def recommend(self, goals="", intakes=(), k=10, exclude_ids=()):
+        scores = np.zeros(len(self.product_ids), dtype=np.float32)
+
+        query = self.vectorizer.transform([goals])
+        if query.nnz:
+            scores += (self.product_vectors @ query.T).toarray().ravel()
+
+        intakes = list(intakes)
+        if intakes:
+            totals = self.intake_totals(intakes)
+            low, high = self.daily_intake_low, self.daily_intake_high
+            with np.errstate(divide="ignore", invalid="ignore"):
+                gaps = np.where(low > 0, np.clip((low - totals) / low, 0, 1), 0)
+            over_limit = ((high > 0) & (totals >= high)).astype(np.float32)
+
+            scores += GAP_WEIGHT * (self.presence_normalized @ gaps.astype(np.float32))
+            scores -= OVER_LIMIT_PENALTY * ((self.presence @ over_limit) > 0)
+
+        for supplement_id in exclude_ids:
+            index = self.product_index.get(supplement_id)
+            if index is not None:
+                scores[index] = -np.inf
+
+        candidates = np.flatnonzero(scores > 0)
+        if len(candidates) > k:
+            candidates = candidates[np.argpartition(-scores[candidates], k - 1)[:k]]
+        candidates = candidates[np.argsort(-scores[candidates], kind="stable")]
+        return [(self.product_ids[index], float(scores[index])) for index in candidates]
+
+
+logger = logging.getLogger(__name__)
+
+_recommender = None
+_recommender_lock = threading.Lock()
+_refresh_thread = None
+
+
+# 프로세스 내에 캐시된 추천 모델
+# 처음 한 번만 요청 안에서 생성하고, 오래된 모델은 백그라운드 스레드가 새 모델을 만들어
+# 참조를 바꿀 때까지 그대로 사용 (요청이 재생성을 기다리지 않음)
+def get_recommender():
+    global _recommender
+    recommender = _recommender
+    if recommender is None:
+        with _recommender_lock:
+            if _recommender is None:
+                _recommender = SupplementRecommender.build()
+            return _recommender
+
+    if recommender.age > settings.SUPPLEMENT_RECOMMENDER_MAX_AGE:
+        refresh_recommender_in_background()
+    return recommender
+
+
+# 새 모델을 만드는 스레드를 시작 (이미 만드는 중이면 그 스레드를 반환)
+def refresh_recommender_in_background():
+    global _refresh_thread
+    with _recommender_lock:
+        if _refresh_thread is None or not _refresh_thread.is_alive():
+            _refresh_thread = threading.Thread(
+                target=_refresh_recommender,
+                name="supplement-recommender-refresh",
+                daemon=True,
+            )
+            _refresh_thread.start()
+        return _refresh_thread
+
+
+def _refresh_recommender():
+    global _recommender
+    try:
+        recommender = SupplementRecommender.build()
+        with _recommender_lock:
+            _recommender = recommender
+    except Exception:
+        # 실패하면 이전 모델을 계속 사용하고 다음 요청에서 다시 시도
+        logger.exception("영양제 추천 모델 재생성 실패")
+    finally:
+        connection.close()
+
+
+def reset_recommender():
+    global _recommender
+    with _recommender_lock:
+        _recommender = None
@@ -0,0 +1,72 @@
+from rest_framework import serializers
+
+from .models import DailyIntakeRollup, DietarySupplements, IntakeLog
+
+
+# 건강기능식품 요약 serializer
+class DietarySupplementsSerializer(serializers.ModelSerializer):
+    manufacturer = serializers.CharField(source="manufacturer.name", read_only=True)
+
+    class Meta:
+        model = DietarySupplements
+        fields = [
+            "id",
+            "report_number",
+            "name",
+            "manufacturer",
+            "main_functionality",
+        ]
+        read_only_fields = fields
+
+
+# 추천 결과 serializer
+class SupplementRecommendationSerializer(serializers.Serializer):
+    supplement = DietarySupplementsSerializer()
+    score = serializers.FloatField()
+
+
+# 유사 제품 serializer
+class SupplementNeighborSerializer(serializers.Serializer):
+    supplement = DietarySupplementsSerializer(source="neighbor")
+    score = serializers.FloatField()
+
+
+# 원료별 합산 섭취량 serializer
+class IntakeSummaryItemSerializer(serializers.Serializer):
+    ingredient_id = serializers.UUIDField()
+    name = serializers.CharField()
+    unit = serializers.CharField()
+    total = serializers.DecimalField(max_digits=30, decimal_places=2)
+    daily_intake_low = serializers.DecimalField(
+        max_digits=20, decimal_places=2, allow_null=True
+    )
+    daily_intake_high = serializers.DecimalField(
+        max_digits=20, decimal_places=2, allow_null=True
+    )
+    status = serializers.ChoiceField(choices=["under", "ok", "over"])
+
+
+# 사용자 섭취 요약 serializer
+class IntakeSummarySerializer(serializers.Serializer):
+    ingredients = IntakeSummaryItemSerializer(many=True)
+    over_limit_count = serializers.IntegerField()
+
+
+# 섭취 기록 serializer
+class IntakeLogSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = IntakeLog
+        fields = ["id", "supplement", "amount", "taken_at"]
+        read_only_fields = ("id",)
+        extra_kwargs = {"taken_at": {"required": False}}
+
+
+# 일일 섭취량 집계 serializer
+class DailyIntakeRollupSerializer(serializers.ModelSerializer):
+    ingredient_name = serializers.CharField(source="ingredient.name", read_only=True)
+    unit = serializers.CharField(source="ingredient.unit", read_only=True)
+
+    class Meta:
+        model = DailyIntakeRollup
+        fields = ["day", "ingredient", "ingredient_name", "unit", "total_amount"]
+        read_only_fields = fields
@@ -9,6 +9,9 @@ from django.db import transaction
 import httpx
 import re
 
+from .contraindications import ContraindicationIndexer
+from .intake_summary import invalidate_for_ingredients, invalidate_for_supplements
+from .knowledge import KnowledgeIndexBuilder
 from .models import (
     DietarySupplements,
     DietarySupplementsIngredient,
@@ -28,6 +31,7 @@ class IngredientDataSyncService:
         self.api_key = settings.INGREDIENT_SERVICE_API_KEY
         if not self.api_key:
             raise ValueError("INGREDIENT_SERVICE_API_KEY가 설정되지 않았습니다.")
+        self.synced_ingredient_ids = set()
 
     # 전체 원료 데이터를 가져와 DB에 동기화
     async def sync_ingredients(self):
@@ -54,6 +58,20 @@ class IngredientDataSyncService:
         total_created = sum(r[0] for r in results)
         total_updated = sum(r[1] for r in results)
 
+        # 주의사항이 바뀌었을 수 있는 원료를 포함한 제품의 주의 대상 색인을 갱신
+        if self.synced_ingredient_ids:
+            indexed = await sync_to_async(
+                ContraindicationIndexer().refresh_ingredients
+            )(self.synced_ingredient_ids)
+            print(f"주의 대상 색인 갱신 완료: {indexed}건")
+            # 일일섭취량 기준이 바뀌었을 수 있으므로 관련 사용자의 섭취 요약을 무효화
+            await sync_to_async(invalidate_for_ingredients)(self.synced_ingredient_ids)
+
+            # 기능성/주의사항이 바뀌었을 수 있으므로 지식 색인을 다시 생성
+            # (웹 워커는 manifest 변경을 감지하여 재시작 없이 새 색인을 사용)
+            indexed = await sync_to_async(KnowledgeIndexBuilder().run)()
+            print(f"지식 색인 생성 완료: {indexed}개 구절")
+
         print(f"동기화 완료! 생성: {total_created}개, 업데이트: {total_updated}개")
         return total_created, total_updated
 
@@ -84,7 +102,9 @@ class IngredientDataSyncService:
                 items = data.get(self.SERVICE_ID, {}).get("row", [])
 
                 for item in items:
-                    _, created = await self._update_or_create_ingredient(item)
+                    ingredient, created = await self._update_or_create_ingredient(item)
+                    if ingredient is not None:
+                        self.synced_ingredient_ids.add(ingredient.id)
                     if created:
                         created_count += 1
                     else:
@@ -245,6 +265,8 @@ async def sync_dietary_supplements(max_pages: int = None):
     created_count = 0
     updated_count = 0
     relations_created_count = 0
+    synced_supplement_ids = set()
+    relation_changed_supplement_ids = set()
 
     # SSL 컨텍스트 생성 (SSLV3_ALERT_ILLEGAL_PARAMETER 오류 방지)
     context = ssl.create_default_context()
@@ -316,14 +338,33 @@ async def sync_dietary_supplements(max_pages: int = None):
                 else:
                     updated_count += 1
                 total_processed += 1
+                synced_supplement_ids.add(supplement.id)
 
                 # 원료 관계 설정
                 relations_created = await _process_supplement_ingredients(supplement)
                 relations_created_count += relations_created
+                if relations_created:
+                    relation_changed_supplement_ids.add(supplement.id)
 
             print(f"{page_no} 페이지의 데이터 동기화 완료.")
             page_no += 1
 
+    # 동기화된 제품만 주의 대상 색인을 갱신
+    if synced_supplement_ids:
+        indexed = await sync_to_async(ContraindicationIndexer().rebuild)(
+            supplement_ids=synced_supplement_ids
+        )
+        print(f"주의 대상 색인 갱신 완료: {indexed}건")
+
+    # 원료 구성이 바뀐 제품을 섭취 중인 사용자의 섭취 요약을 무효화
+    if relation_changed_supplement_ids:
+        await sync_to_async(invalidate_for_supplements)(relation_changed_supplement_ids)
+
+    # 제품 주요 기능성이 바뀌었을 수 있으므로 지식 색인을 다시 생성
+    if synced_supplement_ids:
+        indexed = await sync_to_async(KnowledgeIndexBuilder().run)()
+        print(f"지식 색인 생성 완료: {indexed}개 구절")
+
     print(
         f"총 {total_processed}개의 건강기능식품 데이터 처리 완료. "
         f"생성: {created_count}, 업데이트: {updated_count}, 신규 관계 설정: {relations_created_count}."
@@ -0,0 +1,35 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from accounts.models import Allergy, ChronicDisease, Medication
+
+from .contraindications import ContraindicationIndexer
+from .intake_summary import invalidate_intake_summaries
+from .models import UserSupplementIntake
+
+
+# 건강 정보가 추가되거나 이름이 바뀌면 해당 항목만 주의 대상 색인을 갱신
+# (삭제 시에는 FK CASCADE로 색인이 함께 정리됨)
+@receiver(post_save, sender=ChronicDisease)
+@receiver(post_save, sender=Allergy)
+@receiver(post_save, sender=Medication)
+def refresh_contraindications_for_health_info(
+    sender, instance, raw=False, update_fields=None, **kwargs
+):
+    if raw:
+        return
+    if update_fields is not None and "name" not in update_fields:
+        return
+
+    transaction.on_commit(
+        lambda: ContraindicationIndexer().refresh_health_info(instance)
+    )
+
+
+# 섭취 정보가 바뀌면 커밋 이후 해당 사용자의 섭취 요약 캐시를 무효화
+@receiver(post_save, sender=UserSupplementIntake)
+@receiver(post_delete, sender=UserSupplementIntake)
+def invalidate_intake_summary_on_change(sender, instance, **kwargs):
+    user_id = instance.user_id
+    transaction.on_commit(lambda: invalidate_intake_summaries([user_id]))
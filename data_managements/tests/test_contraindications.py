@@ -0,0 +1,141 @@
+from django.test import TestCase
+
+from accounts.models import Allergy, ChronicDisease, Medication, User
+from data_managements.contraindications import (
+    ContraindicationIndexer,
+    KeywordMatcher,
+    safe_supplements_for,
+)
+from data_managements.models import (
+    Contraindication,
+    DietarySupplements,
+    DietarySupplementsIngredient,
+    Ingredient,
+    Manufacturer,
+)
+
+
+class KeywordMatcherTests(TestCase):
+
+    def test_matcher_finds_overlapping_keywords(self):
+        print("\n다중 키워드 매칭 테스트\n")
+        matcher = KeywordMatcher()
+        matcher.add("우유", "milk")
+        matcher.add("우유 단백", "milk-protein")
+        matcher.add("갑각류", "shellfish")
+        matcher.add("땅", "too-short")
+
+        found = matcher.find("우유단백 및 갑각류 알레르기 체질은 섭취에 주의")
+
+        self.assertEqual(found, {"milk", "milk-protein", "shellfish"})
+        self.assertEqual(matcher.find("해당 없음"), set())
+
+
+class ContraindicationIndexTests(TestCase):
+
+    def setUp(self):
+        self.manufacturer = Manufacturer.objects.create(name="테스트 제조사")
+        self.shellfish = Allergy.objects.create(name="갑각류")
+        self.diabetes = ChronicDisease.objects.create(name="당뇨")
+        self.warfarin = Medication.objects.create(name="와파린")
+
+        self.glucosamine = Ingredient.objects.create(
+            name="글루코사민",
+            functionality="관절 건강",
+            precautions="갑각류 알레르기가 있는 경우 섭취에 주의",
+        )
+        self.omega = Ingredient.objects.create(
+            name="오메가3",
+            functionality="혈행 개선",
+            precautions="항응고제(와파린 등) 복용 시 전문가와 상담",
+        )
+
+        self.joint = self.create_supplement("R-1", "관절 영양제", [self.glucosamine])
+        self.blood = self.create_supplement(
+            "R-2", "혈행 영양제", [self.omega], precautions="당뇨 환자는 상담 후 섭취"
+        )
+        self.vitamin = self.create_supplement("R-3", "비타민", [])
+
+        self.user = User.objects.create_user(
+            email="health@example.com", password="password123", nickname="health"
+        )
+
+    def create_supplement(self, report_number, name, ingredients, precautions=""):
+        supplement = DietarySupplements.objects.create(
+            manufacturer=self.manufacturer,
+            report_number=report_number,
+            name=name,
+            precautions=precautions,
+        )
+        DietarySupplementsIngredient.objects.bulk_create(
+            [
+                DietarySupplementsIngredient(
+                    dietary_supplements=supplement, ingredient=ingredient, content=1
+                )
+                for ingredient in ingredients
+            ]
+        )
+        return supplement
+
+    def test_rebuild_indexes_supplement_and_ingredient_precautions(self):
+        print("\n주의 대상 색인 생성 테스트\n")
+        indexed = ContraindicationIndexer().rebuild()
+
+        self.assertEqual(indexed, 3)
+        self.assertTrue(
+            Contraindication.objects.filter(
+                supplement=self.joint,
+                ingredient=self.glucosamine,
+                allergy=self.shellfish,
+            ).exists()
+        )
+        self.assertTrue(
+            Contraindication.objects.filter(
+                supplement=self.blood, ingredient=None, chronic_disease=self.diabetes
+            ).exists()
+        )
+        self.assertTrue(
+            Contraindication.objects.filter(
+                supplement=self.blood, ingredient=self.omega, medication=self.warfarin
+            ).exists()
+        )
+
+    def test_safe_supplements_excludes_contraindicated_products(self):
+        print("\n사용자 맞춤 안전 제품 조회 테스트\n")
+        ContraindicationIndexer().rebuild()
+        self.user.allergies.add(self.shellfish)
+
+        with self.assertNumQueries(1):
+            safe = set(safe_supplements_for(self.user))
+        self.assertEqual(safe, {self.blood, self.vitamin})
+
+        self.user.medications.add(self.warfarin)
+        self.assertEqual(set(safe_supplements_for(self.user)), {self.vitamin})
+
+    def test_rebuild_for_selected_supplements_keeps_other_rows(self):
+        print("\n동기화 제품만 색인 갱신 테스트\n")
+        ContraindicationIndexer().rebuild()
+        DietarySupplements.objects.filter(pk=self.blood.pk).update(precautions="")
+
+        ContraindicationIndexer().rebuild(supplement_ids=[self.blood.pk])
+
+        self.assertFalse(
+            Contraindication.objects.filter(chronic_disease=self.diabetes).exists()
+        )
+        self.assertTrue(Contraindication.objects.filter(supplement=self.joint).exists())
+
+    def test_new_health_info_refreshes_index_on_commit(self):
+        print("\n건강 정보 추가 시 색인 갱신 테스트\n")
+        ContraindicationIndexer().rebuild()
+        self.vitamin.precautions = "임산부는 섭취에 주의"
+        self.vitamin.save()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            pregnancy = ChronicDisease.objects.create(name="임산부")
+
+        self.assertTrue(
+            Contraindication.objects.filter(
+                supplement=self.vitamin, chronic_disease=pregnancy
+            ).exists()
+        )
+        self.assertEqual(Contraindication.objects.count(), 4)
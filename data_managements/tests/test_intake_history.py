@@ -0,0 +1,122 @@
+from datetime import date, datetime, timezone as dt_timezone
+from decimal import Decimal
+
+from django.db import connection
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from data_managements.intake_history import (
+    default_partition_name,
+    ensure_intake_log_partitions,
+    partition_name,
+    rollup_daily_intake,
+)
+from data_managements.models import DailyIntakeRollup, IntakeLog
+from data_managements.tests.test_intake_scan import IntakeFixtureMixin
+
+
+class IntakeHistoryTests(IntakeFixtureMixin, APITestCase):
+
+    def setUp(self):
+        self.create_catalog()
+        self.user = self.create_user("history", [])
+        self.client.force_authenticate(user=self.user)
+
+    def log(self, supplement, amount, taken_at):
+        return IntakeLog.objects.create(
+            user=self.user,
+            supplement=supplement,
+            amount=Decimal(amount),
+            taken_at=taken_at,
+        )
+
+    def test_intake_log_table_is_partitioned(self):
+        print("\n섭취 기록 파티션 생성 테스트\n")
+        created = ensure_intake_log_partitions(date(2025, 8, 15), months=2)
+        self.assertEqual(created, ["intake_log_y2025m08", "intake_log_y2025m09"])
+
+        log = self.log(self.multi, "1", datetime(2025, 8, 20, tzinfo=dt_timezone.utc))
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT tableoid::regclass::text FROM intake_log WHERE id = %s",
+                [log.id],
+            )
+            self.assertEqual(cursor.fetchone()[0], partition_name(date(2025, 8, 1)))
+
+    def test_partition_created_after_default_rows(self):
+        print("\n기본 파티션 기록 이동 후 파티션 생성 테스트\n")
+        log = self.log(self.multi, "1", datetime(2025, 10, 5, tzinfo=dt_timezone.utc))
+        other = self.log(self.multi, "1", datetime(2025, 12, 5, tzinfo=dt_timezone.utc))
+
+        ensure_intake_log_partitions(date(2025, 10, 1), months=1)
+        self.log(self.multi, "2", datetime(2025, 10, 6, tzinfo=dt_timezone.utc))
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT id, tableoid::regclass::text FROM intake_log ORDER BY id"
+            )
+            partitions = dict(cursor.fetchall())
+        self.assertEqual(partitions[log.id], partition_name(date(2025, 10, 1)))
+        self.assertEqual(partitions[other.id], default_partition_name())
+        self.assertEqual(len(partitions), 3)
+        self.assertEqual(
+            set(partitions.values()),
+            {partition_name(date(2025, 10, 1)), default_partition_name()},
+        )
+
+    def test_intake_log_is_append_only(self):
+        print("\n섭취 기록 수정 불가 테스트\n")
+        log = self.log(self.multi, "1", datetime(2025, 8, 1, tzinfo=dt_timezone.utc))
+        log.amount = Decimal("2")
+        with self.assertRaises(ValueError):
+            log.save()
+
+    def test_rollup_sums_daily_ingredient_totals(self):
+        print("\n일일 섭취량 집계 테스트\n")
+        self.log(self.multi, "1", datetime(2025, 8, 1, 8, tzinfo=dt_timezone.utc))
+        self.log(self.high_c, "1", datetime(2025, 8, 1, 20, tzinfo=dt_timezone.utc))
+        self.log(self.multi, "2", datetime(2025, 8, 2, 8, tzinfo=dt_timezone.utc))
+
+        rollup_daily_intake(date(2025, 8, 1), date(2025, 8, 3))
+        # 재실행해도 중복 집계되지 않음
+        rollup_daily_intake(date(2025, 8, 1), date(2025, 8, 3))
+
+        totals = {
+            (row.day, row.ingredient_id): row.total_amount
+            for row in DailyIntakeRollup.objects.filter(user=self.user)
+        }
+        self.assertEqual(totals[(date(2025, 8, 1), self.vitamin_c.id)], Decimal("1200"))
+        self.assertEqual(totals[(date(2025, 8, 2), self.vitamin_c.id)], Decimal("1000"))
+        self.assertEqual(totals[(date(2025, 8, 2), self.zinc.id)], Decimal("20"))
+        self.assertEqual(len(totals), 6)
+
+    def test_log_and_history_endpoints(self):
+        print("\n섭취 기록 추가 및 이력 조회 API 테스트\n")
+        response = self.client.post(
+            reverse("intake_log_create"),
+            {
+                "supplement": str(self.high_c.id),
+                "amount": "1.00",
+                "taken_at": "2025-08-01T09:00:00Z",
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        rollup_daily_intake(date(2025, 8, 1), date(2025, 8, 2))
+
+        response = self.client.get(
+            reverse("intake_history"), {"start": "2025-07-01", "end": "2025-08-31"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 1)
+        self.assertEqual(response.data[0]["ingredient_name"], "비타민C")
+        self.assertEqual(response.data[0]["total_amount"], "700.00")
+
+    def test_history_rejects_invalid_range(self):
+        print("\n섭취 이력 조회 기간 검증 테스트\n")
+        response = self.client.get(
+            reverse("intake_history"), {"start": "2025-08-31", "end": "2025-08-01"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
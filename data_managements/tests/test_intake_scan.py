@@ -0,0 +1,160 @@
+from datetime import date
+from decimal import Decimal
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase, TransactionTestCase
+
+from accounts.models import User
+from data_managements.intake_scan import OverIntakeScanner
+from data_managements.models import (
+    DietarySupplements,
+    DietarySupplementsIngredient,
+    Ingredient,
+    IntakeAlert,
+    Manufacturer,
+    UserSupplementIntake,
+)
+
+
+# 테스트용 원료/제품/섭취 데이터를 생성하는 공통 mixin
+class IntakeFixtureMixin:
+
+    def create_catalog(self):
+        manufacturer = Manufacturer.objects.create(name="테스트 제조사")
+        self.vitamin_c = Ingredient.objects.create(
+            name="비타민C",
+            functionality="항산화",
+            daily_intake_high=Decimal("1000"),
+        )
+        self.zinc = Ingredient.objects.create(
+            name="아연", functionality="면역", daily_intake_high=Decimal("25")
+        )
+        self.omega = Ingredient.objects.create(name="오메가3", functionality="혈행")
+
+        self.multi = DietarySupplements.objects.create(
+            manufacturer=manufacturer, report_number="R-1", name="멀티비타민"
+        )
+        self.high_c = DietarySupplements.objects.create(
+            manufacturer=manufacturer, report_number="R-2", name="고함량 비타민C"
+        )
+        DietarySupplementsIngredient.objects.bulk_create(
+            [
+                DietarySupplementsIngredient(
+                    dietary_supplements=self.multi,
+                    ingredient=self.vitamin_c,
+                    content=Decimal("500"),
+                ),
+                DietarySupplementsIngredient(
+                    dietary_supplements=self.multi,
+                    ingredient=self.zinc,
+                    content=Decimal("10"),
+                ),
+                DietarySupplementsIngredient(
+                    dietary_supplements=self.multi,
+                    ingredient=self.omega,
+                    content=Decimal("900"),
+                ),
+                DietarySupplementsIngredient(
+                    dietary_supplements=self.high_c,
+                    ingredient=self.vitamin_c,
+                    content=Decimal("700"),
+                ),
+            ]
+        )
+
+    def create_user(self, nickname, intakes):
+        user = User.objects.create_user(
+            email=f"{nickname}@example.com", password="password123", nickname=nickname
+        )
+        for supplement, amount in intakes:
+            UserSupplementIntake.objects.create(
+                user=user, supplement=supplement, intake_amount=Decimal(amount)
+            )
+        return user
+
+
+class OverIntakeScanTests(IntakeFixtureMixin, TestCase):
+
+    def setUp(self):
+        self.create_catalog()
+        self.over_user = self.create_user(
+            "overuser", [(self.multi, "1"), (self.high_c, "1")]
+        )
+        self.safe_user = self.create_user("safeuser", [(self.multi, "2")])
+
+    def test_scan_creates_alerts_for_users_over_limit(self):
+        print("\n섭취 상한 초과 알림 생성 테스트\n")
+        users, alerts = OverIntakeScanner(chunk_size=1).run()
+
+        self.assertEqual(users, 2)
+        self.assertEqual(alerts, 1)
+        alert = IntakeAlert.objects.get()
+        self.assertEqual(alert.user, self.over_user)
+        self.assertEqual(alert.ingredient, self.vitamin_c)
+        self.assertEqual(alert.total_amount, Decimal("1200"))
+        self.assertEqual(alert.daily_intake_high, Decimal("1000"))
+
+    def test_rescan_same_date_updates_existing_alert(self):
+        print("\n같은 날짜 재스캔 시 알림 갱신 테스트\n")
+        scan_date = date(2025, 8, 1)
+        OverIntakeScanner(scan_date=scan_date).run()
+        UserSupplementIntake.objects.filter(
+            user=self.over_user, supplement=self.high_c
+        ).update(intake_amount=Decimal("2"))
+        OverIntakeScanner(scan_date=scan_date).run()
+
+        alert = IntakeAlert.objects.get()
+        self.assertEqual(alert.total_amount, Decimal("1900"))
+
+    def test_rescan_same_date_removes_cleared_alert(self):
+        print("\n같은 날짜 재스캔 시 해소된 알림 삭제 테스트\n")
+        scan_date = date(2025, 8, 1)
+        other_day = IntakeAlert.objects.create(
+            user=self.over_user,
+            ingredient=self.vitamin_c,
+            total_amount=Decimal("1200"),
+            daily_intake_high=Decimal("1000"),
+            scan_date=date(2025, 7, 31),
+        )
+        OverIntakeScanner(scan_date=scan_date).run()
+        UserSupplementIntake.objects.filter(
+            user=self.over_user, supplement=self.high_c
+        ).delete()
+        users, alerts = OverIntakeScanner(scan_date=scan_date).run()
+
+        self.assertEqual(users, 2)
+        self.assertEqual(alerts, 0)
+        self.assertQuerySetEqual(IntakeAlert.objects.all(), [other_day])
+
+    def test_inactive_users_are_skipped(self):
+        print("\n비활성 사용자 스캔 제외 테스트\n")
+        User.objects.filter(pk=self.over_user.pk).update(is_active=False)
+        users, alerts = OverIntakeScanner().run()
+
+        self.assertEqual(users, 1)
+        self.assertEqual(alerts, 0)
+
+    def test_command_reports_throughput(self):
+        print("\n스캔 명령어 처리량 출력 테스트\n")
+        out = StringIO()
+        call_command("scan_over_intake", "--chunk-size", "10", stdout=out)
+
+        self.assertIn("users/sec", out.getvalue())
+        self.assertEqual(IntakeAlert.objects.count(), 1)
+
+
+# 워커 스레드는 별도 커넥션을 사용하므로 커밋된 데이터가 필요
+class ParallelOverIntakeScanTests(IntakeFixtureMixin, TransactionTestCase):
+
+    def test_parallel_scan_matches_single_worker(self):
+        print("\n병렬 스캔 결과 일치 테스트\n")
+        self.create_catalog()
+        for i in range(6):
+            self.create_user(f"user{i}", [(self.multi, "1"), (self.high_c, str(i % 2))])
+
+        users, alerts = OverIntakeScanner(workers=3, chunk_size=2).run()
+
+        self.assertEqual(users, 6)
+        self.assertEqual(alerts, 3)
+        self.assertEqual(IntakeAlert.objects.count(), 3)
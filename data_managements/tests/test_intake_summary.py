@@ -0,0 +1,109 @@
+from decimal import Decimal
+from unittest import mock
+
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from data_managements import intake_summary
+from data_managements.intake_summary import (
+    get_intake_summary,
+    invalidate_for_supplements,
+    stats,
+)
+from data_managements.models import DietarySupplementsIngredient, UserSupplementIntake
+from data_managements.tests.test_intake_scan import IntakeFixtureMixin
+
+
+class IntakeSummaryCacheTests(IntakeFixtureMixin, APITestCase):
+
+    def setUp(self):
+        cache.clear()
+        stats.reset()
+        self.create_catalog()
+        self.user = self.create_user("summary", [(self.multi, "1"), (self.high_c, "1")])
+        self.client.force_authenticate(user=self.user)
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_summary_totals_and_limit_flags(self):
+        print("\n원료별 합산 섭취량 요약 테스트\n")
+        summary = get_intake_summary(self.user.pk)
+
+        totals = {item["name"]: item for item in summary["ingredients"]}
+        self.assertEqual(totals["비타민C"]["total"], Decimal("1200"))
+        self.assertEqual(totals["비타민C"]["status"], "over")
+        self.assertEqual(totals["아연"]["status"], "ok")
+        self.assertEqual(summary["over_limit_count"], 1)
+
+    def test_summary_is_cached_until_intake_changes(self):
+        print("\n섭취 요약 캐시 및 시그널 무효화 테스트\n")
+        get_intake_summary(self.user.pk)
+        with self.assertNumQueries(0):
+            get_intake_summary(self.user.pk)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            UserSupplementIntake.objects.get(
+                user=self.user, supplement=self.high_c
+            ).delete()
+
+        summary = get_intake_summary(self.user.pk)
+        self.assertEqual(summary["over_limit_count"], 0)
+        self.assertEqual(stats.snapshot()["hits"], 1)
+        self.assertEqual(stats.snapshot()["misses"], 2)
+
+    # 재계산 중에 섭취 정보가 바뀌면 이전 결과가 새 버전으로 남지 않는지 테스트
+    def test_rebuild_racing_with_invalidation_is_not_served(self):
+        print("\n섭취 요약 재계산 중 무효화 테스트\n")
+        build = intake_summary.build_intake_summary
+
+        def build_then_change(user_id):
+            summary = build(user_id)
+            with self.captureOnCommitCallbacks(execute=True):
+                UserSupplementIntake.objects.get(
+                    user=self.user, supplement=self.high_c
+                ).delete()
+            return summary
+
+        with mock.patch.object(
+            intake_summary, "build_intake_summary", side_effect=build_then_change
+        ):
+            stale = get_intake_summary(self.user.pk)
+        self.assertEqual(stale["over_limit_count"], 1)
+
+        self.assertEqual(get_intake_summary(self.user.pk)["over_limit_count"], 0)
+
+    def test_catalog_change_invalidates_users_taking_product(self):
+        print("\n카탈로그 변경 시 섭취 요약 무효화 테스트\n")
+        get_intake_summary(self.user.pk)
+        DietarySupplementsIngredient.objects.filter(
+            dietary_supplements=self.high_c
+        ).update(content=Decimal("100"))
+
+        invalidate_for_supplements([self.high_c.pk])
+
+        summary = get_intake_summary(self.user.pk)
+        self.assertEqual(summary["over_limit_count"], 0)
+
+    def test_intake_summary_endpoint(self):
+        print("\n섭취 요약 API 테스트\n")
+        response = self.client.get(reverse("intake_summary"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["over_limit_count"], 1)
+        self.assertEqual(response.data["ingredients"][0]["total"], "1200.00")
+
+    def test_stats_endpoint_requires_admin(self):
+        print("\n섭취 요약 캐시 통계 API 권한 테스트\n")
+        response = self.client.get(reverse("intake_summary_stats"))
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+        self.user.is_staff = True
+        self.user.save()
+        self.client.get(reverse("intake_summary"))
+        response = self.client.get(reverse("intake_summary_stats"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["misses"], 1)
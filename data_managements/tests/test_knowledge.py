@@ -0,0 +1,121 @@
+import tempfile
+import uuid
+
+from django.test import TestCase, override_settings
+
+from data_managements.knowledge import (
+    KnowledgeIndexBuilder,
+    get_knowledge_index,
+    reset_knowledge_index,
+    search_knowledge,
+)
+from data_managements.models import DietarySupplements, Ingredient, Manufacturer
+
+
+# 원료/제품 지식 색인 생성 및 검색 테스트
+class KnowledgeIndexTests(TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        settings_override = override_settings(KNOWLEDGE_INDEX_DIR=directory.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        reset_knowledge_index()
+        self.addCleanup(reset_knowledge_index)
+
+        self.vitamin_d = Ingredient.objects.create(
+            name="비타민D",
+            functionality="칼슘과 인이 흡수되고 이용되는데 필요, 뼈의 형성과 유지에 필요",
+            precautions="고칼슘혈증이 있는 경우 섭취에 주의",
+        )
+        self.probiotics = Ingredient.objects.create(
+            name="프로바이오틱스",
+            functionality="유산균 증식 및 유해균 억제, 배변활동 원활에 도움을 줄 수 있음",
+        )
+        self.supplement = DietarySupplements.objects.create(
+            manufacturer=Manufacturer.objects.create(name="테스트 제조사"),
+            report_number="K-1",
+            name="튼튼 뼈 칼슘",
+            main_functionality="뼈 형성과 유지에 필요한 칼슘",
+        )
+
+    # 원료 기능성/주의사항과 제품 기능성을 BM25 점수 순으로 검색하는지 테스트
+    def test_search_returns_ranked_passages(self):
+        print("\n지식 색인 구절 검색 테스트\n")
+        self.assertEqual(KnowledgeIndexBuilder().run(), 4)
+
+        passages = search_knowledge("뼈 형성과 유지", k=2)
+
+        self.assertEqual(len(passages), 2)
+        self.assertEqual(
+            {(passage.source, passage.object_id) for passage in passages},
+            {
+                ("supplement_functionality", self.supplement.id),
+                ("ingredient_functionality", self.vitamin_d.id),
+            },
+        )
+        self.assertGreaterEqual(passages[0].score, passages[1].score)
+        self.assertEqual(passages[0].title, "튼튼 뼈 칼슘")
+        self.assertEqual(passages[0].text, "뼈 형성과 유지에 필요한 칼슘")
+
+        # 출처 제한
+        precautions = search_knowledge("칼슘", sources=["ingredient_precautions"], k=5)
+        self.assertEqual(
+            [passage.text for passage in precautions],
+            ["고칼슘혈증이 있는 경우 섭취에 주의"],
+        )
+        self.assertEqual(search_knowledge("관련없는질의어"), [])
+
+    # 색인을 다시 생성하면 재시작 없이 새 버전을 사용하는지 테스트
+    def test_reloads_new_version(self):
+        print("\n지식 색인 갱신 반영 테스트\n")
+        builder = KnowledgeIndexBuilder(keep_versions=2)
+        builder.run()
+        first = get_knowledge_index()
+        self.assertIs(get_knowledge_index(), first)
+        self.assertEqual(search_knowledge("눈 건강"), [])
+
+        lutein = Ingredient.objects.create(
+            name="루테인", functionality="노화로 인해 감소될 수 있는 눈 건강 유지"
+        )
+        builder.run()
+        builder.run()
+
+        second = get_knowledge_index()
+        self.assertNotEqual(second.version, first.version)
+        self.assertEqual(search_knowledge("눈 건강")[0].object_id, lutein.id)
+        versions = [path for path in builder.directory.iterdir() if path.is_dir()]
+        self.assertEqual(len(versions), 2)
+
+    # 색인이 없으면 빈 결과를 반환하는지 테스트
+    def test_search_without_index(self):
+        print("\n지식 색인 없는 경우 검색 테스트\n")
+        self.assertIsNone(get_knowledge_index())
+        self.assertEqual(search_knowledge("칼슘"), [])
+
+    # 마지막 바이트가 0인 id도 그대로 복원하는지 테스트
+    def test_object_id_with_trailing_zero_bytes(self):
+        print("\n지식 색인 0 바이트로 끝나는 id 복원 테스트\n")
+        zinc = Ingredient.objects.create(
+            id=uuid.UUID("12345678-1234-4234-8234-123456780000"),
+            name="아연",
+            functionality="정상적인 면역기능에 필요",
+        )
+        KnowledgeIndexBuilder().run()
+
+        self.assertEqual(search_knowledge("면역기능")[0].object_id, zinc.id)
+
+    # 가장 최근 버전 keep_versions개만 남기는지 테스트
+    def test_prune_keeps_latest_versions(self):
+        print("\n지식 색인 이전 버전 정리 테스트\n")
+        builder = KnowledgeIndexBuilder(keep_versions=2)
+        built = []
+        for _ in range(3):
+            builder.run()
+            built.append(get_knowledge_index().version)
+
+        versions = sorted(
+            path.name for path in builder.directory.iterdir() if path.is_dir()
+        )
+        self.assertEqual(versions, built[1:])
@@ -0,0 +1,115 @@
+from decimal import Decimal
+
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from accounts.models import User
+from data_managements.models import (
+    DietarySupplements,
+    DietarySupplementsIngredient,
+    Ingredient,
+    Manufacturer,
+    SupplementNeighbor,
+)
+from data_managements.neighbors import SupplementNeighborBuilder
+
+
+# 유사 제품 테스트용 카탈로그를 생성하는 공통 mixin
+class NeighborFixtureMixin:
+
+    def create_catalog(self):
+        manufacturer = Manufacturer.objects.create(name="테스트 제조사")
+        vitamin_d = Ingredient.objects.create(name="비타민D", functionality="뼈 건강")
+        calcium = Ingredient.objects.create(name="칼슘", functionality="뼈 건강")
+        probiotics = Ingredient.objects.create(
+            name="프로바이오틱스", functionality="장 건강"
+        )
+
+        def create(report_number, contents):
+            supplement = DietarySupplements.objects.create(
+                manufacturer=manufacturer,
+                report_number=report_number,
+                name=f"제품 {report_number}",
+            )
+            DietarySupplementsIngredient.objects.bulk_create(
+                [
+                    DietarySupplementsIngredient(
+                        dietary_supplements=supplement,
+                        ingredient=ingredient,
+                        content=Decimal(content),
+                    )
+                    for ingredient, content in contents
+                ]
+            )
+            return supplement
+
+        self.bone = create("R-1", [(vitamin_d, "10"), (calcium, "300")])
+        self.bone_alt = create("R-2", [(vitamin_d, "10"), (calcium, "250")])
+        self.bone_lite = create("R-3", [(calcium, "100")])
+        self.gut = create("R-4", [(probiotics, "100")])
+
+
+class SupplementNeighborBuilderTests(NeighborFixtureMixin, TestCase):
+
+    def setUp(self):
+        self.create_catalog()
+
+    def test_builds_ranked_neighbors_by_composition(self):
+        print("\n원료 구성 유사 제품 계산 테스트\n")
+        processed = SupplementNeighborBuilder(k=2, block_size=2).run()
+
+        self.assertEqual(processed, 4)
+        neighbors = list(
+            SupplementNeighbor.objects.filter(supplement=self.bone).order_by("rank")
+        )
+        self.assertEqual(
+            [n.neighbor for n in neighbors], [self.bone_alt, self.bone_lite]
+        )
+        self.assertGreater(neighbors[0].score, neighbors[1].score)
+        # 공통 원료가 없는 제품은 유사 제품이 없음
+        self.assertFalse(
+            SupplementNeighbor.objects.filter(supplement=self.gut).exists()
+        )
+
+    def test_rebuild_replaces_previous_results(self):
+        print("\n유사 제품 재계산 테스트\n")
+        SupplementNeighborBuilder(k=3).run()
+        SupplementNeighborBuilder(k=1).run()
+
+        self.assertEqual(
+            SupplementNeighbor.objects.filter(supplement=self.bone).count(), 1
+        )
+
+
+class SimilarSupplementsAPITests(NeighborFixtureMixin, APITestCase):
+
+    def setUp(self):
+        self.create_catalog()
+        SupplementNeighborBuilder(k=2).run()
+        user = User.objects.create_user(
+            email="similar@example.com", password="password123", nickname="similar"
+        )
+        self.client.force_authenticate(user=user)
+
+    def test_similar_supplements_endpoint(self):
+        print("\n유사 제품 조회 API 테스트\n")
+        url = reverse("supplement_similar", kwargs={"pk": self.bone.pk})
+        with self.assertNumQueries(1):
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data[0]["supplement"]["id"], str(self.bone_alt.id))
+        self.assertEqual(
+            response.data[0]["supplement"]["manufacturer"], "테스트 제조사"
+        )
+
+    def test_similar_supplements_not_found(self):
+        print("\n존재하지 않는 제품 유사 제품 조회 테스트\n")
+        url = reverse(
+            "supplement_similar", kwargs={"pk": "00000000-0000-0000-0000-000000000000"}
+        )
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
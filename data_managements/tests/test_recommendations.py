@@ -0,0 +1,175 @@
+import threading
+from decimal import Decimal
+from unittest import mock
+
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from accounts.models import Allergy, User
+from data_managements.contraindications import ContraindicationIndexer
+from data_managements.models import (
+    DietarySupplements,
+    DietarySupplementsIngredient,
+    Ingredient,
+    Manufacturer,
+    UserSupplementIntake,
+)
+from data_managements.recommendations import (
+    SupplementRecommender,
+    get_recommender,
+    refresh_recommender_in_background,
+    reset_recommender,
+    tokenize,
+)
+
+
+# 추천 테스트용 카탈로그를 생성하는 공통 mixin
+class RecommendationFixtureMixin:
+
+    def create_catalog(self):
+        manufacturer = Manufacturer.objects.create(name="테스트 제조사")
+        self.lutein = Ingredient.objects.create(
+            name="루테인",
+            functionality="노화로 인해 감소될 수 있는 황반색소밀도를 유지하여 눈 건강에 도움",
+        )
+        self.calcium = Ingredient.objects.create(
+            name="칼슘",
+            functionality="뼈와 치아 형성에 필요",
+            daily_intake_low=Decimal("210"),
+            daily_intake_high=Decimal("800"),
+        )
+        self.zinc = Ingredient.objects.create(
+            name="아연",
+            functionality="정상적인 면역기능에 필요",
+            daily_intake_low=Decimal("2.55"),
+            daily_intake_high=Decimal("12"),
+        )
+
+        def create(report_number, name, main_functionality, contents):
+            supplement = DietarySupplements.objects.create(
+                manufacturer=manufacturer,
+                report_number=report_number,
+                name=name,
+                main_functionality=main_functionality,
+                precautions="",
+            )
+            DietarySupplementsIngredient.objects.bulk_create(
+                [
+                    DietarySupplementsIngredient(
+                        dietary_supplements=supplement,
+                        ingredient=ingredient,
+                        content=Decimal(content),
+                    )
+                    for ingredient, content in contents
+                ]
+            )
+            return supplement
+
+        self.eye = create(
+            "R-1", "루테인 플러스", "눈 건강에 도움을 줄 수 있음", [(self.lutein, "20")]
+        )
+        self.bone = create("R-2", "칼슘 본", "뼈 건강에 도움", [(self.calcium, "300")])
+        self.immune = create(
+            "R-3", "아연 이뮨", "면역 기능에 도움", [(self.zinc, "8.5")]
+        )
+
+
+class SupplementRecommenderTests(RecommendationFixtureMixin, TestCase):
+
+    def setUp(self):
+        self.create_catalog()
+        self.recommender = SupplementRecommender.build()
+
+    def test_tokenize_uses_character_bigrams(self):
+        print("\n한국어 bigram 토큰화 테스트\n")
+        self.assertEqual(tokenize("눈 건강에"), ["눈", "건강", "강에"])
+
+    def test_goals_rank_matching_products_first(self):
+        print("\n건강 목표 기반 추천 순위 테스트\n")
+        results = self.recommender.recommend(goals="눈 건강", k=2)
+
+        self.assertEqual(results[0][0], self.eye.id)
+        self.assertLessEqual(len(results), 2)
+
+    def test_intake_gap_and_over_limit_adjust_scores(self):
+        print("\n섭취 부족/초과 반영 추천 테스트\n")
+        # 아연은 상한 초과, 칼슘은 섭취하지 않아 부족
+        intakes = [(self.immune.id, Decimal("2"))]
+        results = dict(self.recommender.recommend(intakes=intakes, k=3))
+
+        self.assertIn(self.bone.id, results)
+        self.assertNotIn(self.immune.id, results)
+
+    def test_excluded_products_are_not_recommended(self):
+        print("\n제외 제품 추천 제외 테스트\n")
+        results = self.recommender.recommend(
+            goals="눈 건강", k=3, exclude_ids={self.eye.id}
+        )
+
+        self.assertNotIn(self.eye.id, [supplement_id for supplement_id, _ in results])
+
+    def test_memory_bytes_reports_model_size(self):
+        print("\n추천 모델 메모리 측정 테스트\n")
+        self.assertGreater(self.recommender.memory_bytes(), 0)
+
+    # 오래된 모델은 백그라운드에서 새 모델을 만드는 동안 그대로 반환하는지 테스트
+    def test_stale_model_served_while_rebuilding(self):
+        print("\n추천 모델 백그라운드 재생성 테스트\n")
+        reset_recommender()
+        self.addCleanup(reset_recommender)
+        old = get_recommender()
+        started, finish = threading.Event(), threading.Event()
+
+        def slow_build():
+            started.set()
+            finish.wait(5)
+            return self.recommender
+
+        with override_settings(SUPPLEMENT_RECOMMENDER_MAX_AGE=-1), mock.patch.object(
+            SupplementRecommender, "build", side_effect=slow_build
+        ):
+            self.assertIs(get_recommender(), old)
+            self.assertTrue(started.wait(5))
+            self.assertIs(get_recommender(), old)
+            thread = refresh_recommender_in_background()
+            finish.set()
+            thread.join(5)
+
+        self.assertIs(get_recommender(), self.recommender)
+
+
+class SupplementRecommendationAPITests(RecommendationFixtureMixin, APITestCase):
+
+    def setUp(self):
+        self.create_catalog()
+        reset_recommender()
+        self.user = User.objects.create_user(
+            email="reco@example.com",
+            password="password123",
+            nickname="reco",
+            health_goals="뼈 건강과 면역",
+        )
+        self.client.force_authenticate(user=self.user)
+
+    def tearDown(self):
+        reset_recommender()
+
+    def test_recommendations_exclude_taken_and_contraindicated(self):
+        print("\n영양제 추천 API 테스트\n")
+        UserSupplementIntake.objects.create(
+            user=self.user, supplement=self.immune, intake_amount=Decimal("1")
+        )
+        DietarySupplements.objects.filter(pk=self.bone.pk).update(
+            precautions="우유 알레르기 체질은 주의"
+        )
+        self.user.allergies.add(Allergy.objects.create(name="우유"))
+        ContraindicationIndexer().rebuild()
+
+        response = self.client.get(reverse("supplement_recommendations"), {"k": 5})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        ids = [item["supplement"]["id"] for item in response.data]
+        self.assertNotIn(str(self.immune.id), ids)
+        self.assertNotIn(str(self.bone.id), ids)
@@ -0,0 +1,31 @@
+from django.urls import path
+
+from .views import (
+    IntakeHistoryView,
+    IntakeLogCreateView,
+    IntakeSummaryStatsView,
+    IntakeSummaryView,
+    SimilarSupplementsView,
+    SupplementRecommendationView,
+)
+
+urlpatterns = [
+    path(
+        "recommendations/",
+        SupplementRecommendationView.as_view(),
+        name="supplement_recommendations",
+    ),
+    path(
+        "<uuid:pk>/similar/",
+        SimilarSupplementsView.as_view(),
+        name="supplement_similar",
+    ),
+    path("intake-summary/", IntakeSummaryView.as_view(), name="intake_summary"),
+    path(
+        "intake-summary/stats/",
+        IntakeSummaryStatsView.as_view(),
+        name="intake_summary_stats",
+    ),
+    path("intake-logs/", IntakeLogCreateView.as_view(), name="intake_log_create"),
+    path("intake-history/", IntakeHistoryView.as_view(), name="intake_history"),
+]
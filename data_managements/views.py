@@ -1,3 +1,133 @@
-from django.shortcuts import render
+from datetime import date, timedelta
 
-# Create your views here.
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from rest_framework import generics, permissions, serializers
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from .contraindications import contraindications_for
+from .intake_history import daily_intake_history
+from .intake_summary import get_intake_summary, stats as intake_summary_stats
+from .models import DietarySupplements, SupplementNeighbor, UserSupplementIntake
+from .recommendations import get_recommender
+from .serializers import (
+    DailyIntakeRollupSerializer,
+    IntakeLogSerializer,
+    IntakeSummarySerializer,
+    SupplementNeighborSerializer,
+    SupplementRecommendationSerializer,
+)
+
+
+# 사용자 건강 목표와 섭취 현황 기반 영양제 추천
+class SupplementRecommendationView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+    default_k = 10
+    max_k = 50
+
+    def get(self, request, *args, **kwargs):
+        try:
+            k = int(request.query_params.get("k", self.default_k))
+        except ValueError:
+            k = self.default_k
+        k = min(max(k, 1), self.max_k)
+
+        user = request.user
+        intakes = list(
+            UserSupplementIntake.objects.filter(user=user).values_list(
+                "supplement_id", "intake_amount"
+            )
+        )
+        # 이미 섭취 중이거나 사용자 건강 정보와 겹치는 주의사항이 있는 제품은 제외
+        exclude_ids = {supplement_id for supplement_id, _ in intakes}
+        exclude_ids.update(
+            contraindications_for(user).values_list("supplement_id", flat=True)
+        )
+
+        results = get_recommender().recommend(
+            goals=user.health_goals, intakes=intakes, k=k, exclude_ids=exclude_ids
+        )
+        supplements = DietarySupplements.objects.select_related("manufacturer").in_bulk(
+            [supplement_id for supplement_id, _ in results]
+        )
+
+        serializer = SupplementRecommendationSerializer(
+            [
+                {"supplement": supplements[supplement_id], "score": score}
+                for supplement_id, score in results
+                if supplement_id in supplements
+            ],
+            many=True,
+        )
+        return Response(serializer.data)
+
+
+# 원료 구성이 유사한 제품 조회 (미리 계산된 결과)
+class SimilarSupplementsView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request, pk, *args, **kwargs):
+        neighbors = list(
+            SupplementNeighbor.objects.filter(supplement_id=pk)
+            .select_related("neighbor__manufacturer")
+            .order_by("rank")
+        )
+        # 결과가 없을 때만 제품 존재 여부를 확인
+        if not neighbors:
+            get_object_or_404(DietarySupplements, pk=pk)
+
+        serializer = SupplementNeighborSerializer(neighbors, many=True)
+        return Response(serializer.data)
+
+
+# 사용자별 원료 합산 섭취량 요약 (캐시)
+class IntakeSummaryView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request, *args, **kwargs):
+        summary = get_intake_summary(request.user.pk)
+        return Response(IntakeSummarySerializer(summary).data)
+
+
+# 섭취 요약 캐시 적중률 및 재생성 지연 시간 (현재 프로세스 기준)
+class IntakeSummaryStatsView(APIView):
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request, *args, **kwargs):
+        return Response(intake_summary_stats.snapshot())
+
+
+# 섭취 기록 추가 (append-only)
+class IntakeLogCreateView(generics.CreateAPIView):
+    serializer_class = IntakeLogSerializer
+    permission_classes = [permissions.IsAuthenticated]
+
+    def perform_create(self, serializer):
+        serializer.save(user=self.request.user)
+
+
+# 일일 섭취량 이력 조회 (기본 최근 30일)
+class IntakeHistoryView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+    default_days = 30
+    max_days = 366
+
+    def get(self, request, *args, **kwargs):
+        try:
+            end = date.fromisoformat(
+                request.query_params.get("end") or timezone.localdate().isoformat()
+            )
+            start = date.fromisoformat(
+                request.query_params.get("start")
+                or (end - timedelta(days=self.default_days - 1)).isoformat()
+            )
+        except ValueError:
+            raise serializers.ValidationError("날짜는 YYYY-MM-DD 형식이어야 합니다.")
+        if start > end or (end - start).days >= self.max_days:
+            raise serializers.ValidationError(
+                f"조회 기간은 최대 {self.max_days}일입니다."
+            )
+
+        rollups = daily_intake_history(request.user.pk, start, end + timedelta(days=1))
+        return Response(DailyIntakeRollupSerializer(rollups, many=True).data)